@@ -18,6 +18,14 @@ TABLE OF CONTENTS:
 5. Working With Directories
    - os.path Module
 6. Note: JSON Is Covered In Chapter 22
+7. Large Files: Line-Offset Index
+   - Sidecar Index Of Line Offsets (array)
+   - GetLine(N) And Line Slices
+   - Incremental Update After Appending
+8. Buffered Batched Writer
+   - Flush By Size Or Time
+   - One fsync Per Batch (Group Commit)
+   - Thread Safety With Locks
 """
 
 # ========================================
@@ -254,4 +262,374 @@ sys.stdout.write("Hello Everyone My Name Is Anubhav Chaurasia")
 print("")
 sys.stderr.write('This Is An Error\n')
 # Instead Of Print Statement : print('This Is An Error', end="" , file=sys.stderr)
-# Used To Print Error Before Anything
\ No newline at end of file
+# Used To Print Error Before Anything
+
+# ========================================
+# LARGE FILES: LINE-OFFSET INDEX
+# ========================================
+
+'''
+seek() Jumps To A Byte Offset, But To Reach Line N We Would Still Have To Read
+Every Line Before It. The Fix Is To Scan The File Once, Remember Where Each
+Line Starts, And Save Those Offsets In A Small Sidecar File (<File>.idx).
+
+Sidecar Layout:
+    Header  -> b"LIDX" + IndexedSize (Q) + CRC32 Of The Last 4 KB Indexed (I)
+    Body    -> array('Q') Of Line Start Offsets (8 Bytes Per Line)
+
+After That, GetLine(N) Is One seek() + One read(), No Matter How Big The File Is.
+'''
+
+import os
+import zlib
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+IndexHeader = struct.Struct("<4sQI")  # Magic, IndexedSize, TailCRC
+ScanBlockSize = 1024 * 1024           # Read 1 MB At A Time While Scanning
+TailCheckSize = 4096                  # Bytes Used To Detect A Rewritten File
+
+
+def ScanNewlineOffsets(FilePath, Start, End):
+    """Return array('Q') Of Offsets Just After Every b'\\n' In [Start, End)"""
+    Offsets = array("Q")
+    with open(FilePath, "rb") as File:
+        File.seek(Start)
+        Position = Start
+        while Position < End:
+            Block = File.read(min(ScanBlockSize, End - Position))
+            if not Block:
+                break
+            Found = Block.find(b"\n")
+            while Found != -1:
+                Offsets.append(Position + Found + 1)
+                Found = Block.find(b"\n", Found + 1)
+            Position += len(Block)
+    return Offsets
+
+
+class LineIndex:
+    """Random Access To Any Line Of A Text File Through A Sidecar Offset Index"""
+
+    def __init__(self, FilePath, Encoding="utf-8", Workers=1):
+        self.FilePath = FilePath
+        self.IndexPath = FilePath + ".idx"
+        self.Encoding = Encoding
+        self.Workers = Workers
+        self.Offsets = array("Q", [0])  # Offsets[i] = Byte Where Line i Starts
+        self.IndexedSize = 0
+        self.TailCRC = 0
+        self.File = None
+        if not self.Load():
+            self.Build()
+        self.Refresh()
+
+    # ---------- Building And Saving ----------
+
+    def TailChecksum(self, Size):
+        """CRC32 Of The Last TailCheckSize Bytes Before Size"""
+        Start = max(0, Size - TailCheckSize)
+        with open(self.FilePath, "rb") as File:
+            File.seek(Start)
+            return zlib.crc32(File.read(Size - Start))
+
+    def Build(self):
+        """Scan The Whole File, Splitting It Into Chunks When Workers > 1"""
+        Size = os.path.getsize(self.FilePath)
+        Offsets = array("Q", [0])
+        if self.Workers > 1 and Size > ScanBlockSize:
+            ChunkSize = -(-Size // self.Workers)  # Ceiling Division
+            Bounds = [(Start, min(Start + ChunkSize, Size)) for Start in range(0, Size, ChunkSize)]
+            # Processes Re-Import The Script On Windows, So Call This Under
+            # if __name__ == "__main__" When Workers > 1 (See Chapter 21)
+            with ProcessPoolExecutor(max_workers=self.Workers) as Pool:
+                Parts = Pool.map(ScanNewlineOffsets,
+                                 [self.FilePath] * len(Bounds),
+                                 [B[0] for B in Bounds],
+                                 [B[1] for B in Bounds])
+                for Part in Parts:  # map() Keeps Chunk Order
+                    Offsets.extend(Part)
+        else:
+            Offsets.extend(ScanNewlineOffsets(self.FilePath, 0, Size))
+        self.Offsets = Offsets
+        self.IndexedSize = Size
+        self.Save()
+
+    def Save(self):
+        """Write Header + Packed Offsets To The Sidecar File"""
+        self.TailCRC = self.TailChecksum(self.IndexedSize)
+        with open(self.IndexPath, "wb") as File:
+            File.write(IndexHeader.pack(b"LIDX", self.IndexedSize, self.TailCRC))
+            self.Offsets.tofile(File)
+
+    def Load(self):
+        """Load An Existing Sidecar, Return False If It Is Missing Or Stale"""
+        if not os.path.exists(self.IndexPath):
+            return False
+        with open(self.IndexPath, "rb") as File:
+            Header = File.read(IndexHeader.size)
+            if len(Header) != IndexHeader.size:
+                return False
+            Magic, IndexedSize, TailCRC = IndexHeader.unpack(Header)
+            if Magic != b"LIDX" or os.path.getsize(self.FilePath) < IndexedSize:
+                return False  # Not Our Format, Or The File Was Truncated
+            if self.TailChecksum(IndexedSize) != TailCRC:
+                return False  # Same Or Bigger Size, But The Old Content Changed
+            Packed = File.read()
+            if len(Packed) % array("Q").itemsize:
+                return False  # Partly Written Sidecar: Not A Whole Number Of Offsets
+            Offsets = array("Q")
+            Offsets.frombytes(Packed)
+        self.Offsets = Offsets
+        self.IndexedSize = IndexedSize
+        self.TailCRC = TailCRC
+        return True
+
+    def Refresh(self):
+        """Index Only The Bytes Appended Since The Last Scan ("a" Mode Writes)"""
+        Size = os.path.getsize(self.FilePath)
+        if Size == self.IndexedSize:
+            return 0
+        if Size < self.IndexedSize or self.TailChecksum(self.IndexedSize) != self.TailCRC:
+            self.Build()  # File Was Rewritten, Start Over
+            return len(self)
+        Before = len(self)
+        self.Offsets.extend(ScanNewlineOffsets(self.FilePath, self.IndexedSize, Size))
+        self.IndexedSize = Size
+        self.Save()
+        return len(self) - Before
+
+    # ---------- Reading Lines ----------
+
+    def __len__(self):
+        # A File Ending In '\n' Has A Final Offset Equal To Its Size (No Line There Yet)
+        return len(self.Offsets) - (self.Offsets[-1] == self.IndexedSize)
+
+    def LineEnd(self, N):
+        return self.Offsets[N + 1] if N + 1 < len(self.Offsets) else self.IndexedSize
+
+    def ReadBytes(self, Start, End):
+        if self.File is None:
+            self.File = open(self.FilePath, "rb")
+        self.File.seek(Start)
+        return self.File.read(End - Start)
+
+    def GetLine(self, N):
+        """Return Line N (0-Based) Including Its '\\n', Like readline()"""
+        if N < 0:
+            N += len(self)
+        if not 0 <= N < len(self):
+            raise IndexError("Line Index Out Of Range")
+        return self.ReadBytes(self.Offsets[N], self.LineEnd(N)).decode(self.Encoding)
+
+    def GetLines(self, Start, Stop):
+        """Return Lines [Start, Stop) With A Single seek() + read()"""
+        Start, Stop, _ = slice(Start, Stop).indices(len(self))
+        if Start >= Stop:
+            return []
+        Base = self.Offsets[Start]
+        Block = self.ReadBytes(Base, self.LineEnd(Stop - 1))
+        # Cut At The Stored Offsets: splitlines() Would Also Split On '\x0c', '\u2028', ...
+        return [Block[self.Offsets[N] - Base:self.LineEnd(N) - Base].decode(self.Encoding)
+                for N in range(Start, Stop)]
+
+    def __getitem__(self, Key):
+        if isinstance(Key, slice):
+            if Key.step not in (None, 1):
+                return [self.GetLine(N) for N in range(*Key.indices(len(self)))]
+            return self.GetLines(Key.start, Key.stop)
+        return self.GetLine(Key)
+
+    def Close(self):
+        if self.File is not None:
+            self.File.close()
+            self.File = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        self.Close()
+        return False
+
+
+# Using The Line Index
+print("--- Line-Offset Index ---")
+import time
+import tempfile
+
+with tempfile.TemporaryDirectory() as TempDir:
+    BigFile = os.path.join(TempDir, "Big.txt")
+    with open(BigFile, "w") as File:
+        File.writelines(f"This Is Line {N}\n" for N in range(200_000))
+
+    Time1 = time.perf_counter()
+    with LineIndex(BigFile) as Index:   # First Use Builds And Saves Big.txt.idx
+        Time2 = time.perf_counter()
+        print(f"Indexed {len(Index)} Lines In {Time2 - Time1:.3f} Seconds")
+        print("Line 150000:", Index.GetLine(150_000).strip())
+        print("Lines 10-12:", [Line.strip() for Line in Index[10:13]])
+
+    # Appending With "a" Mode, Then Only The New Bytes Are Scanned
+    with open(BigFile, "a") as File:
+        File.write("Appended Line A\nAppended Line B\n")
+
+    with LineIndex(BigFile) as Index:   # Loads The Sidecar, Then Refresh() Scans The Tail
+        print("Total Lines After Append:", len(Index))
+        print("Last Line:", Index[-1].strip())
+
+        # Compare With Scanning From The Start
+        Time1 = time.perf_counter()
+        with open(BigFile, "r") as File:
+            for N, Line in enumerate(File):
+                if N == 199_999:
+                    break
+        Time2 = time.perf_counter()
+        Index.GetLine(199_999)
+        Time3 = time.perf_counter()
+        print(f"Scan To Line 199999: {Time2 - Time1:.5f} Seconds")
+        print(f"Index To Line 199999: {Time3 - Time2:.5f} Seconds")
+
+# Workers=4 Splits The First Scan Across Processes For Multi-GB Files:
+# LineIndex("Huge.log", Workers=4)
+
+
+# ========================================
+# BUFFERED BATCHED WRITER (GROUP COMMIT)
+# ========================================
+
+'''
+Opening, Writing And Closing The File For Every Append Pays For An open(),
+A close() And A Disk Write Each Time. For Logs With Thousands Of Appends Per
+Second It Is Much Cheaper To:
+    1. Keep One File Handle Open
+    2. Collect Records In Memory
+    3. Write The Whole Batch At Once When It Gets Big Enough Or Old Enough
+    4. Call os.fsync() Once Per Batch ("Group Commit") Instead Of Per Record
+
+Two Locks Keep It Thread Safe:
+    BufferLock -> Protects The In-Memory List (Held Only For A Moment)
+    DiskLock   -> Only One Thread Writes/fsyncs At A Time, While Others Keep Buffering
+'''
+
+import threading
+
+
+class BatchedWriter:
+    """Append-Only Writer That Flushes By Size Or Time And fsyncs Once Per Batch"""
+
+    def __init__(self, FilePath, MaxBytes=64 * 1024, MaxDelay=0.5, Fsync=True, Encoding="utf-8"):
+        self.File = open(FilePath, "ab")
+        self.MaxBytes = MaxBytes
+        self.MaxDelay = MaxDelay
+        self.Fsync = Fsync
+        self.Encoding = Encoding
+        self.Buffer = []
+        self.BufferedBytes = 0
+        self.BufferLock = threading.Lock()
+        self.DiskLock = threading.Lock()
+        self.Records = 0
+        self.Batches = 0
+        self.Closed = threading.Event()
+        # Background Thread Flushes Records That Waited Longer Than MaxDelay
+        self.Flusher = threading.Thread(target=self.FlushLoop, daemon=True)
+        self.Flusher.start()
+
+    def Write(self, Record):
+        """Buffer One Record (str Or bytes), Flushing If The Batch Is Full"""
+        if isinstance(Record, str):
+            Record = Record.encode(self.Encoding)
+        # Checking Closed Under BufferLock Means No Record Can Slip In After Close's Final Flush
+        with self.BufferLock:
+            if self.Closed.is_set():
+                raise ValueError("Write To Closed BatchedWriter")
+            self.Buffer.append(Record)
+            self.BufferedBytes += len(Record)
+            Full = self.BufferedBytes >= self.MaxBytes
+        if Full:
+            self.Flush()
+
+    def Flush(self):
+        """Write Everything Buffered So Far As One Batch"""
+        with self.DiskLock:
+            if self.File.closed:
+                return  # A Write That Filled The Batch Raced Close(): Close Already Flushed It
+            with self.BufferLock:
+                if not self.Buffer:
+                    return
+                Batch, self.Buffer = self.Buffer, []
+                self.BufferedBytes = 0
+            self.File.write(b"".join(Batch))
+            self.File.flush()
+            if self.Fsync:
+                os.fsync(self.File.fileno())
+            self.Records += len(Batch)
+            self.Batches += 1
+
+    def FlushLoop(self):
+        # Event.wait() Returns True As Soon As Close() Is Called
+        while not self.Closed.wait(self.MaxDelay):
+            self.Flush()
+
+    def Close(self):
+        with self.BufferLock:
+            if self.Closed.is_set():
+                return
+            self.Closed.set()
+        self.Flusher.join()
+        self.Flush()
+        with self.DiskLock:
+            self.File.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        self.Close()
+        return False
+
+
+# Benchmark: Small-Record Appends Per Second
+print("--- Batched Writer Benchmark ---")
+
+RecordCount = 20_000
+Record = "2024-01-01 12:00:00 INFO User Logged In\n"
+
+with tempfile.TemporaryDirectory() as TempDir:
+    # 1. Open-Per-Write (Like The Examples At The Top Of This Chapter)
+    LogPath = os.path.join(TempDir, "OpenPerWrite.log")
+    Start = time.perf_counter()
+    for _ in range(RecordCount):
+        File = open(LogPath, "a")
+        File.write(Record)
+        File.close()
+    OpenPerWrite = RecordCount / (time.perf_counter() - Start)
+
+    # 2. One Handle, Line Buffered (buffering=1 Flushes On Every '\n')
+    LogPath = os.path.join(TempDir, "LineBuffered.log")
+    Start = time.perf_counter()
+    with open(LogPath, "a", buffering=1) as File:
+        for _ in range(RecordCount):
+            File.write(Record)
+    LineBuffered = RecordCount / (time.perf_counter() - Start)
+
+    # 3. BatchedWriter From 4 Threads, fsync Once Per Batch
+    LogPath = os.path.join(TempDir, "Batched.log")
+    Start = time.perf_counter()
+    with BatchedWriter(LogPath) as Writer:
+        Threads = [threading.Thread(target=lambda: [Writer.Write(Record) for _ in range(RecordCount // 4)])
+                   for _ in range(4)]
+        for Thread in Threads:
+            Thread.start()
+        for Thread in Threads:
+            Thread.join()
+    Batched = RecordCount / (time.perf_counter() - Start)
+
+    with open(LogPath, "rb") as File:
+        LinesWritten = File.read().count(b"\n")
+
+    print(f"Open-Per-Write : {OpenPerWrite:12,.0f} Appends/Second (No fsync)")
+    print(f"Line Buffered  : {LineBuffered:12,.0f} Appends/Second (No fsync)")
+    print(f"BatchedWriter  : {Batched:12,.0f} Appends/Second "
+          f"({Writer.Batches} fsyncs For {LinesWritten} Records)")
@@ -18,6 +18,17 @@
 # ║  5. Error Handling (JSONDecodeError)                          ║
 # ║  6. Custom Object Serialization                               ║
 # ║  7. Supported Data Types                                      ║
+# ║  8. Streaming JSON (Large Documents)                          ║
+# ║     - JSON Lines Reader/Writer                                ║
+# ║     - Streaming Top-Level Array Parser                        ║
+# ║     - Memory Benchmark vs json.load()                         ║
+# ║  9. Schema-Compiled Fast Serializer                           ║
+# ║     - Generated encode/decode Per Class                       ║
+# ║     - Benchmark vs default= Hook                              ║
+# ║  10. Compact Binary Record Format (struct)                    ║
+# ║      - Schema Header, Fixed-Width Fields                      ║
+# ║      - Length-Prefixed Strings                                ║
+# ║      - mmap Reads Of Single Records                           ║
 # ║                                                               ║
 # ╚═══════════════════════════════════════════════════════════════╝
 
@@ -115,4 +126,667 @@ print(f"\nPerson As JSON: {person_json}")
 person_dict = json.loads(person_json)
 print(f"Back To Dict: {person_dict}")
 
+# ========================================
+# STREAMING JSON (LARGE DOCUMENTS)
+# ========================================
+"""
+json.load() Reads The Whole File And Builds The Whole Python Object Graph
+Before You See The First Item. For Huge Files That Means Huge Memory.
+
+Two Streaming Alternatives:
+- JSON Lines (.jsonl) - One JSON Document Per Line, Read/Write One At A Time
+- Streaming Array Parser - Yields Elements Of A Big Top-Level [ ... ] One By One
+  Using JSONDecoder.raw_decode() On A Bounded Text Buffer
+"""
+
+import os
+import time
+import tempfile
+import tracemalloc
+
+Compact_Encoder = json.JSONEncoder(separators=(",", ":"))
+Stream_Decoder = json.JSONDecoder()
+Whitespace = " \t\n\r"
+
+
+def Write_JSON_Lines(records, file):
+    """Write Each Record As One Line Of JSON"""
+    count = 0
+    for record in records:
+        file.write(Compact_Encoder.encode(record))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def Read_JSON_Lines(file):
+    """Yield One Python Object Per Non-Empty Line"""
+    for line_number, line in enumerate(file, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"Line {line_number}: {e.msg}", e.doc, e.pos) from None
+
+
+def Write_JSON_Array(items, file):
+    """Write A Top-Level JSON Array Element By Element (Never Holds The Whole List)"""
+    file.write("[")
+    count = 0
+    for item in items:
+        if count:
+            file.write(",")
+        for piece in Compact_Encoder.iterencode(item):
+            file.write(piece)
+        count += 1
+    file.write("]")
+    return count
+
+
+def Stream_JSON_Array(file, chunk_size=64 * 1024, max_buffer=16 * 1024 * 1024):
+    """
+    Yield Elements Of A Top-Level JSON Array One At A Time
+    Memory Stays Around chunk_size Plus The Largest Single Element;
+    An Element Bigger Than max_buffer Characters Raises ValueError
+    """
+    buffer = ""
+    pos = 0
+    offset = 0  # Characters Dropped From The Front Of The Buffer So Far
+    at_eof = False
+
+    def read_more():
+        # Drop What Was Already Parsed, Then Append The Next Chunk
+        # (Chunk Grows With The Buffer So One Huge Element Is Not Re-Parsed Many Times)
+        nonlocal buffer, pos, offset, at_eof
+        buffer = buffer[pos:]
+        offset += pos
+        pos = 0
+        if len(buffer) > max_buffer:
+            raise ValueError(f"JSON Element Larger Than max_buffer ({max_buffer} Characters)")
+        chunk = file.read(max(chunk_size, len(buffer)))
+        if chunk:
+            buffer += chunk
+        else:
+            at_eof = True
+
+    def next_token():
+        # Skip Whitespace, Reading More If Needed; Return "" At End Of File
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in Whitespace:
+                pos += 1
+            if pos < len(buffer) or at_eof:
+                return buffer[pos:pos + 1]
+            read_more()
+
+    if next_token() != "[":
+        raise ValueError("Top-Level JSON Value Is Not An Array")
+    pos += 1
+    if next_token() == "]":
+        return
+
+    while True:
+        start = pos
+        try:
+            item, end = Stream_Decoder.raw_decode(buffer, start)
+        except json.JSONDecodeError as error:
+            if at_eof:
+                raise ValueError(f"Invalid Array Element At Character {offset + error.pos}: {error.msg}") from None
+            read_more()  # Element Is Cut Off At The End Of The Buffer
+            continue
+        # Look For The ',' Or ']' Without Reading, So The Element Text Is Still Here
+        pos = end
+        while pos < len(buffer) and buffer[pos] in Whitespace:
+            pos += 1
+        token = buffer[pos:pos + 1]
+        if token not in (",", "]") and not at_eof:
+            pos = start
+            read_more()  # A Number Like 3.5 Cut To "3." Or "3" At The Buffer Edge
+            continue
+        if token == ",":
+            yield item
+            pos += 1
+            if next_token() == "]":
+                raise ValueError(f"Trailing ',' Before ']' At Character {offset + pos}")
+        elif token == "]":
+            yield item
+            return
+        else:
+            raise ValueError(f"Expected ',' Or ']' After Array Element, Got {token or 'End Of File'!r}")
+
+
+# Using The Streaming Helpers
+print("\n--- Streaming JSON ---")
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    # JSON Lines Round Trip
+    lines_path = os.path.join(temp_dir, "people.jsonl")
+    with open(lines_path, "w") as file:
+        Write_JSON_Lines(({"id": i, "name": f"User{i}", "age": 20 + i % 50} for i in range(5)), file)
+    with open(lines_path, "r") as file:
+        for record in Read_JSON_Lines(file):
+            print("JSON Line:", record)
+
+    # Big Top-Level Array: Write It Streaming, Read It Both Ways
+    # (Raise record_count To ~20_000_000 For A Multi-GB File)
+    record_count = 200_000
+    array_path = os.path.join(temp_dir, "big.json")
+    with open(array_path, "w") as file:
+        Write_JSON_Array((dict(data, id=i) for i in range(record_count)), file)
+    size_mb = os.path.getsize(array_path) / 1024 / 1024
+
+    def Benchmark(label, consume):
+        start = time.perf_counter()
+        count = consume()
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        consume()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{label:<18}: {count:,} Items, {size_mb / seconds:6.1f} MB/s, Peak Memory {peak / 1024 / 1024:7.2f} MB")
+
+    def Use_json_load():
+        with open(array_path, "r") as file:
+            return len(json.load(file))
+
+    def Use_Stream():
+        with open(array_path, "r") as file:
+            return sum(1 for _ in Stream_JSON_Array(file))
+
+    print(f"\nArray File: {size_mb:.1f} MB")
+    Benchmark("json.load()", Use_json_load)
+    Benchmark("Stream_JSON_Array", Use_Stream)
+
+# ========================================
+# SCHEMA-COMPILED FAST SERIALIZER
+# ========================================
+"""
+json.dumps(person, default=Person_To_Dict) Calls A Python Hook For Every
+Object And Builds A Throwaway Dict Each Time. If We Know The Fields Of A
+Class Up Front, We Can Generate (Once) A Small Function Specialised For It:
+
+    def encode_Person(obj):
+        return '{"name":' + enc_str(obj.name) + ',"age":' + enc_int(obj.age) + '}'
+
+    def decode_Person(d):
+        obj = new(Person)
+        obj.name = d["name"]
+        obj.age = d["age"]
+        return obj
+
+Field Names Come From (In Order): dataclass fields, __slots__, Type Hints,
+Or The Parameters Of __init__. Generated Functions Are Cached Per Class.
+Decoding Fills The Instance Directly And Does NOT Call __init__.
+"""
+
+import inspect
+import dataclasses
+import typing
+from json.encoder import encode_basestring_ascii
+
+Serializer_Cache = {}  # Class -> (encode, decode, source, flat)
+
+
+def Class_Hints(cls):
+    """Type Hints Of A Class, Or {} If They Can't Be Resolved"""
+    try:
+        return typing.get_type_hints(cls)
+    except Exception:
+        return {}
+
+
+def Class_Fields(cls):
+    """Return The Ordered Field Names Of A Class"""
+    if dataclasses.is_dataclass(cls):
+        return [f.name for f in dataclasses.fields(cls)]
+    slots = []
+    for klass in reversed(cls.__mro__):
+        declared = klass.__dict__.get("__slots__", ())
+        declared = (declared,) if isinstance(declared, str) else declared
+        slots.extend(name for name in declared if name not in ("__dict__", "__weakref__"))
+    if slots:
+        return slots
+    hints = Class_Hints(cls)
+    if hints:
+        return list(hints)
+    parameters = list(inspect.signature(cls.__init__).parameters)
+    return parameters[1:]  # Skip self
+
+
+def Encode_Any(value):
+    """Fallback For Fields Without A Fast Path (Nested Objects Use Their Own Serializer)"""
+    return json.dumps(value, separators=(",", ":"), default=Fast_Default)
+
+
+Field_Encoders = {
+    # Same C Function json.dumps Uses For Strings
+    str: "encode_basestring_ascii({0})",
+    # bool Is A Subclass Of int, So Only Exact ints Take The Fast Path (True Must Stay true, Not 1)
+    int: "(int.__repr__({0}) if type({0}) is int else Encode_Any({0}))",
+}
+
+
+def Compile_Serializer(cls):
+    """Generate, Cache And Return (encode, decode) Functions For cls"""
+    cached = Serializer_Cache.get(cls)
+    if cached is not None:
+        return cached[0], cached[1]
+
+    names = Class_Fields(cls)
+    hints = Class_Hints(cls)
+    frozen = dataclasses.is_dataclass(cls) and cls.__dataclass_params__.frozen
+
+    parts = []
+    flat = bool(names)  # Flat = Every Field Is A Plain str/int, So No Nested Dicts
+    for index, name in enumerate(names):
+        encoder = Field_Encoders.get(hints.get(name))
+        flat = flat and encoder is not None
+        prefix = ("{" if index == 0 else ",") + json.dumps(name) + ":"
+        parts.append(f"{prefix!r} + " + (encoder or "Encode_Any({0})").format(f"obj.{name}"))
+    body = " + ".join(parts) + " + '}'" if parts else "'{}'"
+
+    # Fields Typed As Another Dataclass/Slotted Class Are Decoded Into That Class Too
+    nested = {}
+    for name in names:
+        hint = hints.get(name)
+        if isinstance(hint, type) and (dataclasses.is_dataclass(hint) or "__slots__" in hint.__dict__):
+            nested[f"decode_{name}"] = lambda value, hint=hint: Compile_Serializer(hint)[1](value)
+
+    setter = "setattr(obj, {0!r}, {1})" if frozen else "obj.{0} = {1}"
+    lines = [f"def encode_{cls.__name__}(obj):",
+             f"    return {body}",
+             "",
+             f"def decode_{cls.__name__}(d):",
+             "    obj = new(cls)"]
+    for name in names:
+        value = f"d[{name!r}]"
+        if f"decode_{name}" in nested:
+            value = f"decode_{name}({value})"
+        lines.append("    " + setter.format(name, value))
+    lines += ["    return obj"]
+    source = "\n".join(lines)
+
+    namespace = {
+        **nested,
+        "cls": cls,
+        "new": cls.__new__,
+        "setattr": object.__setattr__,  # Frozen Dataclasses Block Normal Assignment
+        "encode_basestring_ascii": encode_basestring_ascii,
+        "Encode_Any": Encode_Any,
+    }
+    exec(source, namespace)
+    encode = namespace[f"encode_{cls.__name__}"]
+    decode = namespace[f"decode_{cls.__name__}"]
+    Serializer_Cache[cls] = (encode, decode, source, flat)
+    return encode, decode
+
+
+def Fast_Default(obj):
+    """default= Hook For Objects Nested Inside Other Data (Lists, Dicts, Other Objects)"""
+    try:
+        return {name: getattr(obj, name) for name in Class_Fields(type(obj))}
+    except (AttributeError, ValueError):
+        # Same Error json.dumps Raises For Types It Can't Handle (datetime, set, ...)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+
+
+def Fast_Dumps(obj):
+    return Compile_Serializer(type(obj))[0](obj)
+
+
+def Fast_Loads(text, cls):
+    return Compile_Serializer(cls)[1](json.loads(text))
+
+
+def Fast_Dumps_List(objects, cls):
+    encode = Compile_Serializer(cls)[0]
+    return "[" + ",".join(map(encode, objects)) + "]"
+
+
+def Fast_Loads_List(text, cls):
+    decode = Compile_Serializer(cls)[1]
+    if Serializer_Cache[cls][3]:
+        # Flat Schema: Every JSON Object Is One Of Ours, So Build Instances
+        # Inside The Parser Instead Of Making A List Of Dicts First
+        return json.loads(text, object_hook=decode)
+    return list(map(decode, json.loads(text)))
+
+
+# Using The Compiled Serializer
+print("\n--- Schema-Compiled Serializer ---")
+
+class Slotted_Person:
+    __slots__ = ("name", "age")
+    name: str
+    age: int
+
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+@dataclasses.dataclass(frozen=True)
+class Employee:
+    name: str
+    age: int
+    skills: list
+
+Compile_Serializer(Slotted_Person)
+print("Generated Code:")
+print(Serializer_Cache[Slotted_Person][2])
+
+employee = Employee("Anubhav", 21, ["Python", "SQL"])
+employee_json = Fast_Dumps(employee)
+print(f"\nEmployee As JSON: {employee_json}")
+print(f"Back To Employee: {Fast_Loads(employee_json, Employee)}")
+
+# The Original Person Class Works Too (Fields Come From __init__)
+print(f"Person As JSON: {Fast_Dumps(person)}")
+print(f"Back To Person: {vars(Fast_Loads(Fast_Dumps(person), Person))}")
+
+# Benchmark: Objects Per Second
+people = [Slotted_Person(f"User{i}", i % 90) for i in range(100_000)]
+
+def Objects_Per_Second(function):
+    start = time.perf_counter()
+    result = function()
+    return len(people) / (time.perf_counter() - start), result
+
+hook_rate, hook_text = Objects_Per_Second(lambda: json.dumps(people, default=Person_To_Dict))
+fast_rate, fast_text = Objects_Per_Second(lambda: Fast_Dumps_List(people, Slotted_Person))
+print(f"\nEncode default= Hook : {hook_rate:12,.0f} Objects/Second")
+print(f"Encode Compiled      : {fast_rate:12,.0f} Objects/Second")
+print(f"Same Data: {json.loads(hook_text) == json.loads(fast_text)}")
+
+hook_rate, _ = Objects_Per_Second(lambda: [Dict_To_Person(d) for d in json.loads(hook_text)])
+fast_rate, _ = Objects_Per_Second(lambda: Fast_Loads_List(fast_text, Slotted_Person))
+print(f"Decode Dict_To_Person: {hook_rate:12,.0f} Objects/Second")
+print(f"Decode Compiled      : {fast_rate:12,.0f} Objects/Second")
+
+# ========================================
+# COMPACT BINARY RECORD FORMAT (struct)
+# ========================================
+"""
+JSON Stores Every Number As Text And Repeats Every Key In Every Record.
+For Numeric-Heavy Data A Binary Layout Is Smaller And Faster To Parse.
+
+File Layout (All Little-Endian):
+    Header   -> b"BREC" + Field Count (H) + Per Field: Type (1 Byte) + Name Length (B) + Name
+    Records  -> Fixed-Width Fields Packed With One struct.Struct, Then Each
+                Variable Field As uint32 Length + UTF-8 Bytes
+    Offsets  -> Start Of Every Record (array('Q')), So Record N Is Found Directly
+    Footer   -> Offsets Table Position (Q) + Record Count (Q)
+
+Field Types:
+    q = int (8 Bytes)   d = float (8 Bytes)   ? = bool (1 Byte)
+    s = str (Length-Prefixed UTF-8)
+    j = Anything Else (Lists, Dicts), Stored As Length-Prefixed JSON
+"""
+
+import mmap
+import struct
+from array import array
+from itertools import chain
+
+Fixed_Types = "qd?"
+Record_Magic = b"BREC"
+Record_Footer = struct.Struct("<QQ")
+Length_Prefix = struct.Struct("<I")
+
+
+def Infer_Schema(record):
+    """Build [(name, type_code), ...] From One Sample Dict"""
+    schema = []
+    for name, value in record.items():
+        if isinstance(value, bool):  # Check bool First: bool Is A Subclass Of int
+            schema.append((name, "?"))
+        elif isinstance(value, int):
+            schema.append((name, "q"))
+        elif isinstance(value, float):
+            schema.append((name, "d"))
+        elif isinstance(value, str):
+            schema.append((name, "s"))
+        else:
+            schema.append((name, "j"))
+    return schema
+
+
+Field_Checks = {
+    "q": ((int,), "int"),
+    "d": ((int, float), "float"),
+    "?": ((bool,), "bool"),
+    "s": ((str,), "str"),
+}
+
+
+def Check_Record(index, record, schema):
+    """Raise A Clear Error Naming The First Field Of record That Doesn't Fit schema"""
+    for name, code in schema:
+        if name not in record:
+            raise ValueError(f"Record {index} Is Missing Field {name!r}")
+        value = record[name]
+        types, expected = Field_Checks.get(code, ((object,), "JSON"))
+        # bool Is A Subclass Of int, So Only A '?' Field May Hold One
+        if not isinstance(value, types) or (code in "qd" and type(value) is bool):
+            raise TypeError(f"Record {index} Field {name!r}: Expected {expected}, Got {type(value).__name__}")
+        if code == "q" and not -2 ** 63 <= value < 2 ** 63:
+            raise ValueError(f"Record {index} Field {name!r}: {value} Does Not Fit In 8 Bytes")
+    extra = record.keys() - {name for name, _ in schema}
+    if extra:
+        raise ValueError(f"Record {index} Has Fields Not In The Schema: {sorted(extra)}")
+
+
+def Split_Schema(schema):
+    """Return (struct For Fixed Fields, Fixed Names, Variable [(name, type)])"""
+    fixed = [(name, code) for name, code in schema if code in Fixed_Types]
+    variable = [(name, code) for name, code in schema if code not in Fixed_Types]
+    fixed_struct = struct.Struct("<" + "".join(code for _, code in fixed))
+    return fixed_struct, [name for name, _ in fixed], variable
+
+
+def Write_Records(path, records, schema=None):
+    """
+    Write Dicts That Share The Same Keys To A Binary Record File, Return Count
+    (schema Defaults To Infer_Schema Of The First Record; Every Record Must Match It)
+    """
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        records = iter(())
+    else:
+        records = chain([first], records)
+    if schema is None:
+        schema = Infer_Schema(first or {})
+    fixed_struct, fixed_names, variable = Split_Schema(schema)
+    field_names = {name for name, _ in schema}
+    # struct Packs Any Object As '?' And Any bool As 'q'/'d', So Every Record's
+    # Fixed-Field Types Are Checked; Combinations Already Seen Skip The Check
+    expected_bools = [code == "?" for name, code in schema if code in Fixed_Types]
+    accepted_kinds = set()
+    offsets = array("Q")
+
+    with open(path, "wb") as file:
+        header = [Record_Magic, struct.pack("<H", len(schema))]
+        for name, code in schema:
+            encoded_name = name.encode("utf-8")
+            header.append(struct.pack("<cB", code.encode(), len(encoded_name)) + encoded_name)
+        file.write(b"".join(header))
+        position = file.tell()
+
+        for index, record in enumerate(records):
+            try:
+                if record.keys() != field_names:
+                    raise KeyError  # Missing Or Extra Field: Let Check_Record Name It
+                fixed = [record[name] for name in fixed_names]
+                kinds = tuple(map(type, fixed))
+                if kinds not in accepted_kinds:
+                    if [kind is bool for kind in kinds] != expected_bools:
+                        raise TypeError("bool Where A Number Belongs, Or A Non-bool In A '?' Field")
+                    accepted_kinds.add(kinds)
+                parts = [fixed_struct.pack(*fixed)]
+                for name, code in variable:
+                    value = record[name]
+                    if code == "s" and not isinstance(value, str):
+                        raise TypeError(f"Field {name!r} Is Not A str")
+                    raw = (value if code == "s" else Compact_Encoder.encode(value)).encode("utf-8")
+                    parts.append(Length_Prefix.pack(len(raw)))
+                    parts.append(raw)
+            except (KeyError, AttributeError, TypeError, struct.error) as error:
+                # Only Pay For Field-By-Field Checks Once Something Has Gone Wrong
+                Check_Record(index, record, schema)
+                raise TypeError(f"Record {index} Does Not Match The Schema: {error}") from error
+            chunk = b"".join(parts)
+            offsets.append(position)
+            file.write(chunk)
+            position += len(chunk)
+
+        offsets.tofile(file)
+        file.write(Record_Footer.pack(position, len(offsets)))
+    return len(offsets)
+
+
+def Compile_Record_Decoder(schema):
+    """
+    Generate decode(buffer, position) -> (record, next_position) For One Schema
+    (Same Idea As Compile_Serializer: Unpack All Fixed Fields In One Call,
+    Then Build The Dict As A Literal In Schema Order)
+    """
+    fixed_struct, fixed_names, variable = Split_Schema(schema)
+    lines = ["def decode(buffer, position):"]
+    if fixed_names:
+        lines.append("    " + "".join(f"f_{i}, " for i in range(len(fixed_names))) + "= fixed_unpack(buffer, position)")
+        lines.append(f"    position += {fixed_struct.size}")
+    for i, (name, code) in enumerate(variable):
+        lines.append("    length, = length_unpack(buffer, position)")
+        lines.append(f"    position += {Length_Prefix.size}")
+        if code == "s":
+            lines.append(f"    v_{i} = buffer[position:position + length].decode('utf-8')")
+        else:
+            lines.append(f"    v_{i} = loads(buffer[position:position + length])")
+        lines.append("    position += length")
+    names = {name: f"f_{i}" for i, name in enumerate(fixed_names)}
+    names.update({name: f"v_{i}" for i, (name, _) in enumerate(variable)})
+    items = ", ".join(f"{name!r}: {names[name]}" for name, _ in schema)
+    lines.append(f"    return {{{items}}}, position")
+
+    namespace = {"fixed_unpack": fixed_struct.unpack_from,
+                 "length_unpack": Length_Prefix.unpack_from,
+                 "loads": json.loads}
+    exec("\n".join(lines), namespace)
+    return namespace["decode"]
+
+
+class Binary_Record_Reader:
+    """Memory-Mapped Reader: Decodes Only The Records You Ask For"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:4] != Record_Magic:
+            self.close()
+            raise ValueError(f"{path} Is Not A Binary Record File")
+
+        # Header: Field Names And Types
+        field_count, = struct.unpack_from("<H", self.map, 4)
+        position = 6
+        self.schema = []
+        for _ in range(field_count):
+            code, name_length = struct.unpack_from("<cB", self.map, position)
+            position += 2
+            self.schema.append((bytes(self.map[position:position + name_length]).decode("utf-8"), code.decode()))
+            position += name_length
+        self.decode = Compile_Record_Decoder(self.schema)
+
+        # Footer Tells Us Where The Offsets Table Is
+        self.table_position, self.count = Record_Footer.unpack_from(self.map, len(self.map) - Record_Footer.size)
+
+    def __len__(self):
+        return self.count
+
+    def offset(self, index):
+        return struct.unpack_from("<Q", self.map, self.table_position + 8 * index)[0]
+
+    def decode_at(self, position):
+        """Decode One Record Starting At position, Return (record, next_position)"""
+        return self.decode(self.map, position)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Record Index Out Of Range")
+        return self.decode_at(self.offset(index))[0]
+
+    def __iter__(self):
+        # Records Are Stored Back To Back, So Walk Them Without The Offsets Table
+        decode, buffer = self.decode, self.map
+        position = self.offset(0) if self.count else 0
+        for _ in range(self.count):
+            record, position = decode(buffer, position)
+            yield record
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+        return False
+
+
+# Using The Binary Format
+print("\n--- Binary Record Format ---")
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    # The json.dump() Example Data Round-Trips Unchanged
+    binary_path = os.path.join(temp_dir, "data.brec")
+    Write_Records(binary_path, [data])
+    with Binary_Record_Reader(binary_path) as reader:
+        print("Schema:", reader.schema)
+        print("Round Trip Equal:", reader[0] == data)
+
+    # Records That Don't Match The Schema Are Rejected With The Field Named
+    try:
+        Write_Records(binary_path, [{"id": 1, "name": "A"}, {"id": "2", "name": "B"}])
+    except TypeError as error:
+        print("Rejected:", error)
+
+    # Benchmark On Numeric-Heavy Records
+    readings = [{"id": i, "x": i * 0.5, "y": i / 3, "z": -i * 1.25, "ok": i % 2 == 0, "sensor": f"S{i % 16}"}
+                for i in range(100_000)]
+    json_path = os.path.join(temp_dir, "readings.json")
+    binary_path = os.path.join(temp_dir, "readings.brec")
+
+    start = time.perf_counter()
+    with open(json_path, "w") as file:
+        file.write(json.dumps(readings))  # dumps() Uses The C Encoder; dump() Does Not
+    json_encode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Write_Records(binary_path, readings)
+    binary_encode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(json_path, "r") as file:
+        json_records = json.load(file)
+    json_decode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with Binary_Record_Reader(binary_path) as reader:
+        binary_records = list(reader)
+    binary_decode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with Binary_Record_Reader(binary_path) as reader:
+        one_record = reader[77_777]  # Only This Record Is Decoded
+    single_read = time.perf_counter() - start
+
+    print(f"\n{'Format':<8}{'Size (KB)':>12}{'Encode (s)':>12}{'Decode (s)':>12}")
+    print(f"{'JSON':<8}{os.path.getsize(json_path) / 1024:>12,.0f}{json_encode:>12.3f}{json_decode:>12.3f}")
+    print(f"{'Binary':<8}{os.path.getsize(binary_path) / 1024:>12,.0f}{binary_encode:>12.3f}{binary_decode:>12.3f}")
+    print(f"Same Records: {binary_records == json_records}")
+    print(f"Single Record Via mmap: {one_record} ({single_read * 1000:.2f} ms)")
+
 print("\nJSON Is Widely Used For APIs, Config Files, And Data Exchange.")
\ No newline at end of file
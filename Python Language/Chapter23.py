@@ -97,6 +97,21 @@
 │      ├─ Backup And Archive Paths                                │
 │      └─ Cross-Platform Script Development                       │
 │                                                                 │
+│  13. Cached Config And .env Discovery                           │
+│      ├─ One os.scandir() Per Directory, Cached By mtime         │
+│      ├─ Built-In .env And .ini Parsers                          │
+│      └─ Frozen, Hashable ConfigSnapshot                         │
+│                                                                 │
+│  14. Rotating Log Sink                                          │
+│      ├─ Rotate By Size Or Time Period                           │
+│      ├─ Background gzip Of Closed Segments                      │
+│      └─ Retention Budget In Bytes                               │
+│                                                                 │
+│  15. Content-Addressed Backups                                  │
+│      ├─ Store Each Content Once (SHA-256)                       │
+│      ├─ Hard Links, Reflinks, os.copy_file_range()              │
+│      └─ Incremental Mode: Rewrite Only Changed Blocks           │
+│                                                                 │
 └─────────────────────────────────────────────────────────────────┘
 """
 
@@ -119,7 +134,10 @@ Key Features:
 
 # Importing OS Module
 import os
+import sys
+import time
 import logging
+import threading
 from datetime import datetime
 
 print("=" * 70)
@@ -722,39 +740,116 @@ print("\n✓ Example 1: Project Structure Navigation")
 class ProjectPaths:
     """Centralized Project Path Management"""
     
-    def __init__(self):
-        # Get The Directory Where This Script Is Located
-        self.ScriptDir = os.path.dirname(os.path.abspath(__file__))
+    # Short Name -> Folder Name Under The Script Directory
+    Folders = {"Output": "OuputFolder", "Config": "config", "Logs": "logs", "Data": "data"}
+    
+    def __init__(self, ScriptDir=None):
+        # Get The Directory Where This Script Is Located (Or Use The One Given)
+        self.ScriptDir = sys.intern(ScriptDir or os.path.dirname(os.path.abspath(__file__)))
         
         # Project Root (Parent Of Script Directory)
-        self.ProjectRoot = os.path.dirname(self.ScriptDir)
+        self.ProjectRoot = sys.intern(os.path.dirname(self.ScriptDir))
+        
+        # Resolve Every Folder Once; Prefixes End With os.sep So A File Path
+        # Is A Single String Concatenation Instead Of os.path.join()
+        self.Directories = {Kind: sys.intern(os.path.join(self.ScriptDir, Name))
+                            for Kind, Name in self.Folders.items()}
+        self.Prefixes = {Kind: Path + os.sep for Kind, Path in self.Directories.items()}
         
         # Common Project Folders
-        self.OutputDir = os.path.join(self.ScriptDir, "OuputFolder")
-        self.ConfigDir = os.path.join(self.ScriptDir, "config")
-        self.LogsDir = os.path.join(self.ScriptDir, "logs")
-        self.DataDir = os.path.join(self.ScriptDir, "data")
+        self.OutputDir = self.Directories["Output"]
+        self.ConfigDir = self.Directories["Config"]
+        self.LogsDir = self.Directories["Logs"]
+        self.DataDir = self.Directories["Data"]
+        
+        self.Watcher = None
+        self.StopWatch = threading.Event()
+    
+    def GetPath(self, Kind, FileName):
+        """Get Full Path For A File In One Of The Project Folders"""
+        if os.path.isabs(FileName):
+            return FileName  # Same Rule As os.path.join()
+        return self.Prefixes[Kind] + FileName
+    
+    def GetPaths(self, Kind, FileNames):
+        """Build Full Paths For Many Files At Once (Same Rules As GetPath)"""
+        GetPath = self.GetPath
+        return [GetPath(Kind, Name) for Name in FileNames]
     
     def GetOutputPath(self, FileName):
         """Get Full Path For Output File"""
-        return os.path.join(self.OutputDir, FileName)
+        return self.GetPath("Output", FileName)
     
     def GetConfigPath(self, FileName):
         """Get Full Path For Config File"""
-        return os.path.join(self.ConfigDir, FileName)
+        return self.GetPath("Config", FileName)
     
     def GetLogPath(self, FileName):
         """Get Full Path For Log File"""
-        return os.path.join(self.LogsDir, FileName)
+        return self.GetPath("Logs", FileName)
+    
+    def ExistingDirectories(self):
+        """
+        One os.scandir() Of The Script Directory Instead Of One exists() Per Folder
+        (A Missing Script Directory Means No Folders; Any Other OSError Is Raised,
+        So A Permission Problem Is Not Mistaken For Every Folder Being Deleted)
+        """
+        try:
+            with os.scandir(self.ScriptDir) as Entries:
+                Names = {Entry.name for Entry in Entries if Entry.is_dir()}
+        except FileNotFoundError:
+            Names = set()
+        return {Kind for Kind, Name in self.Folders.items() if Name in Names}
+    
+    def EnsureDirectories(self, Create=False, SubFolders=()):
+        """
+        Create All Project Directories (And Optional Sub-Folders Like 'Logs/2024')
+        In One Pass. Only The Deepest Folders Are Passed To os.makedirs(),
+        Because makedirs() Creates Every Missing Parent Along The Way.
+        """
+        Existing = self.ExistingDirectories()
+        Wanted = set(self.Directories.values())
+        Wanted.update(os.path.join(self.Directories[Kind], Sub) for Kind, Sub in SubFolders)
+        Leaves = [Path for Path in Wanted
+                  if not any(Other.startswith(Path + os.sep) for Other in Wanted)]
+        for Kind, Directory in self.Directories.items():
+            print(f"  {'Exists' if Kind in Existing else 'Creating'}: {Directory}")
+        if Create:
+            for Path in sorted(Leaves):
+                os.makedirs(Path, exist_ok=True)
+        return sorted(Leaves)
     
-    def EnsureDirectories(self):
-        """Create All Project Directories If They Don't Exist"""
-        for Directory in [self.OutputDir, self.ConfigDir, self.LogsDir, self.DataDir]:
-            if not os.path.exists(Directory):
-                print(f"  Creating: {Directory}")
-                # os.makedirs(Directory, exist_ok=True)
-            else:
-                print(f"  Exists: {Directory}")
+    def WatchDirectories(self, Interval=1.0, OnDeleted=None, Recreate=False):
+        """Poll In A Background Thread And Report Project Folders That Disappear"""
+        if self.Watcher is not None:
+            return
+        self.StopWatch.clear()
+        Present = self.ExistingDirectories()  # Snapshot Before The Thread Starts
+        
+        def Watch():
+            nonlocal Present
+            while not self.StopWatch.wait(Interval):
+                try:
+                    Now = self.ExistingDirectories()
+                except OSError as E:
+                    logging.warning(f"  ⚠ Can't Scan {self.ScriptDir}: {E}")
+                    continue  # Keep The Last Snapshot And Try Again Next Poll
+                for Kind in Present - Now:
+                    if OnDeleted:
+                        OnDeleted(Kind, self.Directories[Kind])
+                    if Recreate:
+                        os.makedirs(self.Directories[Kind], exist_ok=True)
+                        Now.add(Kind)
+                Present = Now
+        
+        self.Watcher = threading.Thread(target=Watch, daemon=True)
+        self.Watcher.start()
+    
+    def StopWatching(self):
+        if self.Watcher is not None:
+            self.StopWatch.set()
+            self.Watcher.join()
+            self.Watcher = None
 
 # Use The Class
 Paths = ProjectPaths()
@@ -762,6 +857,46 @@ print(f"  Output File Path: {Paths.GetOutputPath('result.txt')}")
 print(f"  Config File Path: {Paths.GetConfigPath('settings.ini')}")
 Paths.EnsureDirectories()
 
+# Many Paths At Once
+print(f"  Log Paths: {Paths.GetPaths('Logs', ['app.log', 'error.log'])}")
+
+# Micro-Benchmark: os.path.join() Every Call Vs Precomputed Prefixes
+FileNames = [f"report_{N}.txt" for N in range(1000)]
+Start = time.perf_counter()
+for _ in range(100):
+    for Name in FileNames:
+        os.path.join(Paths.ScriptDir, "OuputFolder", Name)
+        os.path.join(Paths.ScriptDir, "logs", Name)
+JoinTime = time.perf_counter() - Start
+Start = time.perf_counter()
+for _ in range(100):
+    for Name in FileNames:
+        Paths.GetOutputPath(Name)
+        Paths.GetLogPath(Name)
+PrefixTime = time.perf_counter() - Start
+Start = time.perf_counter()
+for _ in range(100):
+    Paths.GetPaths("Output", FileNames)
+    Paths.GetPaths("Logs", FileNames)
+BulkTime = time.perf_counter() - Start
+print(f"  200,000 Paths - os.path.join: {JoinTime:.3f}s, "
+      f"Prefix Table: {PrefixTime:.3f}s, Bulk GetPaths: {BulkTime:.3f}s")
+
+# Create A Whole Tree In One Pass And Watch For Deletions (In A Temp Copy)
+import tempfile
+with tempfile.TemporaryDirectory() as TempDir:
+    TempPaths = ProjectPaths(TempDir)
+    Created = TempPaths.EnsureDirectories(Create=True, SubFolders=[("Logs", "2024-01"), ("Data", os.path.join("raw", "images"))])
+    FolderCount = sum(len(Dirs) for _, Dirs, _ in os.walk(TempDir))
+    print(f"  makedirs() Calls: {len(Created)} For {FolderCount} Folders")
+    
+    Deleted = []
+    TempPaths.WatchDirectories(Interval=0.05, OnDeleted=lambda Kind, Path: Deleted.append(Kind))
+    os.rmdir(TempPaths.Directories["Config"])
+    time.sleep(0.2)
+    TempPaths.StopWatching()
+    print(f"  Watcher Noticed Deleted: {Deleted}")
+
 # Example 2: Configuration File Management
 print("\n✓ Example 2: Configuration File Management")
 
@@ -803,29 +938,32 @@ LoadConfiguration()
 # Example 3: Log File Organization
 print("\n✓ Example 3: Log File Organization")
 
-def CreateLogPath():
+def CreateLogPath(LogsFolder=None, Now=None, Verbose=True):
     """
     Create Organized Log File Path With Date And Time
     """
-    # Get Script Directory
-    ScriptDir = os.path.dirname(os.path.abspath(__file__))
+    # Create Logs Folder Path (Default: 'logs' Next To This Script)
+    if LogsFolder is None:
+        ScriptDir = os.path.dirname(os.path.abspath(__file__))
+        LogsFolder = os.path.join(ScriptDir, "logs")
     
-    # Create Logs Folder Path
-    LogsFolder = os.path.join(ScriptDir, "logs")
+    # Read The Clock Once So Folder And File Name Always Agree
+    Now = Now or datetime.now()
     
     # Create Date-Based Subfolder
-    Today = datetime.now().strftime("%Y-%m")
+    Today = Now.strftime("%Y-%m")
     DateFolder = os.path.join(LogsFolder, Today)
     
     # Create Log Filename With Timestamp
-    Timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    Timestamp = Now.strftime("%Y-%m-%d_%H-%M-%S")
     LogFileName = f"app_log_{Timestamp}.txt"
     
     # Full Log Path
     LogPath = os.path.join(DateFolder, LogFileName)
     
-    print(f"  Log Path: {LogPath}")
-    print(f"  Would Create: {DateFolder}")
+    if Verbose:
+        print(f"  Log Path: {LogPath}")
+        print(f"  Would Create: {DateFolder}")
     
     return LogPath
 
@@ -882,6 +1020,748 @@ def GetPlatformSpecificPath(AppName):
 
 GetPlatformSpecificPath("MyApplication")
 
+# ═══════════════════════════════════════════════════════════════
+# 13. CACHED CONFIG AND .ENV DISCOVERY
+# ═══════════════════════════════════════════════════════════════
+
+print("\n" + "─" * 70)
+print("13. CACHED CONFIG AND .ENV DISCOVERY")
+print("─" * 70)
+
+"""
+LoadEnvironmentFile() And LoadConfiguration() Above Call os.path.exists()
+On Every Search Path And Re-Import dotenv Every Time They Run. That Is Fine
+Once At Startup, But Wasteful If A Worker Calls The Loader On Every Request.
+
+ConfigResolver Does The Same Search With Caching:
+✓ One os.scandir() Per Search Directory, Remembered By Directory mtime
+✓ Parsed File Contents Remembered By File mtime And Size
+✓ Small Built-In .env And .ini Parsers (No dotenv Import Needed)
+✓ Results Returned As A Frozen, Hashable ConfigSnapshot
+✓ Within MaxAge Seconds Of The Last Check, No System Calls At All
+"""
+
+import re
+import time
+from collections.abc import Mapping
+
+
+class ConfigSnapshot(Mapping):
+    """Read-Only, Hashable View Of Loaded Settings"""
+
+    __slots__ = ("_Values", "_Hash", "Source")
+
+    def __init__(self, Values=None, Source=None):
+        self._Values = dict(Values or {})
+        self.Source = Source  # File The Values Came From (Or None)
+        self._Hash = hash(frozenset(self._Values.items()))  # Set Last: Freezes The Object
+
+    def __getitem__(self, Key):
+        return self._Values[Key]
+
+    def __iter__(self):
+        return iter(self._Values)
+
+    def __len__(self):
+        return len(self._Values)
+
+    def __hash__(self):
+        return self._Hash
+
+    def __eq__(self, Other):
+        if isinstance(Other, ConfigSnapshot):
+            return self._Hash == Other._Hash and self._Values == Other._Values
+        return NotImplemented
+
+    def __setattr__(self, Name, Value):
+        if hasattr(self, "_Hash"):
+            raise AttributeError("ConfigSnapshot Is Read-Only")
+        object.__setattr__(self, Name, Value)
+
+    def __repr__(self):
+        return f"ConfigSnapshot({self._Values!r}, Source={self.Source!r})"
+
+
+EnvEscapes = {"n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+EnvEscapePattern = re.compile(r"\\(.)")
+
+
+def ParseEnvText(Text):
+    """
+    Parse .env Content: KEY=VALUE, Optional 'export ', # Comments,
+    Single Quotes (Literal) And Double Quotes (With \\n, \\t, \\" Escapes)
+    """
+    Values = {}
+    for Line in Text.splitlines():
+        Line = Line.strip()
+        if not Line or Line.startswith("#"):
+            continue
+        if Line.startswith("export "):
+            Line = Line[7:].lstrip()
+        Key, Separator, Value = Line.partition("=")
+        if not Separator:
+            continue
+        Key, Value = Key.strip(), Value.strip()
+        if Value[:1] in ("'", '"') and Value.rfind(Value[0]) > 0:
+            Quote = Value[0]
+            Value = Value[1:Value.rfind(Quote)]
+            if Quote == '"':
+                # One Pass, So An Escaped Backslash Before n Stays A Backslash And n, Not A Newline
+                Value = EnvEscapePattern.sub(lambda Match: EnvEscapes.get(Match[1], Match[0]), Value)
+        else:
+            Value = Value.split(" #", 1)[0].rstrip()  # Inline Comment
+        Values[Key] = Value
+    return Values
+
+
+IniDelimiterPattern = re.compile(r"[=:]")
+
+
+def ParseIniText(Text):
+    """Parse .ini Content Into {'Section.Key': Value} (Keys Outside A Section Use 'DEFAULT')"""
+    Values = {}
+    Section = "DEFAULT"
+    for Line in Text.splitlines():
+        Line = Line.strip()
+        if not Line or Line[0] in "#;":
+            continue
+        if Line.startswith("[") and Line.endswith("]"):
+            Section = Line[1:-1].strip()
+            continue
+        # Split At Whichever Delimiter Comes First, Like configparser, So
+        # "url: http://x?a=b" Keeps Its '=' In The Value
+        Match = IniDelimiterPattern.search(Line)
+        if Match:
+            Key, Value = Line[:Match.start()], Line[Match.end():]
+            Values[f"{Section}.{Key.strip()}"] = Value.strip()
+    return Values
+
+
+Parsers = {".env": ParseEnvText, ".ini": ParseIniText}
+
+
+class ConfigResolver:
+    """Find And Parse Config Files Across Search Directories, With Caching"""
+
+    def __init__(self, SearchDirectories, MaxAge=1.0):
+        # Normalize Once Instead Of On Every Lookup
+        self.SearchDirectories = [os.path.normpath(os.path.abspath(D)) for D in SearchDirectories if D]
+        self.MaxAge = MaxAge
+        self.DirectoryCache = {}   # Directory -> (mtime_ns, frozenset Of File Names)
+        self.FileCache = {}        # Path -> ((mtime_ns, size), ConfigSnapshot)
+        self.Snapshots = {}        # FileName -> (Checked At, ConfigSnapshot)
+        self.Stats = {"scandir": 0, "parse": 0, "hits": 0}
+
+    def ListFiles(self, Directory):
+        """File Names In Directory, Re-Scanned Only When Its mtime Changes"""
+        try:
+            MTime = os.stat(Directory).st_mtime_ns
+        except OSError:
+            return frozenset()
+        Cached = self.DirectoryCache.get(Directory)
+        if Cached and Cached[0] == MTime:
+            return Cached[1]
+        self.Stats["scandir"] += 1
+        try:
+            with os.scandir(Directory) as Entries:
+                Names = frozenset(Entry.name for Entry in Entries if Entry.is_file())
+        except OSError:
+            Names = frozenset()
+        self.DirectoryCache[Directory] = (MTime, Names)
+        return Names
+
+    def Find(self, FileName):
+        """First Path (In Search Order) That Contains FileName, Or None"""
+        for Directory in self.SearchDirectories:
+            if FileName in self.ListFiles(Directory):
+                return os.path.join(Directory, FileName)
+        return None
+
+    def Parse(self, FilePath):
+        """Parse A File, Re-Reading It Only When Its mtime Or Size Changes"""
+        Stats = os.stat(FilePath)
+        Key = (Stats.st_mtime_ns, Stats.st_size)
+        Cached = self.FileCache.get(FilePath)
+        if Cached and Cached[0] == Key:
+            return Cached[1]
+        self.Stats["parse"] += 1
+        Extension = os.path.splitext(FilePath)[1] or os.path.basename(FilePath)
+        Parser = Parsers.get(Extension.lower(), ParseEnvText)
+        with open(FilePath, "r", encoding="utf-8") as File:
+            Snapshot = ConfigSnapshot(Parser(File.read()), Source=FilePath)
+        self.FileCache[FilePath] = (Key, Snapshot)
+        return Snapshot
+
+    def Load(self, FileName):
+        """ConfigSnapshot For The First FileName Found (Empty If None Found)"""
+        Now = time.monotonic()
+        Cached = self.Snapshots.get(FileName)
+        if Cached and Now - Cached[0] < self.MaxAge:
+            self.Stats["hits"] += 1
+            return Cached[1]
+        FilePath = self.Find(FileName)
+        try:
+            Snapshot = self.Parse(FilePath) if FilePath else ConfigSnapshot()
+        except OSError:
+            Snapshot = ConfigSnapshot()  # Deleted Between Find() And Parse()
+        self.Snapshots[FileName] = (Now, Snapshot)
+        return Snapshot
+
+
+# Same Search Orders As LoadEnvironmentFile() And LoadConfiguration()
+ScriptDirectory = os.path.dirname(os.path.abspath(__file__))
+EnvResolver = ConfigResolver([
+    ScriptDirectory,
+    os.path.join(ScriptDirectory, "Utils"),
+    os.path.join(ScriptDirectory, "config"),
+    os.path.dirname(ScriptDirectory),
+])
+ConfigFileResolver = ConfigResolver([
+    os.getcwd(),
+    ScriptDirectory,
+    os.path.join(os.path.expanduser("~"), ".myapp"),
+    os.path.join("C:", "ProgramData", "MyApp") if os.name == "nt" else "/etc/myapp",
+])
+AppliedEnvironment = None
+
+
+def LoadEnvironmentFileCached(EnvFileName=".env"):
+    """Cached LoadEnvironmentFile(): Existing Environment Variables Win (Like load_dotenv)"""
+    global AppliedEnvironment
+    Snapshot = EnvResolver.Load(EnvFileName)
+    if Snapshot is not AppliedEnvironment:
+        for Key, Value in Snapshot.items():
+            os.environ.setdefault(Key, Value)
+        AppliedEnvironment = Snapshot
+    return Snapshot
+
+
+def LoadConfigurationCached(ConfigFileName="config.ini"):
+    """Cached LoadConfiguration(): Returns The Parsed Settings, Not Just The Path"""
+    return ConfigFileResolver.Load(ConfigFileName)
+
+
+# Demo With Temporary Files
+print("\n✓ Cached Config Discovery")
+import tempfile
+
+with tempfile.TemporaryDirectory() as TempDir:
+    LocalDir = os.path.join(TempDir, "local")
+    SharedDir = os.path.join(TempDir, "shared")
+    os.makedirs(LocalDir)
+    os.makedirs(SharedDir)
+    with open(os.path.join(SharedDir, "app.env"), "w") as File:
+        File.write('# Shared Settings\nexport DB_HOST=db.internal\nDB_PASS="p@ss # not a comment"\nDEBUG=false # off\n')
+    with open(os.path.join(SharedDir, "app.ini"), "w") as File:
+        File.write("[server]\nport = 8080\nhost: 0.0.0.0\n")
+
+    Demo = ConfigResolver([LocalDir, SharedDir], MaxAge=0)
+    EnvSettings = Demo.Load("app.env")
+    print(f"  Loaded From: {EnvSettings.Source}")
+    print(f"  Settings: {dict(EnvSettings)}")
+    print(f"  Ini Settings: {dict(Demo.Load('app.ini'))}")
+    print(f"  Hashable: {hash(EnvSettings) == hash(Demo.Load('app.env'))}")
+
+    # A Closer File Appears -> Directory mtime Changes -> Picked Up Automatically
+    with open(os.path.join(LocalDir, "app.env"), "w") as File:
+        File.write("DB_HOST=localhost\n")
+    print(f"  After Adding Local File: {dict(Demo.Load('app.env'))}")
+
+    # Benchmark: Original-Style Probing Vs Cached Resolver
+    Calls = 20_000
+    Env_Files = [os.path.join(D, "app.env") for D in (LocalDir, SharedDir)]
+    Start = time.perf_counter()
+    for _ in range(Calls):
+        for EnvPath in Env_Files:
+            if os.path.exists(os.path.normpath(EnvPath)):
+                with open(EnvPath) as File:
+                    ParseEnvText(File.read())
+                break
+    Probing = time.perf_counter() - Start
+
+    Cached = ConfigResolver([LocalDir, SharedDir])
+    Start = time.perf_counter()
+    for _ in range(Calls):
+        Cached.Load("app.env")
+    CachedTime = time.perf_counter() - Start
+    print(f"  {Calls} Loads - exists() + Parse: {Probing:.3f}s, Cached: {CachedTime:.3f}s")
+    print(f"  Resolver Stats: {Cached.Stats}")
+
+# The Real Search Paths Used Earlier In This Chapter
+print(f"  .env Snapshot: {LoadEnvironmentFileCached()!r}")
+print(f"  config.ini Snapshot: {LoadConfigurationCached()!r}")
+
+# ═══════════════════════════════════════════════════════════════
+# 14. ROTATING LOG SINK
+# ═══════════════════════════════════════════════════════════════
+
+print("\n" + "─" * 70)
+print("14. ROTATING LOG SINK")
+print("─" * 70)
+
+"""
+CreateLogPath() Gives A New Timestamped File Name On Every Call, But Nothing
+Ever Rotates, Compresses Or Deletes Old Logs. RotatingLogSink Builds On It:
+✓ Keeps One Open File Handle Per Segment (No open/close Per Write)
+✓ Rotates When The Segment Reaches MaxBytes Or The Period (Day/Hour/Minute) Changes
+✓ Gzips Closed Segments On A Background Thread
+✓ Deletes The Oldest Segments When The Folder Goes Over RetentionBytes
+✓ Works As A logging.Handler, So logging.getLogger().addHandler(Sink) Just Works
+"""
+
+import gzip
+import queue
+import shutil
+
+RotationPeriods = {"day": "%Y-%m-%d", "hour": "%Y-%m-%d_%H", "minute": "%Y-%m-%d_%H-%M", None: ""}
+
+
+class RotatingLogSink(logging.Handler):
+    """Size/Time Rotating Log Writer With Background Compression And A Byte Budget"""
+
+    def __init__(self, LogsFolder, MaxBytes=10 * 1024 * 1024, Period="day",
+                 RetentionBytes=100 * 1024 * 1024, Compress=True):
+        super().__init__()
+        self.LogsFolder = LogsFolder
+        self.MaxBytes = MaxBytes
+        self.PeriodFormat = RotationPeriods[Period]
+        self.RetentionBytes = RetentionBytes
+        self.Compress = Compress
+        self.File = None
+        self.CurrentPath = None
+        self.CurrentPeriod = None
+        self.Size = 0
+        self.Rotations = 0
+        self.LastBase = None
+        self.Sequence = 0
+        self.Errors = 0
+        # Closed Segments Go To A Background Thread For gzip + Retention;
+        # Pending Holds Those Not Yet Handled, So Retention Never Deletes Them
+        self.Closed = queue.Queue()
+        self.Pending = set()
+        self.Worker = threading.Thread(target=self.CompressLoop, daemon=True)
+        self.Worker.start()
+
+    def OpenSegment(self, Now):
+        Path = CreateLogPath(self.LogsFolder, Now, Verbose=False)
+        # Several Rotations In The Same Second Would Share A Name, So Number
+        # Them; The Counter Only Grows, Even If Retention Frees An Old Name
+        Base, Extension = os.path.splitext(Path)
+        self.Sequence = self.Sequence + 1 if Base == self.LastBase else 0
+        self.LastBase = Base
+        while True:
+            if self.Sequence:
+                Path = f"{Base}_{self.Sequence}{Extension}"
+            if not (os.path.exists(Path) or os.path.exists(Path + ".gz")):
+                break
+            self.Sequence += 1
+        os.makedirs(os.path.dirname(Path), exist_ok=True)
+        self.File = open(Path, "ab")
+        self.CurrentPath = Path
+        self.CurrentPeriod = Now.strftime(self.PeriodFormat)
+        self.Size = 0
+
+    def Rotate(self, Now):
+        if self.File is not None:
+            self.File.close()
+            self.Pending.add(self.CurrentPath)
+            self.Closed.put(self.CurrentPath)
+            self.Rotations += 1
+        self.OpenSegment(Now)
+
+    def Write(self, Text):
+        """Append Text To The Current Segment, Rotating First If Needed"""
+        Data = Text.encode("utf-8")
+        with self.lock:
+            Now = datetime.now()
+            if (self.File is None or self.Size + len(Data) > self.MaxBytes and self.Size > 0
+                    or Now.strftime(self.PeriodFormat) != self.CurrentPeriod):
+                self.Rotate(Now)
+            self.File.write(Data)
+            self.Size += len(Data)
+
+    def emit(self, record):
+        try:
+            self.Write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if self.File is not None:
+                self.File.flush()
+
+    def CompressLoop(self):
+        while True:
+            Path = self.Closed.get()
+            if Path is None:
+                break
+            # One Bad Segment (Disk Full, Deleted By Hand) Must Not Kill The Worker
+            try:
+                if self.Compress:
+                    try:
+                        with open(Path, "rb") as Source, gzip.open(Path + ".gz", "wb") as Target:
+                            shutil.copyfileobj(Source, Target)
+                    except OSError:
+                        if os.path.exists(Path + ".gz"):
+                            os.remove(Path + ".gz")  # Keep The Plain Segment, Drop The Partial .gz
+                        raise
+                    os.remove(Path)
+            except OSError as E:
+                self.Errors += 1
+                print(f"  ✗ RotatingLogSink: Can't Compress {Path}: {E}", file=sys.stderr)
+            finally:
+                with self.lock:
+                    self.Pending.discard(Path)
+            try:
+                self.EnforceRetention()
+            except OSError as E:
+                self.Errors += 1
+                print(f"  ✗ RotatingLogSink: Retention Failed: {E}", file=sys.stderr)
+
+    def EnforceRetention(self):
+        """
+        Delete Oldest Finished Segments Until The Folder Fits RetentionBytes
+        (Never The Open Segment Or One Still Waiting To Be Compressed)
+        """
+        Segments = []
+        Total = 0
+        for Root, _, Files in os.walk(self.LogsFolder):
+            for Name in Files:
+                Path = os.path.join(Root, Name)
+                try:
+                    Info = os.stat(Path)
+                except FileNotFoundError:
+                    continue
+                Total += Info.st_size
+                if Name.startswith("app_log_"):
+                    Segments.append((Info.st_mtime_ns, Path, Info.st_size))
+        # Read After The Walk: Any File Seen Above Was Either Still Open Or
+        # Already Queued By The Time We Look, So It Can't Slip Through
+        with self.lock:
+            Busy = self.Pending | {self.CurrentPath}
+        for _, Path, Size in sorted(Segments):
+            if Total <= self.RetentionBytes:
+                break
+            if Path in Busy:
+                continue
+            try:
+                os.remove(Path)
+            except FileNotFoundError:
+                pass
+            Total -= Size
+
+    def close(self):
+        with self.lock:
+            if self.File is not None:
+                self.File.close()
+                self.File = None
+                self.Pending.add(self.CurrentPath)
+                self.Closed.put(self.CurrentPath)  # Last Segment Is Compressed Too
+                self.CurrentPath = None
+        self.Closed.put(None)
+        self.Worker.join()
+        super().close()
+
+
+# Demo: Small Limits So Rotation Happens Quickly
+print("\n✓ Rotating Log Sink")
+with tempfile.TemporaryDirectory() as TempDir:
+    Sink = RotatingLogSink(TempDir, MaxBytes=4 * 1024, Period="day", RetentionBytes=6 * 1024)
+    Sink.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    DemoLogger = logging.getLogger("Chapter23.Rotating")
+    DemoLogger.propagate = False
+    DemoLogger.addHandler(Sink)
+    DemoLogger.setLevel(logging.INFO)
+
+    Start = time.perf_counter()
+    for N in range(2000):
+        DemoLogger.info(f"Request {N} Handled In {N % 97} ms")
+    Elapsed = time.perf_counter() - Start
+
+    DemoLogger.removeHandler(Sink)
+    Sink.close()
+
+    Remaining = []
+    for Root, _, Files in os.walk(TempDir):
+        Remaining += [os.path.join(Root, Name) for Name in Files]
+    TotalSize = sum(os.path.getsize(Path) for Path in Remaining)
+    print(f"  2000 Records In {Elapsed:.3f}s, {Sink.Rotations} Rotations")
+    print(f"  Files Kept: {len(Remaining)} ({TotalSize} Bytes, Budget {Sink.RetentionBytes})")
+    for Path in sorted(Remaining)[-3:]:
+        print(f"    {os.path.relpath(Path, TempDir)}")
+
+# ═══════════════════════════════════════════════════════════════
+# 15. CONTENT-ADDRESSED BACKUPS (HARD LINKS AND FAST COPIES)
+# ═══════════════════════════════════════════════════════════════
+
+print("\n" + "─" * 70)
+print("15. CONTENT-ADDRESSED BACKUPS")
+print("─" * 70)
+
+"""
+CreateBackupPath() Only Picks A Name, So Every Backup Is A Full Copy.
+BackupEngine Stores Each Distinct File Content Once And Links To It:
+
+BackupRoot/
+├─ objects/ab/cdef...    <- One File Per Unique Content (Named By SHA-256)
+└─ snapshots/20240101_120000/
+   ├─ manifest.json      <- Path -> [Size, mtime_ns, SHA-256]
+   └─ <Source Tree>      <- Hard Links Into objects/ (No Extra Disk Space)
+
+✓ A Snapshot Is Built Under tmp/ And Moved Into snapshots/ With os.replace()
+  Only After manifest.json Is Written, So A Crash Never Leaves A Half Snapshot
+
+✓ Unchanged Files (Same Size + mtime As Last Snapshot) Are Not Even Read
+✓ Identical Content Anywhere In The Tree Is Stored Once
+✓ New Content Is Copied With A Reflink (Copy-On-Write) Or os.copy_file_range()
+  When The OS Supports It, Falling Back To shutil.copyfile()
+✓ Changed Files Start From A Fast Copy Of Their Previous Version And Only
+  The Blocks That Differ Are Rewritten
+"""
+
+import json
+import stat
+import hashlib
+
+BackupBlockSize = 1024 * 1024
+
+try:
+    import fcntl
+    FICLONE = 0x40049409  # Linux ioctl: Reflink A Whole File (Btrfs, XFS, ...)
+except ImportError:
+    fcntl = None
+
+
+def FastCopy(Source, Target):
+    """Copy A File Using The Cheapest Method The Platform Offers, Return The Method Used"""
+    with open(Source, "rb") as SourceFile, open(Target, "wb") as TargetFile:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(TargetFile.fileno(), FICLONE, SourceFile.fileno())
+                return "reflink"
+            except OSError:
+                pass
+        if hasattr(os, "copy_file_range"):
+            try:
+                Remaining = os.fstat(SourceFile.fileno()).st_size
+                while Remaining > 0:
+                    Copied = os.copy_file_range(SourceFile.fileno(), TargetFile.fileno(), Remaining)
+                    if Copied == 0:
+                        break
+                    Remaining -= Copied
+                if Remaining == 0:
+                    return "copy_file_range"
+                TargetFile.seek(0)
+                TargetFile.truncate()
+                SourceFile.seek(0)
+            except OSError:
+                TargetFile.seek(0)
+                TargetFile.truncate()
+                SourceFile.seek(0)
+    shutil.copyfile(Source, Target)
+    return "copyfile"
+
+
+def HashFile(FilePath):
+    Digest = hashlib.sha256()
+    with open(FilePath, "rb") as File:
+        while Block := File.read(BackupBlockSize):
+            Digest.update(Block)
+    return Digest.hexdigest()
+
+
+class BackupEngine:
+    """Deduplicating, Incremental Directory Backups"""
+
+    def __init__(self, BackupRoot):
+        self.BackupRoot = BackupRoot
+        self.ObjectsDir = os.path.join(BackupRoot, "objects")
+        self.SnapshotsDir = os.path.join(BackupRoot, "snapshots")
+        self.TempDir = os.path.join(BackupRoot, "tmp")
+        for Directory in (self.ObjectsDir, self.SnapshotsDir, self.TempDir):
+            os.makedirs(Directory, exist_ok=True)
+        self.Stats = {}
+
+    def ObjectPath(self, Hash):
+        return os.path.join(self.ObjectsDir, Hash[:2], Hash[2:])
+
+    def LatestSnapshot(self):
+        Names = sorted(os.listdir(self.SnapshotsDir))
+        return os.path.join(self.SnapshotsDir, Names[-1]) if Names else None
+
+    def LoadManifest(self, Snapshot):
+        if Snapshot is None:
+            return {}
+        with open(os.path.join(Snapshot, "manifest.json"), "r") as File:
+            return json.load(File)
+
+    def StoreObject(self, TempPath, Hash):
+        """Move A Finished Temp File Into objects/ (Or Drop It If Already There)"""
+        ObjectPath = self.ObjectPath(Hash)
+        if os.path.exists(ObjectPath):
+            os.remove(TempPath)
+            return ObjectPath
+        os.makedirs(os.path.dirname(ObjectPath), exist_ok=True)
+        os.chmod(TempPath, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)  # Objects Are Shared: Read-Only
+        os.replace(TempPath, ObjectPath)
+        return ObjectPath
+
+    def CopyChangedBlocks(self, Source, Previous):
+        """Start From A Fast Copy Of Previous, Rewrite Only Differing Blocks, Return Hash"""
+        TempPath = os.path.join(self.TempDir, f"{os.getpid()}_{threading.get_ident()}.part")
+        Method = FastCopy(Previous, TempPath)
+        self.Stats["Methods"].add(Method)
+        if Method != "reflink":
+            self.Stats["BytesCopied"] += os.path.getsize(Previous)  # No Reflink: Every Byte Was Copied
+        os.chmod(TempPath, stat.S_IRUSR | stat.S_IWUSR)
+        Digest = hashlib.sha256()
+        with open(Source, "rb") as SourceFile, open(TempPath, "r+b") as TargetFile:
+            Position = 0
+            while Block := SourceFile.read(BackupBlockSize):
+                Digest.update(Block)
+                if TargetFile.read(len(Block)) != Block:
+                    TargetFile.seek(Position)
+                    TargetFile.write(Block)
+                    self.Stats["BlocksWritten"] += 1
+                    self.Stats["BytesCopied"] += len(Block)
+                Position += len(Block)
+            TargetFile.truncate(Position)
+        self.Stats["BytesRead"] += Position
+        Hash = Digest.hexdigest()
+        self.StoreObject(TempPath, Hash)
+        return Hash
+
+    def AddNewContent(self, Source):
+        """Hash A File And Copy It Into objects/ Unless That Content Is Already Stored"""
+        Hash = HashFile(Source)
+        self.Stats["BytesRead"] += os.path.getsize(Source)
+        if not os.path.exists(self.ObjectPath(Hash)):
+            TempPath = os.path.join(self.TempDir, f"{os.getpid()}_{threading.get_ident()}.part")
+            self.Stats["Methods"].add(FastCopy(Source, TempPath))
+            self.Stats["BytesCopied"] += os.path.getsize(Source)
+            self.StoreObject(TempPath, Hash)
+        else:
+            self.Stats["Deduplicated"] += 1
+        return Hash
+
+    def LinkOrCopy(self, ObjectPath, Target):
+        os.makedirs(os.path.dirname(Target), exist_ok=True)
+        try:
+            os.link(ObjectPath, Target)  # Same Disk Blocks, Zero Copy
+            self.Stats["Linked"] += 1
+        except OSError:
+            shutil.copy2(ObjectPath, Target)  # Different Drive Or No Hard Link Support
+
+    def Backup(self, SourceDir):
+        """Create A New Snapshot Of SourceDir And Return Its Path"""
+        self.Stats = {"Files": 0, "Unchanged": 0, "Deduplicated": 0, "Linked": 0, "Skipped": 0,
+                      "BlocksWritten": 0, "BytesRead": 0, "BytesCopied": 0, "Methods": set()}
+        PreviousManifest = self.LoadManifest(self.LatestSnapshot())
+        SnapshotName = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        Snapshot = os.path.join(self.SnapshotsDir, SnapshotName)
+        Building = os.path.join(self.TempDir, f"snapshot_{SnapshotName}")
+        os.makedirs(Building)
+        try:
+            Manifest = self.BuildSnapshot(SourceDir, Building, PreviousManifest)
+            with open(os.path.join(Building, "manifest.json"), "w") as File:
+                json.dump(Manifest, File)
+            os.replace(Building, Snapshot)  # Atomic: The Snapshot Appears Complete Or Not At All
+        except BaseException:
+            shutil.rmtree(Building, ignore_errors=True)
+            raise
+        return Snapshot
+
+    def BuildSnapshot(self, SourceDir, Building, PreviousManifest):
+        """Link Every File Of SourceDir Into Building, Return The Manifest"""
+        Manifest = {}
+        for Root, _, Files in os.walk(SourceDir):
+            for Name in Files:
+                Source = os.path.join(Root, Name)
+                Relative = os.path.relpath(Source, SourceDir)
+                try:
+                    Info = os.stat(Source)
+                except FileNotFoundError:
+                    # Broken Symlink (os.lstat() Still Works) Or A File Deleted Mid-Walk
+                    Reason = "Broken Symlink" if os.path.islink(Source) else "File Vanished"
+                    print(f"  ⚠ Skipping {Relative}: {Reason}")
+                    self.Stats["Skipped"] += 1
+                    continue
+                Previous = PreviousManifest.get(Relative)
+                self.Stats["Files"] += 1
+
+                if Previous and Previous[0] == Info.st_size and Previous[1] == Info.st_mtime_ns:
+                    Hash = Previous[2]  # Unchanged: Skip Reading It
+                    self.Stats["Unchanged"] += 1
+                elif Previous and os.path.exists(self.ObjectPath(Previous[2])):
+                    Hash = self.CopyChangedBlocks(Source, self.ObjectPath(Previous[2]))
+                else:
+                    Hash = self.AddNewContent(Source)
+
+                Manifest[Relative] = [Info.st_size, Info.st_mtime_ns, Hash]
+                self.LinkOrCopy(self.ObjectPath(Hash), os.path.join(Building, Relative))
+        return Manifest
+
+    def Restore(self, Snapshot, TargetDir):
+        """Copy A Snapshot Out (Copies, Not Links, So Edits Never Touch The Store)"""
+        for Relative in self.LoadManifest(Snapshot):
+            Target = os.path.join(TargetDir, Relative)
+            os.makedirs(os.path.dirname(Target), exist_ok=True)
+            FastCopy(os.path.join(Snapshot, Relative), Target)
+            os.chmod(Target, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+
+
+# Demo In A Temporary Folder
+print("\n✓ Content-Addressed Backups")
+with tempfile.TemporaryDirectory() as TempDir:
+    SourceDir = os.path.join(TempDir, "project")
+    os.makedirs(os.path.join(SourceDir, "assets"))
+    BigData = os.urandom(8 * BackupBlockSize)
+    with open(os.path.join(SourceDir, "assets", "video.bin"), "wb") as File:
+        File.write(BigData)
+    with open(os.path.join(SourceDir, "assets", "video_copy.bin"), "wb") as File:
+        File.write(BigData)  # Same Content, Stored Once
+    for N in range(50):
+        with open(os.path.join(SourceDir, f"note_{N}.txt"), "w") as File:
+            File.write(f"Note {N}\n" * 100)
+    if hasattr(os, "symlink"):
+        try:
+            os.symlink(os.path.join(SourceDir, "missing.txt"), os.path.join(SourceDir, "dangling.txt"))
+        except OSError:
+            pass  # Windows Without Symlink Permission
+
+    Engine = BackupEngine(os.path.join(TempDir, "backups"))
+
+    def Report(Label, Seconds):
+        Stats = Engine.Stats
+        print(f"  {Label}: {Seconds:.3f}s, {Stats['Files']} Files, {Stats['Unchanged']} Unchanged, "
+              f"{Stats['Deduplicated']} Deduplicated, {Stats['BytesCopied'] / 1024 / 1024:.1f} MB Copied, "
+              f"{Stats['BlocksWritten']} Blocks Rewritten, Methods: {sorted(Stats['Methods']) or '-'}")
+
+    Start = time.perf_counter()
+    First = Engine.Backup(SourceDir)
+    Report("Full Backup       ", time.perf_counter() - Start)
+
+    Start = time.perf_counter()
+    Engine.Backup(SourceDir)
+    Report("Nothing Changed   ", time.perf_counter() - Start)
+
+    # Change One Block In The Middle Of The Big File
+    with open(os.path.join(SourceDir, "assets", "video.bin"), "r+b") as File:
+        File.seek(3 * BackupBlockSize + 10)
+        File.write(b"EDITED")
+    Start = time.perf_counter()
+    Latest = Engine.Backup(SourceDir)
+    Report("One Block Changed ", time.perf_counter() - Start)
+
+    ObjectCount = sum(len(Files) for _, _, Files in os.walk(Engine.ObjectsDir))
+    print(f"  3 Snapshots Of {Engine.Stats['Files']} Files Use {ObjectCount} Stored Objects")
+
+    RestoreDir = os.path.join(TempDir, "restored")
+    Engine.Restore(First, RestoreDir)
+    with open(os.path.join(RestoreDir, "assets", "video.bin"), "rb") as File:
+        print(f"  Restored First Snapshot Matches Original: {File.read() == BigData}")
+
 # ═══════════════════════════════════════════════════════════════
 # SUMMARY
 # ═══════════════════════════════════════════════════════════════
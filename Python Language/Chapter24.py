@@ -29,6 +29,16 @@
 # ║                                                               ║
 # ║  7. Preserving Metadata (@wraps)                              ║
 # ║  8. Real-World Examples                                       ║
+# ║     - Async-Aware Decorators (async def, Async Generators)    ║
+# ║     - Repeat(Times, Concurrent=True) With asyncio.gather()    ║
+# ║  9. Profiling Decorator                                       ║
+# ║     - Latency Histograms With perf_counter_ns()               ║
+# ║     - 1-In-N Sampling, Per-Thread Stats                       ║
+# ║     - Table And Prometheus Export                             ║
+# ║  10. Resilience Decorators                                    ║
+# ║      - Rate_Limit (Token Bucket)                              ║
+# ║      - Circuit_Breaker (Half-Open Probes)                     ║
+# ║      - Bulkhead (Concurrency Cap, Threads And asyncio)        ║
 # ║                                                               ║
 # ╚═══════════════════════════════════════════════════════════════╝
 
@@ -63,11 +73,35 @@ How It Works:
 """
 
 from functools import wraps
+import asyncio
+import inspect
 import time
 
+# Async-Aware Decorators:
+# A Plain Wrapper Around An 'async def' Function Only Sees The Coroutine Object
+# Being Created, Not The Awaited Work. So Each Decorator Below Checks What It
+# Wraps And Returns A Matching Wrapper:
+#   inspect.iscoroutinefunction(Func)  -> 'async def' Wrapper That Awaits Func
+#   inspect.isasyncgenfunction(Func)   -> 'async def' Wrapper That Re-Yields Items
+#   Anything Else                      -> The Normal Sync Wrapper
+
 # Basic Decorator Function
 def My_Decorator(Func):
     """Basic Decorator That Prints Before And After Function Call"""
+    if inspect.iscoroutinefunction(Func):
+        async def Async_Wrapper(*args, **kwargs):
+            print(f"Calling {Func.__name__} With Args: {args}")
+            result = await Func(*args, **kwargs)
+            print(f"{Func.__name__} Returned: {result}")
+            return result
+        return Async_Wrapper
+    if inspect.isasyncgenfunction(Func):
+        async def Async_Gen_Wrapper(*args, **kwargs):
+            print(f"Calling {Func.__name__} With Args: {args}")
+            async for item in Func(*args, **kwargs):
+                yield item
+            print(f"{Func.__name__} Finished")
+        return Async_Gen_Wrapper
     def Wrapper(*args, **kwargs):
         print(f"Calling {Func.__name__} With Args: {args}")
         result = Func(*args, **kwargs)
@@ -84,6 +118,24 @@ print(Greet("Anubhav"))
 # Timing Decorator
 def Timing_Decorator(Func):
     """Decorator To Measure Function Execution Time"""
+    if inspect.iscoroutinefunction(Func):
+        @wraps(Func)
+        async def Async_Wrapper(*args, **kwargs):
+            Start_Time = time.time()
+            Result = await Func(*args, **kwargs)  # Time The Awaited Work
+            End_Time = time.time()
+            print(f"{Func.__name__} Took {End_Time - Start_Time:.4f} Seconds")
+            return Result
+        return Async_Wrapper
+    if inspect.isasyncgenfunction(Func):
+        @wraps(Func)
+        async def Async_Gen_Wrapper(*args, **kwargs):
+            Start_Time = time.time()
+            async for Item in Func(*args, **kwargs):
+                yield Item
+            End_Time = time.time()
+            print(f"{Func.__name__} Took {End_Time - Start_Time:.4f} Seconds (Until Exhausted)")
+        return Async_Gen_Wrapper
     @wraps(Func)  # Preserves Original Function Metadata
     def Wrapper(*args, **kwargs):
         Start_Time = time.time()
@@ -101,9 +153,29 @@ def Slow_Function():
 print(Slow_Function())
 
 # Decorator With Parameters
-def Repeat(Times):
-    """Decorator Factory That Creates A Repeater Decorator"""
+def Repeat(Times, Concurrent=False):
+    """
+    Decorator Factory That Creates A Repeater Decorator
+    Concurrent=True Runs The Repetitions Of A Coroutine Together With asyncio.gather()
+    """
     def Decorator(Func):
+        if inspect.iscoroutinefunction(Func):
+            @wraps(Func)
+            async def Async_Wrapper(*args, **kwargs):
+                if Concurrent:
+                    return list(await asyncio.gather(*(Func(*args, **kwargs) for _ in range(Times))))
+                Results = []
+                for _ in range(Times):
+                    Results.append(await Func(*args, **kwargs))
+                return Results
+            return Async_Wrapper
+        if inspect.isasyncgenfunction(Func):
+            @wraps(Func)
+            async def Async_Gen_Wrapper(*args, **kwargs):
+                for _ in range(Times):  # Yields Every Item Of Every Run In Turn
+                    async for Item in Func(*args, **kwargs):
+                        yield Item
+            return Async_Gen_Wrapper
         @wraps(Func)
         def Wrapper(*args, **kwargs):
             Results = []
@@ -152,6 +224,23 @@ print(Complex_Function(5))
 
 # Real-World Example: Authentication Decorator
 def Requires_Auth(Func):
+    if inspect.iscoroutinefunction(Func):
+        @wraps(Func)
+        async def Async_Wrapper(User, *args, **kwargs):
+            if User.get('Authenticated', False):
+                return await Func(User, *args, **kwargs)
+            else:
+                return "Access Denied!"
+        return Async_Wrapper
+    if inspect.isasyncgenfunction(Func):
+        @wraps(Func)
+        async def Async_Gen_Wrapper(User, *args, **kwargs):
+            if User.get('Authenticated', False):
+                async for Item in Func(User, *args, **kwargs):
+                    yield Item
+            else:
+                yield "Access Denied!"
+        return Async_Gen_Wrapper
     @wraps(Func)
     def Wrapper(User, *args, **kwargs):
         if User.get('Authenticated', False):
@@ -170,4 +259,638 @@ User2 = {'name': 'Guest', 'Authenticated': False}
 print(Secret_Data(User1))
 print(Secret_Data(User2))
 
+# The Same Decorators On Async Code
+@Timing_Decorator
+@My_Decorator
+async def Fetch_Data(Key):
+    await asyncio.sleep(0.2)  # Simulated I/O
+    return f"Data For {Key}"
+
+@Timing_Decorator
+@Repeat(3)
+async def Ping_Sequential():
+    await asyncio.sleep(0.1)
+    return "Pong"
+
+@Timing_Decorator
+@Repeat(3, Concurrent=True)
+async def Ping_Concurrent():
+    await asyncio.sleep(0.1)
+    return "Pong"
+
+@Requires_Auth
+async def Async_Secret_Data(User):
+    await asyncio.sleep(0)
+    return "Top Secret Information (Async)"
+
+@Timing_Decorator
+async def Stream_Rows(Count):
+    for N in range(Count):
+        await asyncio.sleep(0.05)
+        yield f"Row {N}"
+
+async def Async_Demo():
+    print(await Fetch_Data("user:1"))        # Timing Includes The 0.2s Sleep
+    print(await Ping_Sequential())           # ~0.3 Seconds
+    print(await Ping_Concurrent())           # ~0.1 Seconds
+    print(await Async_Secret_Data(User1))
+    print(await Async_Secret_Data(User2))
+    print([Row async for Row in Stream_Rows(3)])
+
+asyncio.run(Async_Demo())
+
+# Profiling Decorator (Low-Overhead Latency Histograms)
+"""
+Timing_Decorator Prints On Every Call And CountCalls Only Counts.
+Profile() Records A Latency Histogram Per Function Instead:
+- perf_counter_ns() Gives Integer Nanoseconds (No Float Rounding)
+- Sample_Every=N Times Only 1 In N Calls, Every Call Is Still Counted
+- Each Thread Writes To Its Own Stats (threading.local), So No Lock On The Hot Path
+- Bucket i Holds Calls That Took < 2**i Nanoseconds (64 Buckets Cover Everything)
+- Profile_Report() Prints A Table, Prometheus_Text() Exports For Monitoring
+"""
+
+import threading
+
+Profiled_Functions = {}  # (Function Name, Sample_Every) -> List Of Per-Thread Stats
+Registry_Lock = threading.Lock()  # Only Used When A New Thread First Calls A Function
+
+
+class Thread_Stats:
+    __slots__ = ("Sample_Every", "Countdown", "Sampled", "Total_Ns", "Max_Ns", "Buckets")
+
+    def __init__(self, Sample_Every=1):
+        self.Sample_Every = Sample_Every
+        self.Countdown = 0
+        self.Sampled = 0
+        self.Total_Ns = 0
+        self.Max_Ns = 0
+        self.Buckets = [0] * 64  # A List Updates Faster Than array('Q') In The Hot Path
+
+    @property
+    def Calls(self):
+        # Not Counted On The Hot Path: Each Sample Stands For Sample_Every Calls,
+        # Minus The Ones Still Left On The Countdown
+        return self.Sampled * self.Sample_Every - self.Countdown
+
+
+def Profile(Sample_Every=1):
+    """Decorator Factory: Record Latency Of 1 In Sample_Every Calls"""
+    def Decorator(Func):
+        Name = f"{Func.__module__}.{Func.__qualname__}"
+        Local = threading.local()
+        # Keyed By Rate Too: Profile()(f) And Profile(100)(f) Sample Differently,
+        # So Their Histograms Must Not Be Mixed
+        Per_Thread = Profiled_Functions.setdefault((Name, Sample_Every), [])
+        Clock = time.perf_counter_ns
+
+        def New_Stats():
+            Stats = Local.Stats = Thread_Stats(Sample_Every)
+            with Registry_Lock:
+                Per_Thread.append(Stats)
+            return Stats
+
+        @wraps(Func)
+        def Wrapper(*args, **kwargs):
+            try:
+                Stats = Local.Stats
+            except AttributeError:
+                Stats = New_Stats()
+            if Stats.Countdown:
+                Stats.Countdown -= 1
+                return Func(*args, **kwargs)
+            Stats.Countdown = Sample_Every - 1
+            Start = Clock()
+            try:
+                return Func(*args, **kwargs)
+            finally:
+                Elapsed = Clock() - Start
+                Stats.Sampled += 1
+                Stats.Total_Ns += Elapsed
+                if Elapsed > Stats.Max_Ns:
+                    Stats.Max_Ns = Elapsed
+                Stats.Buckets[Elapsed.bit_length()] += 1
+        return Wrapper
+    return Decorator
+
+
+def Merged_Stats():
+    """Combine Every Thread's Stats Per Function (And Sample Rate)"""
+    Merged = {}
+    for Key, Per_Thread in Profiled_Functions.items():
+        Total = Thread_Stats()
+        Calls = 0
+        with Registry_Lock:
+            Per_Thread = list(Per_Thread)
+        for Stats in Per_Thread:
+            Calls += Stats.Calls
+            Total.Sampled += Stats.Sampled
+            Total.Total_Ns += Stats.Total_Ns
+            Total.Max_Ns = max(Total.Max_Ns, Stats.Max_Ns)
+            for Index, Count in enumerate(Stats.Buckets):
+                Total.Buckets[Index] += Count
+        Merged[Key] = (Calls, Total)
+    return Merged
+
+
+def Percentile_Ns(Stats, Fraction):
+    """Upper Bound (Inclusive) Of The Bucket Holding The Given Fraction Of Samples"""
+    Target = Stats.Sampled * Fraction
+    Seen = 0
+    for Index, Count in enumerate(Stats.Buckets):
+        Seen += Count
+        if Count and Seen >= Target:
+            return min(2 ** Index - 1, Stats.Max_Ns)
+    return 0
+
+
+def Profile_Report():
+    Lines = [f"{'Function':<40}{'Calls':>10}{'Sampled':>10}{'Mean':>12}{'p50 <=':>12}{'p99 <=':>12}{'Max':>12}"]
+    for (Name, Sample_Every), (Calls, Stats) in Merged_Stats().items():
+        if Sample_Every != 1:
+            Name = f"{Name} (1/{Sample_Every})"
+        Mean = Stats.Total_Ns / Stats.Sampled if Stats.Sampled else 0
+        Lines.append(f"{Name:<40}{Calls:>10}{Stats.Sampled:>10}{Mean / 1000:>10.1f}us"
+                     f"{Percentile_Ns(Stats, 0.5) / 1000:>10.1f}us{Percentile_Ns(Stats, 0.99) / 1000:>10.1f}us"
+                     f"{Stats.Max_Ns / 1000:>10.1f}us")
+    return "\n".join(Lines)
+
+
+def Prometheus_Text():
+    """Prometheus Text Exposition Format (Histogram In Seconds + Call Counter)"""
+    Lines = ["# TYPE function_calls_total counter",
+             "# TYPE function_latency_seconds histogram"]
+    for (Name, Sample_Every), (Calls, Stats) in Merged_Stats().items():
+        Label = f'function="{Name}",sample_every="{Sample_Every}"'
+        Lines.append(f"function_calls_total{{{Label}}} {Calls}")
+        Cumulative = 0
+        Last_Used = max((Index for Index, Count in enumerate(Stats.Buckets) if Count), default=0)
+        for Index in range(Last_Used + 1):
+            Cumulative += Stats.Buckets[Index]
+            # Bucket i Holds Elapsed With bit_length() == i, So Its Largest Value Is 2**i - 1 ns
+            Lines.append(f'function_latency_seconds_bucket{{{Label},le="{(2 ** Index - 1) / 1e9:.9g}"}} {Cumulative}')
+        Lines.append(f'function_latency_seconds_bucket{{{Label},le="+Inf"}} {Stats.Sampled}')
+        Lines.append(f"function_latency_seconds_sum{{{Label}}} {Stats.Total_Ns / 1e9:.9f}")
+        Lines.append(f"function_latency_seconds_count{{{Label}}} {Stats.Sampled}")
+    return "\n".join(Lines)
+
+
+@Profile()
+def Parse_Request(Text):
+    return Text.split("&")
+
+@Profile(Sample_Every=10)
+def Lookup_User(User_Id):
+    return {"id": User_Id, "name": f"User{User_Id}"}
+
+def Worker():
+    for N in range(20_000):
+        Parse_Request(f"id={N}&page=2")
+        Lookup_User(N)
+
+Threads = [threading.Thread(target=Worker) for _ in range(4)]
+for T in Threads:
+    T.start()
+for T in Threads:
+    T.join()
+
+print("\nProfile Report:")
+print(Profile_Report())
+print("\nPrometheus Export (First Lines):")
+print("\n".join(Prometheus_Text().splitlines()[:6]))
+
+# Measure The Decorator's Own Overhead
+def Empty():
+    pass
+
+def Ns_Per_Call(Target, Calls=500_000):
+    # Loop Inside A Function: Local Lookups Keep The Loop Itself Cheap
+    Start = time.perf_counter_ns()
+    for _ in range(Calls):
+        Target()
+    return (time.perf_counter_ns() - Start) / Calls
+
+Sampled_Always = Profile()(Empty)
+Sampled_1_In_100 = Profile(Sample_Every=100)(Empty)
+for Label, Target in [("Plain", Empty), ("Profile()", Sampled_Always), ("Profile(100)", Sampled_1_In_100)]:
+    Per_Call = Ns_Per_Call(Target)
+    if Label == "Plain":
+        Baseline = Per_Call
+    print(f"{Label:<14}: {Per_Call:6.0f} ns/Call (Overhead {Per_Call - Baseline:5.0f} ns)")
+
+# Resilience Decorators (Rate Limit, Circuit Breaker, Bulkhead)
+"""
+Repeat() Retries Blindly: Against A Slow Or Failing Dependency Every Retry
+Adds More Load. These Three Decorators Protect Both Sides Instead:
+- Rate_Limit(Rate, Burst)      Token Bucket: At Most Rate Calls/Second, Bursts Up To Burst
+- Circuit_Breaker(...)         Stops Calling After Repeated Failures, Then Sends A Few
+                               Half-Open Probe Calls To See If The Dependency Recovered
+- Bulkhead(Max_Concurrent)     Caps How Many Calls Run At Once, Extra Callers Queue Or Fail
+All Three Keep Their State Behind A threading.Lock That Is Never Held While
+Waiting, So The Same Object Works From Threads And From asyncio Coroutines.
+Rejected Calls Raise A Rejected_Call Subclass. Counters Are On Wrapper.Guard.Counters().
+"""
+
+from collections import deque
+
+
+class Rejected_Call(RuntimeError):
+    """Base Class: The Call Was Refused Without Running The Function"""
+
+class Rate_Limited(Rejected_Call):
+    pass
+
+class Circuit_Open(Rejected_Call):
+    pass
+
+class Bulkhead_Full(Rejected_Call):
+    pass
+
+
+class Token_Bucket:
+    """Refills Rate Tokens Per Second Up To Burst, One Token Per Call"""
+
+    def __init__(self, Rate, Burst=None, Max_Wait=0.0):
+        self.Rate = Rate
+        self.Burst = Burst if Burst is not None else max(1, int(Rate))
+        self.Max_Wait = Max_Wait  # 0 = Reject At Once, Otherwise Wait Up To This Long
+        self.Tokens = float(self.Burst)
+        self.Last = time.monotonic()
+        self.Lock = threading.Lock()
+        self.Allowed = 0
+        self.Rejected = 0
+        self.Queued = 0
+
+    def Acquire(self):
+        """Take A Token. Returns Seconds The Caller Must Wait (0.0 Usually)"""
+        with self.Lock:
+            Now = time.monotonic()
+            self.Tokens = min(self.Burst, self.Tokens + (Now - self.Last) * self.Rate)
+            self.Last = Now
+            if self.Tokens >= 1:
+                self.Tokens -= 1
+                self.Allowed += 1
+                return 0.0
+            # Reserve A Future Token: Tokens Go Negative, Later Callers Wait Longer
+            Wait = (1 - self.Tokens) / self.Rate
+            if Wait > self.Max_Wait:
+                self.Rejected += 1
+                raise Rate_Limited(f"Rate Limit {self.Rate}/s Exceeded")
+            self.Tokens -= 1
+            self.Allowed += 1
+            self.Queued += 1
+            return Wait
+
+    def Counters(self):
+        return {"Allowed": self.Allowed, "Rejected": self.Rejected, "Queued": self.Queued}
+
+
+def Rate_Limit(Rate, Burst=None, Max_Wait=0.0):
+    """Decorator Factory: Token-Bucket Rate Limit For Sync Or Async Functions"""
+    def Decorator(Func):
+        Bucket = Token_Bucket(Rate, Burst, Max_Wait)
+        if inspect.iscoroutinefunction(Func):
+            @wraps(Func)
+            async def Async_Wrapper(*args, **kwargs):
+                Wait = Bucket.Acquire()
+                if Wait:
+                    await asyncio.sleep(Wait)  # Other Tasks Keep Running
+                return await Func(*args, **kwargs)
+            Async_Wrapper.Guard = Bucket
+            return Async_Wrapper
+        @wraps(Func)
+        def Wrapper(*args, **kwargs):
+            Wait = Bucket.Acquire()
+            if Wait:
+                time.sleep(Wait)
+            return Func(*args, **kwargs)
+        Wrapper.Guard = Bucket
+        return Wrapper
+    return Decorator
+
+
+class Circuit_State:
+    """Closed -> (Failure_Threshold Failures In A Row) -> Open -> (Reset_Timeout) -> Half_Open"""
+
+    def __init__(self, Failure_Threshold=5, Reset_Timeout=30.0, Half_Open_Probes=1,
+                 Slow_Call=None, Failure_Types=(Exception,)):
+        self.Failure_Threshold = Failure_Threshold
+        self.Reset_Timeout = Reset_Timeout
+        self.Half_Open_Probes = Half_Open_Probes
+        self.Slow_Call = Slow_Call  # Seconds: A Success Slower Than This Counts As A Failure
+        self.Failure_Types = Failure_Types
+        self.Lock = threading.Lock()
+        self.State = "Closed"
+        self.Consecutive_Failures = 0
+        self.Opened_At = 0.0
+        self.Probes_In_Flight = 0
+        self.Successes = 0
+        self.Failures = 0
+        self.Rejected = 0
+        self.Trips = 0
+
+    def Before_Call(self):
+        """Returns True If This Call Is A Half-Open Probe, Raises Circuit_Open If Refused"""
+        if self.State == "Closed":  # Fast Path: A Single Attribute Read, No Lock
+            return False
+        with self.Lock:
+            if self.State == "Open":
+                if time.monotonic() - self.Opened_At < self.Reset_Timeout:
+                    self.Rejected += 1
+                    raise Circuit_Open(f"Circuit Open, Retry After {self.Reset_Timeout}s")
+                self.State = "Half_Open"
+                self.Probes_In_Flight = 0
+            if self.State == "Half_Open":
+                if self.Probes_In_Flight >= self.Half_Open_Probes:
+                    self.Rejected += 1
+                    raise Circuit_Open("Circuit Half-Open, Probe Already Running")
+                self.Probes_In_Flight += 1
+                return True
+            return False  # Closed By Another Thread Meanwhile
+
+    def On_Success(self, Probe):
+        with self.Lock:
+            self.Successes += 1
+            self.Consecutive_Failures = 0
+            if Probe:
+                self.State = "Closed"
+                self.Probes_In_Flight = 0
+
+    def On_Failure(self, Probe):
+        with self.Lock:
+            self.Failures += 1
+            self.Consecutive_Failures += 1
+            if Probe or (self.State == "Closed" and self.Consecutive_Failures >= self.Failure_Threshold):
+                self.State = "Open"
+                self.Opened_At = time.monotonic()
+                self.Trips += 1
+
+    def On_Abandoned(self, Probe):
+        """Call Never Finished (Cancelled, KeyboardInterrupt): Free The Probe Slot, Keep The State"""
+        if Probe:
+            with self.Lock:
+                if self.Probes_In_Flight:
+                    self.Probes_In_Flight -= 1
+
+    def Record(self, Probe, Start, Error):
+        if Error is not None and isinstance(Error, self.Failure_Types):
+            self.On_Failure(Probe)
+        elif Error is not None and not isinstance(Error, Exception):
+            # asyncio.CancelledError, KeyboardInterrupt, SystemExit: No Verdict On The Dependency
+            self.On_Abandoned(Probe)
+        elif self.Slow_Call is not None and time.monotonic() - Start > self.Slow_Call:
+            self.On_Failure(Probe)
+        else:
+            self.On_Success(Probe)
+
+    def Counters(self):
+        return {"State": self.State, "Successes": self.Successes, "Failures": self.Failures,
+                "Rejected": self.Rejected, "Trips": self.Trips}
+
+
+def Circuit_Breaker(Failure_Threshold=5, Reset_Timeout=30.0, Half_Open_Probes=1,
+                    Slow_Call=None, Failure_Types=(Exception,)):
+    """Decorator Factory: Fail Fast While A Dependency Is Down"""
+    def Decorator(Func):
+        Breaker = Circuit_State(Failure_Threshold, Reset_Timeout, Half_Open_Probes,
+                                Slow_Call, Failure_Types)
+        if inspect.iscoroutinefunction(Func):
+            @wraps(Func)
+            async def Async_Wrapper(*args, **kwargs):
+                Probe = Breaker.Before_Call()
+                Start = time.monotonic() if Breaker.Slow_Call is not None else 0.0
+                try:
+                    Result = await Func(*args, **kwargs)
+                except BaseException as Error:
+                    Breaker.Record(Probe, Start, Error)
+                    raise
+                Breaker.Record(Probe, Start, None)
+                return Result
+            Async_Wrapper.Guard = Breaker
+            return Async_Wrapper
+        @wraps(Func)
+        def Wrapper(*args, **kwargs):
+            Probe = Breaker.Before_Call()
+            Start = time.monotonic() if Breaker.Slow_Call is not None else 0.0
+            try:
+                Result = Func(*args, **kwargs)
+            except BaseException as Error:
+                Breaker.Record(Probe, Start, Error)
+                raise
+            Breaker.Record(Probe, Start, None)
+            return Result
+        Wrapper.Guard = Breaker
+        return Wrapper
+    return Decorator
+
+
+class Slot_Waiter:
+    """One Queued Caller: A threading.Event Or An asyncio Future On Its Own Loop"""
+    __slots__ = ("Event", "Loop", "Future", "Granted")
+
+    def __init__(self, Loop=None):
+        self.Loop = Loop
+        self.Future = Loop.create_future() if Loop else None
+        self.Event = None if Loop else threading.Event()
+        self.Granted = False
+
+    def Grant(self):  # Called With The Bulkhead Lock Held
+        self.Granted = True
+        if self.Loop is None:
+            self.Event.set()
+        else:
+            self.Loop.call_soon_threadsafe(self.Wake)
+
+    def Wake(self):
+        if not self.Future.done():
+            self.Future.set_result(None)
+
+
+class Bulkhead_Slots:
+    """At Most Max_Concurrent Calls Inside, At Most Max_Queue Waiting (FIFO)"""
+
+    def __init__(self, Max_Concurrent, Max_Queue=0, Timeout=None):
+        self.Max_Concurrent = Max_Concurrent
+        self.Max_Queue = Max_Queue
+        self.Timeout = Timeout
+        self.Lock = threading.Lock()
+        self.Active = 0
+        self.Waiters = deque()
+        self.Admitted = 0
+        self.Rejected = 0
+        self.Queued = 0
+        self.Peak_Active = 0
+
+    def Enter(self, Loop=None):
+        """Take A Slot Now (Returns None) Or Join The Queue (Returns A Slot_Waiter)"""
+        with self.Lock:
+            if self.Active < self.Max_Concurrent and not self.Waiters:
+                self.Active += 1
+                self.Admitted += 1
+                if self.Active > self.Peak_Active:
+                    self.Peak_Active = self.Active
+                return None
+            if len(self.Waiters) >= self.Max_Queue:
+                self.Rejected += 1
+                raise Bulkhead_Full(f"{self.Active} Calls Running, {len(self.Waiters)} Queued")
+            Waiter = Slot_Waiter(Loop)
+            self.Waiters.append(Waiter)
+            self.Queued += 1
+            return Waiter
+
+    def Give_Up(self, Waiter):
+        """Timed Out Or Cancelled: Leave The Queue. True If A Slot Was Granted Meanwhile"""
+        with self.Lock:
+            if Waiter.Granted:
+                return True  # Lost The Race: The Caller Now Owns A Slot
+            self.Waiters.remove(Waiter)
+            self.Rejected += 1
+            return False
+
+    def Leave(self):
+        with self.Lock:
+            if self.Waiters:
+                self.Admitted += 1
+                self.Waiters.popleft().Grant()  # Hand The Slot Over, Active Stays The Same
+            else:
+                self.Active -= 1
+
+    def Counters(self):
+        return {"Active": self.Active, "Admitted": self.Admitted, "Rejected": self.Rejected,
+                "Queued": self.Queued, "Peak_Active": self.Peak_Active}
+
+
+def Bulkhead(Max_Concurrent, Max_Queue=0, Timeout=None):
+    """Decorator Factory: Limit Concurrent Calls Across Threads And Tasks"""
+    def Decorator(Func):
+        Slots = Bulkhead_Slots(Max_Concurrent, Max_Queue, Timeout)
+        if inspect.iscoroutinefunction(Func):
+            @wraps(Func)
+            async def Async_Wrapper(*args, **kwargs):
+                Waiter = Slots.Enter(asyncio.get_running_loop())
+                if Waiter is not None:
+                    try:
+                        await asyncio.wait_for(asyncio.shield(Waiter.Future), Slots.Timeout)
+                    except asyncio.TimeoutError:
+                        if not Slots.Give_Up(Waiter):
+                            raise Bulkhead_Full(f"No Slot Within {Slots.Timeout}s") from None
+                    except asyncio.CancelledError:
+                        if Slots.Give_Up(Waiter):
+                            Slots.Leave()
+                        raise
+                try:
+                    return await Func(*args, **kwargs)
+                finally:
+                    Slots.Leave()
+            Async_Wrapper.Guard = Slots
+            return Async_Wrapper
+        @wraps(Func)
+        def Wrapper(*args, **kwargs):
+            Waiter = Slots.Enter()
+            if Waiter is not None and not Waiter.Event.wait(Slots.Timeout):
+                if not Slots.Give_Up(Waiter):
+                    raise Bulkhead_Full(f"No Slot Within {Slots.Timeout}s")
+            try:
+                return Func(*args, **kwargs)
+            finally:
+                Slots.Leave()
+        Wrapper.Guard = Slots
+        return Wrapper
+    return Decorator
+
+
+# Rate Limit: 20 Calls In A Tight Loop Against A Bucket Of 5
+@Rate_Limit(Rate=50, Burst=5)
+def Send_Email(To):
+    return f"Sent To {To}"
+
+for N in range(20):
+    try:
+        Send_Email(f"user{N}@example.com")
+    except Rate_Limited:
+        pass
+print("\nRate_Limit (Reject):", Send_Email.Guard.Counters())
+
+@Rate_Limit(Rate=50, Burst=5, Max_Wait=1.0)
+async def Call_Api(N):
+    return N
+
+async def Rate_Demo():
+    Start = time.perf_counter()
+    await asyncio.gather(*(Call_Api(N) for N in range(20)))
+    # 5 From The Burst, 15 More At 50/s -> About 0.3 Seconds
+    print(f"Rate_Limit (Wait)  : {Call_Api.Guard.Counters()} In {time.perf_counter() - Start:.2f}s")
+
+asyncio.run(Rate_Demo())
+
+# Circuit Breaker: Stops Repeat() From Hammering A Dead Dependency
+Dependency_Up = False
+
+@Circuit_Breaker(Failure_Threshold=3, Reset_Timeout=0.2)
+def Query_Inventory(Item):
+    if not Dependency_Up:
+        raise ConnectionError("Inventory Service Down")
+    return {"item": Item, "stock": 7}
+
+Outcomes = []
+for N in range(10):
+    try:
+        Query_Inventory("book")
+        Outcomes.append("Ok")
+    except Circuit_Open:
+        Outcomes.append("Fast-Fail")  # No Call Made, No Timeout Waited
+    except ConnectionError:
+        Outcomes.append("Error")
+print("\nCircuit Breaker While Down:", Outcomes)
+print("Counters:", Query_Inventory.Guard.Counters())
+
+Dependency_Up = True
+time.sleep(0.25)  # Past Reset_Timeout: Next Call Is A Half-Open Probe
+print("Probe Call:", Query_Inventory("book"))
+print("Counters:", Query_Inventory.Guard.Counters())
+
+# Bulkhead: 2 Slots + 2 Queue Places For 6 Threads
+@Bulkhead(Max_Concurrent=2, Max_Queue=2)
+def Generate_Report(N):
+    time.sleep(0.1)
+    return N
+
+Results = []
+def Report_Worker(N):
+    try:
+        Results.append(Generate_Report(N))
+    except Bulkhead_Full:
+        Results.append("Full")
+
+Threads = [threading.Thread(target=Report_Worker, args=(N,)) for N in range(6)]
+for T in Threads:
+    T.start()
+for T in Threads:
+    T.join()
+print("\nBulkhead (Threads):", sorted(Results, key=str), Generate_Report.Guard.Counters())
+
+@Bulkhead(Max_Concurrent=3, Max_Queue=100)
+async def Download(N):
+    await asyncio.sleep(0.05)
+    return N
+
+async def Bulkhead_Demo():
+    Start = time.perf_counter()
+    await asyncio.gather(*(Download(N) for N in range(12)))
+    # 12 Downloads, 3 At A Time -> 4 Rounds Of 0.05 Seconds
+    print(f"Bulkhead (asyncio) : {Download.Guard.Counters()} In {time.perf_counter() - Start:.2f}s")
+
+asyncio.run(Bulkhead_Demo())
+
+# Overhead On The Success Path
+Guarded = [("Rate_Limit", Rate_Limit(Rate=1e12, Burst=10**9)(Empty)),
+           ("Circuit_Breaker", Circuit_Breaker()(Empty)),
+           ("Bulkhead", Bulkhead(Max_Concurrent=8)(Empty))]
+print()
+for Label, Target in [("Plain", Empty)] + Guarded:
+    Per_Call = Ns_Per_Call(Target)
+    if Label == "Plain":
+        Baseline = Per_Call
+    print(f"{Label:<16}: {Per_Call:6.0f} ns/Call (Overhead {Per_Call - Baseline:5.0f} ns)")
+
 print("\nDecorators Enable Clean, Reusable Code Modifications.")
\ No newline at end of file
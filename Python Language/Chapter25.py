@@ -34,6 +34,19 @@
 # ║     - Fibonacci Generator                                     ║
 # ║     - Prime Number Generator                                  ║
 # ║                                                               ║
+# ║  7. Streaming ETL Pipelines                                   ║
+# ║     - Source, Transform, Window, Batch, Sink Stages           ║
+# ║     - Backpressure With Bounded Queues                        ║
+# ║     - Thread And Process Workers (Parallel_Map)               ║
+# ║                                                               ║
+# ║  8. Windowed Aggregators                                      ║
+# ║     - Tumbling, Sliding And Session Windows                   ║
+# ║     - Mean, Min/Max, Distinct, Approximate Quantiles          ║
+# ║                                                               ║
+# ║  9. Async Iterators And Async Generators                      ║
+# ║     - __aiter__ / __anext__, async for                        ║
+# ║     - Fair Merge, Bounded Prefetch, Sync-To-Async             ║
+# ║                                                               ║
 # ╚═══════════════════════════════════════════════════════════════╝
 
 """
@@ -168,6 +181,691 @@ next(Acc)  # Prime The Generator
 print(f"Total: {Acc.send(10)}")  # Send 10, Get Total
 print(f"Total: {Acc.send(5)}")   # Send 5, Get Total
 
+# Streaming ETL Pipelines Built From Generator Stages
+"""
+Each Stage Below Is A Factory That Returns A Function: Stream In -> Stream Out.
+Pipeline(Source, Stage1, Stage2, ..., Sink) Chains Them Like A Shell Pipe:
+- Source(Iterable)         Start Of The Stream (Infinite_Counter() Works Too)
+- Transform(Func)          Apply Func To Every Event
+- Keep(Predicate)          Drop Events Where Predicate Is False
+- Window(Size, Step)       Tuples Of Size Events (Tumbling When Step == Size, Sliding Otherwise)
+- Batch(Size)              Lists Of Up To Size Events, For Sinks That Write In Bulk
+- Buffered(Size)           Run Everything Upstream In A Thread, Through A Bounded Queue
+- Parallel_Map(Func, ...)  Apply Func In A Thread Or Process Pool, Keeping Event Order
+- Sink(Func)               Consume The Stream, Return How Many Items Reached The Sink
+Nothing Is Ever Collected Into A List: Memory Stays Flat On Unbounded Streams.
+Backpressure: A Full Queue Or A Full Set Of In-Flight Chunks Makes The Producer Wait.
+"""
+
+import itertools
+import queue
+import threading
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def Source(Iterable):
+    return iter(Iterable)
+
+
+def Transform(Func):
+    def Stage(Stream):
+        return map(Func, Stream)  # map() Is A Lazy Iterator, Faster Than A Generator Loop
+    return Stage
+
+
+def Keep(Predicate):
+    def Stage(Stream):
+        return filter(Predicate, Stream)
+    return Stage
+
+
+def Window(Size, Step=None):
+    Step = Step or Size
+    def Stage(Stream):
+        Current = deque(maxlen=Size)  # Old Events Fall Off The Left Automatically
+        Since_Last = 0
+        for Event in Stream:
+            Current.append(Event)
+            Since_Last += 1
+            if len(Current) == Size and Since_Last >= Step:
+                Since_Last = 0
+                yield tuple(Current)
+    return Stage
+
+
+def Batch(Size):
+    def Stage(Stream):
+        Stream = iter(Stream)
+        while True:
+            Chunk = list(itertools.islice(Stream, Size))
+            if not Chunk:
+                return
+            yield Chunk
+    return Stage
+
+
+def Sink(Func=None):
+    def Stage(Stream):
+        Count = 0
+        if Func is None:
+            for Count, _ in enumerate(Stream, 1):
+                pass
+            return Count
+        for Count, Item in enumerate(Stream, 1):
+            Func(Item)
+        return Count
+    return Stage
+
+
+def Pipeline(Stream, *Stages):
+    for Stage in Stages:
+        Stream = Stage(Stream)
+    return Stream
+
+
+End_Of_Stream = object()  # Sentinel Marking The End Of A Buffered Stream
+
+
+def Buffered(Size=64, Chunk=256):
+    """
+    Pull Upstream Events In A Background Thread Into A Queue Holding At Most
+    Size Chunks. Events Travel In Chunks Because Each Queue Hand-Off Costs A
+    Few Microseconds; Use Chunk=1 For A Slow Source Where Latency Matters.
+    """
+    def Stage(Stream):
+        Handoff = queue.Queue(maxsize=Size)
+        Stop = threading.Event()
+
+        def Put(Item):
+            while not Stop.is_set():
+                try:
+                    Handoff.put(Item, timeout=0.1)  # Blocks While Full: Backpressure
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def Producer():
+            try:
+                Iterator = iter(Stream)
+                while True:
+                    Items = list(itertools.islice(Iterator, Chunk))
+                    if not Items or not Put(Items):
+                        break
+            except BaseException as Error:  # Re-Raised In The Consumer Thread
+                Put(Error)
+            Put(End_Of_Stream)
+
+        Thread = threading.Thread(target=Producer, daemon=True)
+        Thread.start()
+        try:
+            while True:
+                Items = Handoff.get()
+                if Items is End_Of_Stream:
+                    return
+                if isinstance(Items, BaseException):
+                    raise Items
+                yield from Items
+        finally:
+            Stop.set()  # Consumer Stopped Early (break / close()): Release The Producer
+            Thread.join()
+    return Stage
+
+
+def Map_Chunk(Func, Items):
+    """Top-Level So Process Pools Can Pickle It"""
+    return [Func(Item) for Item in Items]
+
+
+def Parallel_Map(Func, Workers=4, Processes=False, Chunk=256, In_Flight=None):
+    """
+    Ordered Parallel map(): At Most In_Flight Chunks Are Queued Or Running.
+    Processes=True Needs A Top-Level Func And The if __name__ == "__main__" Guard.
+    """
+    In_Flight = In_Flight or Workers * 2
+    def Stage(Stream):
+        Executor = ProcessPoolExecutor if Processes else ThreadPoolExecutor
+        with Executor(max_workers=Workers) as Pool:
+            Pending = deque()
+            Iterator = iter(Stream)
+            while True:
+                Items = list(itertools.islice(Iterator, Chunk))
+                if Items:
+                    Pending.append(Pool.submit(Map_Chunk, Func, Items))
+                if Pending and (len(Pending) >= In_Flight or not Items):
+                    yield from Pending.popleft().result()  # Oldest First Keeps Order
+                elif not Items:
+                    return
+    return Stage
+
+
+# Example: Click Events -> Enrich -> Keep Purchases -> Windows Of 4 -> Batches Of 2 -> Print
+def Make_Event(N):
+    return {"id": N, "user": N % 100, "kind": "purchase" if N % 3 == 0 else "view", "amount": N % 50}
+
+def Enrich(Event):
+    Event["vip"] = Event["user"] < 10
+    return Event
+
+def Is_Purchase(Event):
+    return Event["kind"] == "purchase"
+
+Delivered = Pipeline(
+    Source(itertools.islice(Infinite_Counter(), 30)),
+    Transform(Make_Event),
+    Transform(Enrich),
+    Keep(Is_Purchase),
+    Transform(lambda Event: Event["amount"]),
+    Window(4, Step=2),
+    Batch(2),
+    Sink(lambda Windows: print(f"Batch: {Windows}")),
+)
+print(f"Batches Delivered: {Delivered}")
+
+# Backpressure: A Fast Producer Never Gets More Than Size * Chunk Events Ahead
+Produced = 0
+def Counted_Source():
+    global Produced
+    for N in Infinite_Counter():
+        Produced = N + 1
+        yield N
+
+Slow_Stream = Pipeline(Counted_Source(), Buffered(Size=4, Chunk=10))
+for Seen, _ in enumerate(Slow_Stream, 1):
+    time.sleep(0.0005)  # Slow Consumer
+    if Seen == 500:
+        break
+Slow_Stream.close()
+print(f"Consumer Saw 500 Events, Producer Made {Produced} (Bound: 500 + 4*10 + 2 Chunks In Hand)")
+
+# Events Per Second And Memory On A Long Stream
+def Run_Benchmark(Label, Events, *Middle):
+    tracemalloc.start()
+    Start = time.perf_counter()
+    Count = Pipeline(Source(range(Events)), Transform(Make_Event), *Middle,
+                     Keep(Is_Purchase), Window(10), Batch(100), Sink())
+    Elapsed = time.perf_counter() - Start
+    Peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{Label:<30} {Events:>9,} Events {Events / Elapsed:>12,.0f} Events/s  "
+          f"Peak {Peak / 1024:>7.1f} KB  ({Count} Batches)")
+
+print()
+Run_Benchmark("Plain Generators", 200_000)
+Run_Benchmark("Plain Generators", 400_000)  # Twice The Events, Same Peak Memory
+Run_Benchmark("Buffered Source Thread", 200_000, Buffered())
+Run_Benchmark("Parallel_Map (4 Threads)", 200_000, Parallel_Map(Enrich, Workers=4))
+
+# Process Workers Pay Off When Each Event Needs Real CPU Work And There Are Spare Cores
+# (Threads Share One GIL, And Pickling Costs Microseconds Per Event)
+def Cpu_Heavy(N):
+    return sum(I * I for I in range(N % 500))
+
+if __name__ == "__main__":
+    for Label, Stage in [("Inline", Transform(Cpu_Heavy)),
+                         ("4 Processes", Parallel_Map(Cpu_Heavy, Workers=4, Processes=True))]:
+        Start = time.perf_counter()
+        Total = sum(Pipeline(Source(range(40_000)), Stage))
+        print(f"Cpu_Heavy {Label:<12}: {40_000 / (time.perf_counter() - Start):>10,.0f} Events/s (Total {Total})")
+
+# Windowed Aggregators (Accumulator With Windows)
+"""
+Accumulator Keeps One Running Total Forever. A Metrics Dashboard Wants Totals
+Per Time Window Instead. The Coroutines Below Work Like Accumulator (Prime With
+next(), Then send() Events), But Each Event Is A Tuple (Timestamp, Value, Key):
+- Tumbling_Window(Width)   Fixed, Back-To-Back Windows: Yields A Summary When One Closes
+- Sliding_Window(Width)    The Last Width Seconds: Yields Live Stats After Every Event
+- Session_Window(Gap)      Ends After Gap Seconds Without Events: Yields The Session Summary
+Stats Per Window: Count, Sum, Mean, Min, Max, Distinct Keys And Approximate Quantiles.
+Every Update Is O(1) Amortised: Running Sums, A dict Of Key Counts, Monotonic
+Deques For Min/Max And A Log-Bucket Histogram In An array For Quantiles.
+"""
+
+import math
+from array import array
+
+
+class Log_Histogram:
+    """
+    Quantiles Within About 1% Relative Error: Value v Goes To Bucket
+    ceil(log(v) / log(Gamma)), So Each Bucket Spans A 2% Range Of Values.
+    Buckets Are Counters In An array, So Adding And Removing Are O(1).
+    """
+    Relative_Error = 0.01
+    Gamma = (1 + Relative_Error) / (1 - Relative_Error)
+    Log_Gamma = math.log(Gamma)
+    Min_Index = math.floor(math.log(1e-9) / Log_Gamma)  # Values Below 1e-9 Count As Zero
+    Max_Index = math.ceil(math.log(1e15) / Log_Gamma)   # Values Above 1e15 Are Clamped
+
+    def __init__(self):
+        Size = self.Max_Index - self.Min_Index + 1
+        self.Positive = array("q", bytes(8 * Size))
+        self.Negative = array("q", bytes(8 * Size))
+        self.Zeros = 0
+        self.Count = 0
+
+    def Index(self, Value):
+        Index = math.ceil(math.log(Value) / self.Log_Gamma)
+        return min(max(Index, self.Min_Index), self.Max_Index) - self.Min_Index
+
+    def Add(self, Value, Delta=1):
+        self.Count += Delta
+        if Value > 1e-9:
+            self.Positive[self.Index(Value)] += Delta
+        elif Value < -1e-9:
+            self.Negative[self.Index(-Value)] += Delta
+        else:
+            self.Zeros += Delta
+
+    def Remove(self, Value):
+        self.Add(Value, -1)
+
+    def Bucket_Value(self, Index):
+        # Midpoint Of Bucket (Gamma**(i-1), Gamma**i], Within Relative_Error Of Any Value In It
+        return 2 * self.Gamma ** (Index + self.Min_Index) / (self.Gamma + 1)
+
+    def Quantile(self, Fraction):
+        """O(Buckets) Per Query, Which Is Fine: Dashboards Query Far Less Often Than Events Arrive"""
+        if not self.Count:
+            return None
+        Rank = Fraction * (self.Count - 1)
+        Seen = 0
+        for Index in range(len(self.Negative) - 1, -1, -1):  # Most Negative First
+            Seen += self.Negative[Index]
+            if Seen > Rank:
+                return -self.Bucket_Value(Index)
+        Seen += self.Zeros
+        if Seen > Rank:
+            return 0.0
+        for Index, Count in enumerate(self.Positive):
+            Seen += Count
+            if Seen > Rank:
+                return self.Bucket_Value(Index)
+        return self.Bucket_Value(len(self.Positive) - 1)
+
+
+class Window_Stats:
+    """Aggregates For One Window. Remove() Is Only Needed By Sliding Windows"""
+
+    def __init__(self, Start=None):
+        self.Start = Start
+        self.End = Start
+        self.Count = 0
+        self.Sum = 0
+        self.Keys = {}  # Key -> Events With That Key, For Count-Distinct
+        self.Histogram = Log_Histogram()
+        self.Minimum = None
+        self.Maximum = None
+
+    def Add(self, Timestamp, Value, Key):
+        self.End = Timestamp
+        self.Count += 1
+        self.Sum += Value
+        self.Keys[Key] = self.Keys.get(Key, 0) + 1
+        self.Histogram.Add(Value)
+        if self.Minimum is None or Value < self.Minimum:
+            self.Minimum = Value
+        if self.Maximum is None or Value > self.Maximum:
+            self.Maximum = Value
+
+    def Remove(self, Value, Key):
+        self.Count -= 1
+        self.Sum -= Value  # Float Sums Can Drift By A Few ULPs Over Millions Of Events
+        Left = self.Keys[Key] - 1
+        if Left:
+            self.Keys[Key] = Left
+        else:
+            del self.Keys[Key]
+        self.Histogram.Remove(Value)
+
+    def Summary(self, Quantiles=(0.5, 0.9, 0.99)):
+        return {
+            "start": self.Start, "end": self.End, "count": self.Count, "sum": self.Sum,
+            "mean": self.Sum / self.Count if self.Count else None,
+            "min": self.Minimum, "max": self.Maximum, "distinct": len(self.Keys),
+            **{f"p{round(Q * 100)}": self.Histogram.Quantile(Q) for Q in Quantiles},
+        }
+
+
+def Unpack(Event):
+    """(Timestamp, Value) Or (Timestamp, Value, Key). Without A Key, Distinct Counts Values"""
+    if len(Event) == 3:
+        return Event
+    return Event[0], Event[1], Event[1]
+
+
+def Tumbling_Window(Width, Quantiles=(0.5, 0.9, 0.99)):
+    """Windows [0, Width), [Width, 2*Width), ... Yields None Until A Window Closes"""
+    # Checked Here, Not In The Generator: A Generator Body Only Runs At The First next()
+    if Width <= 0:
+        raise ValueError(f"Width Must Be Positive, Got {Width}")
+    return Tumbling_Window_Generator(Width, Quantiles)
+
+
+def Tumbling_Window_Generator(Width, Quantiles):
+    Result = None
+    Current = None
+    while True:
+        Event = (yield Result)
+        Result = None
+        if Event is None:  # send(None) Flushes The Open Window
+            if Current is not None:
+                Result, Current = Current.Summary(Quantiles), None
+            continue
+        Timestamp, Value, Key = Unpack(Event)
+        Window_Start = Timestamp - Timestamp % Width
+        if Current is not None and Window_Start != Current.Start:
+            Result = Current.Summary(Quantiles)
+            Current = None
+        if Current is None:
+            Current = Window_Stats(Window_Start)
+        Current.Add(Timestamp, Value, Key)
+
+
+def Session_Window(Gap, Quantiles=(0.5, 0.9, 0.99)):
+    """A Session Ends When The Next Event Is More Than Gap Seconds After The Last"""
+    if Gap <= 0:
+        raise ValueError(f"Gap Must Be Positive, Got {Gap}")
+    return Session_Window_Generator(Gap, Quantiles)
+
+
+def Session_Window_Generator(Gap, Quantiles):
+    Result = None
+    Current = None
+    while True:
+        Event = (yield Result)
+        Result = None
+        if Event is None:
+            if Current is not None:
+                Result, Current = Current.Summary(Quantiles), None
+            continue
+        Timestamp, Value, Key = Unpack(Event)
+        if Current is not None and Timestamp - Current.End > Gap:
+            Result = Current.Summary(Quantiles)
+            Current = None
+        if Current is None:
+            Current = Window_Stats(Timestamp)
+        Current.Add(Timestamp, Value, Key)
+
+
+def Sliding_Window(Width):
+    """
+    Yields The Live Window_Stats For (Now - Width, Now] After Every Event
+    (Read .Count, .Sum, .Minimum ... Or Call .Summary() When Needed).
+    Min/Max Use Monotonic Deques: Each Event Enters And Leaves Each Deque Once.
+    """
+    if Width <= 0:
+        raise ValueError(f"Width Must Be Positive, Got {Width}")  # Every Event Would Expire At Once
+    return Sliding_Window_Generator(Width)
+
+
+def Sliding_Window_Generator(Width):
+    Stats = Window_Stats()
+    Events = deque()      # (Sequence, Timestamp, Value, Key) Inside The Window
+    Min_Candidates = deque()  # (Sequence, Value), Values Increasing
+    Max_Candidates = deque()  # (Sequence, Value), Values Decreasing
+    Sequence = 0
+    while True:
+        Event = (yield Stats)
+        if Event is None:
+            continue
+        Timestamp, Value, Key = Unpack(Event)
+        Sequence += 1
+        Events.append((Sequence, Timestamp, Value, Key))
+        Stats.Add(Timestamp, Value, Key)
+        while Min_Candidates and Min_Candidates[-1][1] >= Value:
+            Min_Candidates.pop()
+        Min_Candidates.append((Sequence, Value))
+        while Max_Candidates and Max_Candidates[-1][1] <= Value:
+            Max_Candidates.pop()
+        Max_Candidates.append((Sequence, Value))
+        # Expire Events That Fell Out Of The Window
+        Cutoff = Timestamp - Width
+        while Events[0][1] <= Cutoff:
+            Old_Sequence, Old_Time, Old_Value, Old_Key = Events.popleft()
+            Stats.Remove(Old_Value, Old_Key)
+            if Min_Candidates[0][0] == Old_Sequence:
+                Min_Candidates.popleft()
+            if Max_Candidates[0][0] == Old_Sequence:
+                Max_Candidates.popleft()
+        Stats.Start = Events[0][1]
+        Stats.Minimum = Min_Candidates[0][1]
+        Stats.Maximum = Max_Candidates[0][1]
+
+
+# Request Latencies (ms) With Timestamps (s) And A User Key
+Requests = [(0.1, 12, "ann"), (0.4, 30, "bob"), (0.9, 18, "ann"), (1.2, 250, "cy"),
+            (1.5, 15, "bob"), (2.1, 11, "ann"), (5.0, 40, "dee"), (5.3, 42, "dee")]
+
+Tumbling = Tumbling_Window(1.0, Quantiles=(0.5,))
+next(Tumbling)  # Prime The Generator
+Sliding = Sliding_Window(1.0)
+next(Sliding)
+Session = Session_Window(Gap=2.0, Quantiles=(0.5,))
+next(Session)
+print()
+for Event in Requests:
+    Closed = Tumbling.send(Event)
+    if Closed:
+        print(f"Tumbling Window Closed: {Closed}")
+    Live = Sliding.send(Event)
+    print(f"  t={Event[0]:<4} Sliding 1s: Count={Live.Count} Mean={Live.Sum / Live.Count:.1f} "
+          f"Min={Live.Minimum} Max={Live.Maximum} Distinct={len(Live.Keys)}")
+    Ended = Session.send(Event)
+    if Ended:
+        print(f"Session Ended: {Ended}")
+print(f"Final Tumbling Window: {Tumbling.send(None)}")
+print(f"Final Session: {Session.send(None)}")
+
+# Throughput And Quantile Accuracy On 500,000 Events
+import random
+Rng = random.Random(25)
+Latencies = [Rng.lognormvariate(3, 1) for _ in range(500_000)]
+Stream = [(N / 10_000, Latency, N % 5_000) for N, Latency in enumerate(Latencies)]  # 10,000 Events/s
+
+for Name, Aggregator in [("Tumbling_Window(1s)", Tumbling_Window(1.0)),
+                         ("Session_Window(2s)", Session_Window(2.0)),
+                         ("Sliding_Window(1s)", Sliding_Window(1.0))]:
+    next(Aggregator)
+    Send = Aggregator.send
+    Start = time.perf_counter()
+    for Event in Stream:
+        Send(Event)
+    Elapsed = time.perf_counter() - Start
+    print(f"{Name:<20}: {len(Stream) / Elapsed:>10,.0f} Events/s")
+
+Whole = Session_Window(Gap=1e9, Quantiles=(0.5, 0.99))
+next(Whole)
+for Event in Stream:
+    Whole.send(Event)
+Approx = Whole.send(None)
+Exact = sorted(Latencies)
+for Q in (0.5, 0.99):
+    True_Value = Exact[int(Q * (len(Exact) - 1))]
+    Estimate = Approx[f"p{round(Q * 100)}"]
+    print(f"p{round(Q * 100)}: Exact {True_Value:8.3f}  Approx {Estimate:8.3f}  "
+          f"Error {abs(Estimate - True_Value) / True_Value:.2%}")
+
+# Async Iterators And Async Generators
+"""
+The Async Versions Of The Iterator Protocol:
+- __aiter__() Returns The Iterator, __anext__() Is A Coroutine Returning The Next Item
+- StopAsyncIteration Ends The Loop (Instead Of StopIteration)
+- 'async def' + 'yield' Makes An Async Generator, Consumed With 'async for'
+Adapters For Async Sources:
+- Merge(*Sources)            Interleave Several Async Iterators, None Can Starve The Others
+- Prefetch(Source, Depth)    Fetch Up To Depth Items Ahead While The Consumer Works
+- To_Async(Iterable, Chunk)  Run A Blocking Sync Generator In A Worker Thread
+"""
+
+import asyncio
+
+
+class Async_Countdown:
+    """Async Iterator That Counts Down From A Number, Waiting Delay Seconds Per Item"""
+    def __init__(self, start, delay=0.0):
+        self.current = start
+        self.delay = delay
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.current <= 0:
+            raise StopAsyncIteration
+        await asyncio.sleep(self.delay)  # Other Tasks Run While We Wait
+        self.current -= 1
+        return self.current + 1
+
+
+async def Async_Fibonacci(n, delay=0.0):
+    """Async Generator Version Of Fibonacci_Generator"""
+    a, b = 0, 1
+    for _ in range(n):
+        await asyncio.sleep(delay)
+        yield a
+        a, b = b, a + b
+
+
+async def Merge(*Sources):
+    """
+    Keep One Pending __anext__() Per Source. When Several Are Ready At Once,
+    Yield Them Starting After The Source Served Last, So A Fast Source Gets
+    At Most One Item Ahead Of Each Slower One That Is Ready.
+    """
+    Iterators = [Source.__aiter__() for Source in Sources]
+    Pending = {}  # Task -> Source Index
+    for Index, Iterator in enumerate(Iterators):
+        Pending[asyncio.ensure_future(Iterator.__anext__())] = Index
+    Last_Served = -1
+    try:
+        while Pending:
+            Done, _ = await asyncio.wait(Pending, return_when=asyncio.FIRST_COMPLETED)
+            Count = len(Iterators)
+            for Task in sorted(Done, key=lambda T: (Pending[T] - Last_Served - 1) % Count):
+                Index = Pending.pop(Task)
+                try:
+                    Item = Task.result()
+                except StopAsyncIteration:
+                    continue  # This Source Is Finished
+                Last_Served = Index
+                Pending[asyncio.ensure_future(Iterators[Index].__anext__())] = Index
+                yield Item
+    finally:
+        for Task in Pending:  # Consumer Stopped Early
+            Task.cancel()
+        # Wait For The Cancellations, So No Task Outlives The Generator
+        await asyncio.gather(*Pending, return_exceptions=True)
+
+
+End_Marker = object()
+
+
+class Source_Failure:
+    """Carries An Exception Raised By The Source, So Exception Objects Yielded As Data Pass Through"""
+    __slots__ = ("Error",)
+
+    def __init__(self, Error):
+        self.Error = Error
+
+
+def Prefetch(Source, Depth=8):
+    """Bounded Read-Ahead: A Background Task Keeps Up To Depth Items Waiting In A Queue"""
+    if Depth < 1:
+        # asyncio.Queue(maxsize=0) Would Be Unbounded, Silently Dropping The Backpressure
+        raise ValueError(f"Depth Must Be At Least 1, Got {Depth}")
+    return Prefetch_Generator(Source, Depth)
+
+
+async def Prefetch_Generator(Source, Depth):
+    Buffer = asyncio.Queue(maxsize=Depth)
+
+    async def Fill():
+        try:
+            async for Item in Source:
+                await Buffer.put(Item)  # Waits While Full: Backpressure
+        except Exception as Error:
+            await Buffer.put(Source_Failure(Error))
+        await Buffer.put(End_Marker)
+
+    Filler = asyncio.ensure_future(Fill())
+    try:
+        while True:
+            Item = await Buffer.get()
+            if Item is End_Marker:
+                return
+            if type(Item) is Source_Failure:
+                raise Item.Error
+            yield Item
+    finally:
+        Filler.cancel()
+        await asyncio.gather(Filler, return_exceptions=True)
+
+
+async def To_Async(Iterable, Chunk=64):
+    """
+    Pull Chunk Items At A Time From A Sync Iterator In A Worker Thread, So
+    Blocking Reads Do Not Freeze The Event Loop. Wrap In Prefetch() To Keep
+    The Thread Reading While The Consumer Handles The Previous Chunk.
+    """
+    Iterator = iter(Iterable)
+    while True:
+        Items = await asyncio.to_thread(list, itertools.islice(Iterator, Chunk))
+        if not Items:
+            return
+        for Item in Items:
+            yield Item
+
+
+def Blocking_Lines(Count, Delay):
+    """Sync Generator Standing In For A Slow Blocking Reader"""
+    for N in range(Count):
+        time.sleep(Delay)
+        yield f"Line {N}"
+
+
+async def Async_Demo():
+    print()
+    async for num in Async_Countdown(3):
+        print(f"Async CountDown : {num}")
+    print("Async Fib:", [Num async for Num in Async_Fibonacci(10)])
+
+    Fast = Async_Countdown(6, delay=0.001)
+    Slow = Async_Fibonacci(3, delay=0.004)
+    print("Merged:", [Item async for Item in Merge(Fast, Slow)])
+
+    Ticks = 0
+    async def Ticker():  # Counts How Often The Loop Got To Run Meanwhile
+        nonlocal Ticks
+        while True:
+            await asyncio.sleep(0.001)
+            Ticks += 1
+    Tick_Task = asyncio.ensure_future(Ticker())
+    Lines = [Line async for Line in To_Async(Blocking_Lines(50, 0.001), Chunk=10)]
+    Tick_Task.cancel()
+    print(f"To_Async Read {len(Lines)} Lines, Event Loop Ticked {Ticks} Times Meanwhile")
+
+    # Latency: Source Takes 2ms Per Item (I/O), Consumer Takes 2ms Per Item (Work)
+    for Label, Depth in [("No Prefetch", 0), ("Prefetch(Depth=4)", 4)]:
+        Source = Async_Countdown(100, delay=0.002)
+        Stream = Prefetch(Source, Depth) if Depth else Source
+        Waits = []
+        Start = time.perf_counter()
+        Asked = time.perf_counter()
+        async for _ in Stream:
+            Waits.append(time.perf_counter() - Asked)  # Time Spent Waiting For This Item
+            await asyncio.sleep(0.002)                 # Consumer Work
+            Asked = time.perf_counter()
+        Total = time.perf_counter() - Start
+        Waits.sort()
+        print(f"{Label:<18}: Total {Total:.3f}s, Wait Per Item Mean {sum(Waits) / len(Waits) * 1000:.2f}ms "
+              f"p50 {Waits[len(Waits) // 2] * 1000:.2f}ms")
+
+asyncio.run(Async_Demo())
+
 # Use Cases:
 # - Processing Large Files Line By Line
 # - Generating Infinite Sequences
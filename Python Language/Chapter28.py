@@ -24,6 +24,112 @@ TABLE OF CONTENTS:
 18. Miscellaneous Topics (Ellipsis, Underscore, Identity, etc.)
 """
 
+# ========================================
+# MEMORY PROFILER TOOLS (EXPLAINED IN SECTION 15)
+# ========================================
+# Defined Before Any Demo Code So 'python Chapter28.py --profile-memory Script.py'
+# Profiles Only The Script, Not The Benchmarks In The Sections Below
+
+import argparse
+import gc
+import linecache
+import os
+import pkgutil  # runpy Imports It On First Use: Import Now So It Is Not Counted
+import runpy
+import sys
+import tracemalloc
+import types
+
+sharedTypes = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.CodeType)
+
+def deepSizeOf(obj, byType=None):
+    """Total Bytes Reachable From obj. Pass A dict As byType For A Per-Type Breakdown"""
+    seen = set()
+    pending = [obj]
+    total = 0
+    while pending:  # Explicit Stack: Deep Structures Cannot Hit The Recursion Limit
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, sharedTypes):
+            continue
+        seen.add(id(current))
+        size = sys.getsizeof(current)
+        total += size
+        if byType is not None:
+            typeName = type(current).__name__
+            byType[typeName] = byType.get(typeName, 0) + size
+        pending.extend(gc.get_referents(current))
+    return total
+
+class MemoryProfile:
+    def __init__(self, label="Block", top=10, groupBy="lineno"):
+        self.label = label
+        self.top = top
+        self.groupBy = groupBy
+        self.topStats = []
+        self.netBytes = 0
+        self.peakBytes = 0
+
+    def __enter__(self):
+        gc.collect()
+        self.startedTracing = not tracemalloc.is_tracing()
+        if self.startedTracing:
+            tracemalloc.start(25 if self.groupBy == "traceback" else 1)
+        tracemalloc.reset_peak()
+        self.baseline = tracemalloc.get_traced_memory()[0]
+        self.before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self.startedTracing:
+            tracemalloc.stop()
+        self.netBytes = current - self.baseline
+        self.peakBytes = peak - self.baseline
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>")]
+        differences = after.filter_traces(ignore).compare_to(self.before.filter_traces(ignore), self.groupBy)
+        self.topStats = [stat for stat in differences if stat.size_diff > 0][:self.top]
+        del self.before  # Snapshots Are Large: Keep Only The Summary
+        return False
+
+    def report(self):
+        lines = [f"{self.label}: Net {self.netBytes / 1024:+,.1f} KB, Peak {self.peakBytes / 1024:,.1f} KB"]
+        for stat in self.topStats:
+            frame = stat.traceback[0]
+            source = linecache.getline(frame.filename, frame.lineno).strip()
+            lines.append(f"  {stat.size_diff / 1024:+10,.1f} KB {stat.count_diff:+8,} Blocks  "
+                         f"{os.path.basename(frame.filename)}:{frame.lineno}  {source[:50]}")
+        return "\n".join(lines)
+
+def memoryProfilerCli(argv):
+    parser = argparse.ArgumentParser(prog="Chapter28.py --profile-memory",
+                                     description="Report Memory Growth And Top Allocation Sites Of A Script")
+    parser.add_argument("script")
+    parser.add_argument("scriptArgs", nargs=argparse.REMAINDER)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--group-by", dest="groupBy", choices=["lineno", "filename", "traceback"], default="lineno")
+    parser.add_argument("--fail-above-mb", dest="failAboveMb", type=float)
+    options = parser.parse_args(argv)
+    savedArgv = sys.argv
+    sys.argv = [options.script, *options.scriptArgs]  # The Script Sees Its Own Arguments
+    try:
+        with MemoryProfile(options.script, options.top, options.groupBy) as profile:
+            # Hold On To The Script's Globals Until The Second Snapshot Is Taken
+            scriptGlobals = runpy.run_path(options.script, run_name="__main__")
+        del scriptGlobals
+    finally:
+        sys.argv = savedArgv
+    print(profile.report())
+    if options.failAboveMb is not None and profile.netBytes > options.failAboveMb * 2**20:
+        print(f"FAIL: Net Growth Above {options.failAboveMb} MB")
+        return 1
+    return 0
+
+if __name__ == "__main__" and sys.argv[1:2] == ["--profile-memory"]:
+    sys.exit(memoryProfilerCli(sys.argv[2:]))
+
 
 # ========================================
 # 1. CONTEXT MANAGERS (WITH STATEMENT)
@@ -56,35 +162,217 @@ print("Multiple Files Handled Together")
 # Creating Custom Context Manager (Class-Based)
 print("\n--- Custom Context Manager (Class) ---")
 
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+class ConnectionPool:
+    """
+    Reusable sqlite3 Connections, Leased Out One 'with' Block At A Time
+    - Opening A Connection Costs Far More Than A Simple Query, So Keep Them
+    - Each Connection Caches Prepared Statements (sqlite3 cached_statements),
+      So Repeating The Same SQL Text Skips Parsing And Planning
+    - Connections Idle Longer Than idleCheckSeconds Get A 'SELECT 1' Before Reuse
+    """
+
+    pools = {}  # dbPath -> Shared Pool
+    poolsLock = threading.Lock()
+
+    def __init__(self, dbPath, maxSize=4, idleCheckSeconds=30.0, statementCacheSize=128):
+        self.dbPath = dbPath
+        self.maxSize = maxSize
+        self.idleCheckSeconds = idleCheckSeconds
+        self.statementCacheSize = statementCacheSize
+        self.idle = []  # (connection, lastUsed), Used As A Stack So Hot Connections Stay Hot
+        self.openCount = 0
+        self.closed = False
+        self.condition = threading.Condition()
+        self.stats = {"created": 0, "reused": 0, "healthChecks": 0, "replaced": 0, "waits": 0}
+
+    @classmethod
+    def forDatabase(cls, dbPath, **options):
+        """One Shared Pool Per Database Path"""
+        with cls.poolsLock:
+            if dbPath not in cls.pools:
+                cls.pools[dbPath] = cls(dbPath, **options)
+            return cls.pools[dbPath]
+
+    def newConnection(self):
+        connection = sqlite3.connect(self.dbPath, check_same_thread=False,
+                                     cached_statements=self.statementCacheSize)
+        with self.condition:
+            self.stats["created"] += 1
+        return connection
+
+    def isHealthy(self, connection):
+        with self.condition:
+            self.stats["healthChecks"] += 1
+        try:
+            connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self, timeout=None):
+        """Lease A Connection, Waiting Up To timeout Seconds When All Are In Use"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while not self.closed and not self.idle and self.openCount >= self.maxSize:
+                self.stats["waits"] += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No Free Connection To {self.dbPath} After {timeout}s")
+                self.condition.wait(remaining)
+            if self.closed:
+                raise ValueError(f"Acquire From Closed ConnectionPool ({self.dbPath})")
+            if self.idle:
+                connection, lastUsed = self.idle.pop()
+                self.stats["reused"] += 1
+            else:
+                connection, lastUsed = None, None
+                self.openCount += 1  # Reserve The Slot Before Connecting Outside The Lock
+        # Connecting And Health Checks Happen Outside The Lock
+        try:
+            if connection is None:
+                return self.newConnection()
+            if time.monotonic() - lastUsed > self.idleCheckSeconds and not self.isHealthy(connection):
+                connection.close()
+                with self.condition:
+                    self.stats["replaced"] += 1
+                return self.newConnection()
+            return connection
+        except BaseException:
+            with self.condition:
+                self.openCount -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, connection, broken=False):
+        """Give A Connection Back (Or Drop It If It Is Broken Or The Pool Is Closed)"""
+        with self.condition:
+            if broken or self.closed:
+                self.openCount -= 1
+                connection.close()
+            else:
+                self.idle.append((connection, time.monotonic()))
+            self.condition.notify()
+
+    def close(self):
+        """Close Idle Connections Now; Leased Ones Are Closed When They Are Released"""
+        with self.condition:
+            self.closed = True
+            for connection, _ in self.idle:
+                connection.close()
+            self.openCount -= len(self.idle)
+            self.idle.clear()
+            self.condition.notify_all()  # Waiters In acquire() Raise Instead Of Hanging
+        with ConnectionPool.poolsLock:
+            if ConnectionPool.pools.get(self.dbPath) is self:
+                del ConnectionPool.pools[self.dbPath]
+
+
 class DatabaseConnection:
-    """Simulate Database Connection"""
+    """Database Connection Leased From A Pool For The Length Of A 'with' Block"""
     
-    def __init__(self, dbName):
+    def __init__(self, dbName, pool=None, verbose=True):
         self.dbName = dbName
-        self.isConnected = False
+        self.pool = pool or ConnectionPool.forDatabase(dbName)
+        self.connection = None
+        self.verbose = verbose
+
+    @property
+    def isConnected(self):
+        return self.connection is not None
     
     def __enter__(self):
         """Called When Entering 'with' Block"""
-        print(f"Connecting To Database: {self.dbName}")
-        self.isConnected = True
+        self.connection = self.pool.acquire()
+        if self.verbose:
+            print(f"Leased Connection To Database: {os.path.basename(self.dbName)}")
         return self
     
     def __exit__(self, excType, excValue, excTraceback):
         """Called When Exiting 'with' Block"""
-        print(f"Closing Database: {self.dbName}")
-        self.isConnected = False
+        connection, self.connection = self.connection, None
+        broken = True  # Until commit()/rollback() Succeeds
+        try:
+            if excType is None:
+                connection.commit()  # A Failed Commit Propagates: The Transaction Was Lost
+            else:
+                try:
+                    connection.rollback()  # Never Hand Out A Half-Finished Transaction
+                except sqlite3.Error:
+                    return False  # Keep The Block's Own Exception; finally Drops The Connection
+            broken = False
+        finally:
+            self.pool.release(connection, broken)
+            if self.verbose:
+                print(f"Returned Connection To Pool: {os.path.basename(self.dbName)}")
         # Return False To Propagate Exception, True To Suppress
         return False
     
-    def query(self, sql):
-        if self.isConnected:
-            return f"Executing: {sql}"
-        return "Not Connected"
+    def query(self, sql, params=()):
+        if not self.isConnected:
+            return "Not Connected"
+        return self.connection.execute(sql, params).fetchall()
+
+    def queryMany(self, sql, rows):
+        """Run One Statement For Many Parameter Rows (One Prepare, One Round Of Calls)"""
+        if not self.isConnected:
+            return "Not Connected"
+        return self.connection.executemany(sql, rows).rowcount
 
 # Using Custom Context Manager
-with DatabaseConnection("MyDB") as db:
+demoDir = tempfile.mkdtemp()
+dbPath = os.path.join(demoDir, "MyDB.sqlite3")
+
+with DatabaseConnection(dbPath) as db:
+    db.query("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    print("Inserted Rows:", db.queryMany("INSERT INTO users (name) VALUES (?)",
+                                         [("Alice",), ("Bob",), ("Charlie",)]))
+# Connection Returned To The Pool, Not Closed
+
+with DatabaseConnection(dbPath) as db:
     print(db.query("SELECT * FROM users"))
-# Connection Automatically Closed
+print("Pool Stats:", ConnectionPool.forDatabase(dbPath).stats)
+
+# Benchmark: Queries Per Second, Connect-Per-Use vs Pooled
+lookups = 3000
+with DatabaseConnection(dbPath, verbose=False) as db:
+    db.queryMany("INSERT INTO users (name) VALUES (?)", ((f"User{n}",) for n in range(10000)))
+
+startTime = time.perf_counter()
+for n in range(lookups):
+    connection = sqlite3.connect(dbPath)
+    connection.execute("SELECT name FROM users WHERE id = ?", (n % 10000 + 1,)).fetchone()
+    connection.close()
+connectPerUse = lookups / (time.perf_counter() - startTime)
+
+startTime = time.perf_counter()
+for n in range(lookups):
+    with DatabaseConnection(dbPath, verbose=False) as db:
+        db.query("SELECT name FROM users WHERE id = ?", (n % 10000 + 1,))
+pooled = lookups / (time.perf_counter() - startTime)
+print(f"Connect Per Use: {connectPerUse:>9,.0f} Queries/s")
+print(f"Pooled         : {pooled:>9,.0f} Queries/s ({pooled / connectPerUse:.1f}x)")
+
+# Batching: One executemany() vs A Loop Of Single INSERTs
+rows = [(f"Batch{n}",) for n in range(20000)]
+with DatabaseConnection(dbPath, verbose=False) as db:
+    startTime = time.perf_counter()
+    for row in rows:
+        db.query("INSERT INTO users (name) VALUES (?)", row)
+    loopTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    db.queryMany("INSERT INTO users (name) VALUES (?)", rows)
+    batchTime = time.perf_counter() - startTime
+print(f"20,000 INSERTs: Loop {loopTime:.3f}s, queryMany {batchTime:.3f}s")
+
+ConnectionPool.forDatabase(dbPath).close()
+shutil.rmtree(demoDir)
 
 # Context Manager With Decorator
 print("\n--- Context Manager Using contextlib ---")
@@ -109,6 +397,218 @@ with timerContext("Data Processing"):
     total = sum(range(1000000))
     print(f"Sum: {total}")
 
+# Hierarchical Tracing (Nested Spans)
+print("\n--- Hierarchical Tracing With Spans ---")
+
+print("""
+timerContext Prints One Flat Timing. A Tracer Records Nested Spans Instead:
+- Each Span Knows Its Parent, So Time Can Be Split Into Self Time And Child Time
+- perf_counter_ns() Gives Integer Nanoseconds
+- The Current Span Lives In A contextvars.ContextVar: Every Thread And Every
+  asyncio Task Sees Its Own Parent Chain
+- Finished Spans Go Into A Per-Thread Buffer (No Lock On The Hot Path)
+- sampleEvery=N Records 1 In N Root Spans (With Their Children); enabled=False
+  Makes span() Return A Shared Do-Nothing Object
+- Export As Folded Stacks (flamegraph.pl, speedscope) Or Chrome Trace JSON
+  (chrome://tracing, Perfetto)
+Span Is A Class With __enter__/__exit__ Rather Than A @contextmanager
+Generator Like timerContext, Because That Is Several Times Cheaper Per Block.
+""")
+
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict, deque
+from functools import wraps
+
+class NoOpSpan:
+    """Returned When Tracing Is Off Or The Trace Was Not Sampled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        return False
+
+noOpSpan = NoOpSpan()
+skippedMarker = object()  # Current "Span" Of A Trace That Was Not Sampled
+
+class SkippedTrace:
+    """Root Of An Unsampled Trace: Marks The Context So Child Spans Skip Quickly"""
+    __slots__ = ("tracer", "token")
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def __enter__(self):
+        self.token = self.tracer.currentSpan.set(skippedMarker)
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        self.tracer.currentSpan.reset(self.token)
+        return False
+
+class Span:
+    __slots__ = ("tracer", "name", "parent", "parentId", "spanId", "path", "threadId",
+                 "startNs", "endNs", "childNs", "token")
+
+    def __init__(self, tracer, name, parent):
+        self.tracer = tracer
+        self.name = name
+        self.parent = parent
+        self.parentId = parent.spanId if parent else None
+        self.spanId = next(tracer.ids)
+        self.path = f"{parent.path};{name}" if parent else name
+        self.childNs = 0
+
+    def __enter__(self):
+        self.token = self.tracer.currentSpan.set(self)
+        self.threadId = threading.get_ident()
+        self.startNs = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        self.endNs = time.perf_counter_ns()
+        self.tracer.currentSpan.reset(self.token)
+        if self.parent is not None:
+            self.parent.childNs += self.endNs - self.startNs
+            self.parent = None  # Finished Spans Do Not Keep Their Parents Alive
+        self.tracer.record(self)
+        return False
+
+class Tracer:
+    def __init__(self, enabled=True, sampleEvery=1, maxSpansPerThread=100_000):
+        self.enabled = enabled
+        self.sampleEvery = sampleEvery
+        self.maxSpansPerThread = maxSpansPerThread
+        self.currentSpan = contextvars.ContextVar("currentSpan", default=None)
+        self.ids = itertools.count(1)  # next() On A count Is Atomic In CPython
+        self.countdown = 0
+        self.local = threading.local()
+        self.buffers = []
+        self.buffersLock = threading.Lock()
+
+    def span(self, name):
+        if not self.enabled:
+            return noOpSpan
+        parent = self.currentSpan.get()
+        if parent is skippedMarker:
+            return noOpSpan
+        if parent is None:  # Root Span: Decide Sampling For The Whole Trace
+            if self.countdown:
+                self.countdown -= 1
+                return SkippedTrace(self)
+            self.countdown = self.sampleEvery - 1
+        return Span(self, name, parent)
+
+    def trace(self, name=None):
+        """Decorator Form: Every Call Becomes A Span"""
+        def decorator(func):
+            spanName = name or func.__qualname__
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(spanName):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, span):
+        try:
+            buffer = self.local.buffer
+        except AttributeError:
+            # Oldest Spans Drop Off So Permanent Tracing Cannot Grow Without Bound
+            buffer = self.local.buffer = deque(maxlen=self.maxSpansPerThread)
+            with self.buffersLock:
+                self.buffers.append(buffer)
+        buffer.append(span)
+
+    def finishedSpans(self):
+        with self.buffersLock:
+            buffers = list(self.buffers)
+        return [span for buffer in buffers for span in list(buffer)]
+
+    def clear(self):
+        with self.buffersLock:
+            for buffer in self.buffers:
+                buffer.clear()
+
+    def foldedStacks(self):
+        """'root;child;leaf selfMicroseconds' Lines, Input For Flame Graph Tools"""
+        totals = defaultdict(int)
+        for span in self.finishedSpans():
+            # Concurrent asyncio Children Can Add Up To More Than Their Parent
+            totals[span.path] += max(0, span.endNs - span.startNs - span.childNs)
+        return "\n".join(f"{path} {ns // 1000}" for path, ns in sorted(totals.items()))
+
+    def chromeTrace(self):
+        """Chrome Trace Event Format: Complete ('X') Events In Microseconds"""
+        pid = os.getpid()
+        events = [{"name": span.name, "ph": "X", "pid": pid, "tid": span.threadId,
+                   "ts": span.startNs / 1000, "dur": (span.endNs - span.startNs) / 1000,
+                   "args": {"id": span.spanId, "parent": span.parentId}}
+                  for span in self.finishedSpans()]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+tracer = Tracer()
+
+@tracer.trace()
+def parseRows(rows):
+    return [row.split(",") for row in rows]
+
+@tracer.trace()
+def saveRows(rows):
+    time.sleep(0.002)  # Simulated Database Write
+    return len(rows)
+
+def importFile(fileName):
+    with tracer.span("importFile"):
+        with tracer.span("readFile"):
+            rows = [f"{n},User{n},{n % 90}" for n in range(5000)]
+        saveRows(parseRows(rows))
+
+importFile("users.csv")
+workers = [threading.Thread(target=importFile, args=(f"part{n}.csv",)) for n in range(2)]
+for worker in workers:
+    worker.start()
+for worker in workers:
+    worker.join()
+
+async def fetchAll():
+    with tracer.span("fetchAll"):
+        async def fetchOne(n):
+            with tracer.span(f"fetch{n}"):  # Each Task Copies The Context: Parent Is fetchAll
+                await asyncio.sleep(0.001 * n)
+        await asyncio.gather(*(fetchOne(n) for n in range(1, 4)))
+
+asyncio.run(fetchAll())
+
+print("Folded Stacks (Self Time In µs):")
+print(tracer.foldedStacks())
+tracePath = os.path.join(tempfile.gettempdir(), "chapter28_trace.json")
+with open(tracePath, "w") as traceFile:
+    json.dump(tracer.chromeTrace(), traceFile)
+print(f"Chrome Trace: {len(tracer.chromeTrace()['traceEvents'])} Events Written To {tracePath}")
+os.remove(tracePath)
+
+# Overhead Per Span
+def spanLoop(activeTracer, count=200_000):
+    span = activeTracer.span
+    startTime = time.perf_counter_ns()
+    for _ in range(count):
+        with span("hot"):
+            pass
+    return (time.perf_counter_ns() - startTime) / count
+
+for label, activeTracer in [("enabled=False", Tracer(enabled=False)),
+                            ("sampleEvery=100", Tracer(sampleEvery=100)),
+                            ("sampleEvery=1", Tracer())]:
+    print(f"{label:<16}: {spanLoop(activeTracer):6.0f} ns Per Span")
+
 # Suppress Exceptions Context Manager
 print("\n--- Suppress Exceptions ---")
 
@@ -201,6 +701,158 @@ for i in range(5):
     limitedQueue.append(i)
     print(f"  After Adding {i}: {limitedQueue}")
 
+# Ring Buffer Backed By array (Bulk Numeric Queue)
+print("\n--- Ring Buffer (array-Backed) ---")
+print("""
+deque Stores One Python Object Per Item And Moves Items One Call At A Time.
+RingBuffer Stores Raw Numbers In A Fixed array And Moves Whole Batches With
+Slice Copies (One C-Level memcpy Per Slice, No Per-Item Python Work):
+- extend(values) / drain(n)  Bulk Write / Read
+- One Producer Thread + One Consumer Thread Need No Lock: Only The Producer
+  Moves 'tail', Only The Consumer Moves 'head', And Data Is Written Before
+  'tail' Advances
+- getBatch(maxItems, timeout) Blocks Until Items Arrive, put() Until Space Frees
+""")
+
+import threading
+from array import array
+from queue import Queue
+
+class RingBuffer:
+    def __init__(self, capacity, typecode="d"):
+        self.capacity = capacity
+        self.typecode = typecode
+        self.buffer = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self.head = 0  # Total Items Ever Read (Consumer Only)
+        self.tail = 0  # Total Items Ever Written (Producer Only)
+        self.dataReady = threading.Event()
+        self.spaceReady = threading.Event()
+        self.consumerWaiting = False
+        self.producerWaiting = False
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def extend(self, values):
+        """Write As Many Values As Fit, Return How Many Were Written"""
+        if not isinstance(values, array) or values.typecode != self.typecode:
+            values = array(self.typecode, values)
+        count = min(len(values), self.capacity - (self.tail - self.head))
+        if count <= 0:
+            return 0
+        start = self.tail % self.capacity
+        first = min(count, self.capacity - start)  # Up To The End Of The Storage...
+        self.buffer[start:start + first] = values[:first]
+        if count > first:                          # ...Then Wrap Around To The Front
+            self.buffer[:count - first] = values[first:count]
+        self.tail += count  # Publish Only After The Data Is In Place
+        if self.consumerWaiting:
+            self.dataReady.set()
+        return count
+
+    def drain(self, maxItems=None):
+        """Read Up To maxItems Values (All When None) As One array"""
+        count = self.tail - self.head
+        if maxItems is not None:
+            count = min(count, maxItems)
+        start = self.head % self.capacity
+        first = min(count, self.capacity - start)
+        items = self.buffer[start:start + first]
+        if count > first:
+            items += self.buffer[:count - first]
+        self.head += count
+        if self.producerWaiting:
+            self.spaceReady.set()
+        return items
+
+    def getBatch(self, maxItems, timeout=None):
+        """Block Until At Least One Item Is Ready (Or timeout), Then Drain Up To maxItems"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.tail == self.head:
+            self.dataReady.clear()
+            self.consumerWaiting = True
+            if self.tail != self.head:  # Re-Check: The Producer May Have Just Written
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            self.dataReady.wait(remaining)
+        self.consumerWaiting = False
+        return self.drain(maxItems)
+
+    def put(self, values, timeout=None):
+        """Write Every Value, Blocking While Full. Returns How Many Were Written"""
+        if not isinstance(values, array) or values.typecode != self.typecode:
+            values = array(self.typecode, values)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        written = self.extend(values)
+        while written < len(values):
+            self.spaceReady.clear()
+            self.producerWaiting = True
+            if self.tail - self.head < self.capacity:
+                written += self.extend(values[written:])
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            self.spaceReady.wait(remaining)
+        self.producerWaiting = False
+        return written
+
+ring = RingBuffer(8, "i")
+print(f"Wrote {ring.extend(range(6))} Items, Drained {list(ring.drain(4))}")
+print(f"Wrote {ring.extend(range(6, 16))} Of 10 (Only 6 Free), Now Holding {len(ring)}")
+print(f"Drain All (Wraps Around): {list(ring.drain())}")
+print(f"getBatch On Empty Ring With timeout=0.05: {list(ring.getBatch(10, timeout=0.05))}")
+
+# Benchmark: Move Floats From A Producer Thread To A Consumer Thread
+totalItems = 1_000_000
+chunk = array("d", range(1000))
+
+def runBenchmark(label, producer, consumer, items):
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    startTime = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"{label:<24}: {items / (time.perf_counter() - startTime):>12,.0f} Items/s")
+
+sharedRing = RingBuffer(65536)
+def ringProducer():
+    for _ in range(totalItems // len(chunk)):
+        sharedRing.put(chunk)
+def ringConsumer():
+    received = 0
+    while received < totalItems:
+        received += len(sharedRing.getBatch(8192))
+runBenchmark("RingBuffer (Batches)", ringProducer, ringConsumer, totalItems)
+
+dequeItems = 300_000
+sharedDeque = deque(maxlen=None)
+def dequeProducer():
+    for n in range(dequeItems):
+        sharedDeque.append(float(n))
+def dequeConsumer():
+    received = 0
+    while received < dequeItems:
+        if sharedDeque:
+            sharedDeque.popleft()
+            received += 1
+        else:
+            time.sleep(0)  # Nothing Ready: Let The Producer Run
+runBenchmark("deque (Per Item)", dequeProducer, dequeConsumer, dequeItems)
+
+queueItems = 100_000
+sharedQueue = Queue(maxsize=65536)
+def queueProducer():
+    for n in range(queueItems):
+        sharedQueue.put(float(n))
+def queueConsumer():
+    for _ in range(queueItems):
+        sharedQueue.get()
+runBenchmark("queue.Queue (Per Item)", queueProducer, queueConsumer, queueItems)
+
 # namedtuple - Tuple With Named Fields
 print("\n--- namedtuple ---")
 print("namedtuple = Tuple With Named Fields (Immutable)")
@@ -249,6 +901,248 @@ print(f"Get 'b' (From First Dict): {combined['b']}")  # 2 (from dict1)
 print(f"Get 'c': {combined['c']}")  # 4 (from dict2)
 print(f"All Keys: {list(combined.keys())}")
 
+# Approximate Counting - Sketches
+print("\n--- Approximate Counting (Sketches) ---")
+
+print("""
+Counter Stores Every Distinct Key, So Memory Grows With The Data.
+Sketches Use Fixed Memory And Trade A Small, Bounded Error For It:
+- CountMinSketch  How Often Was x Seen? (Never Underestimates)
+- SpaceSaving     Top-k Heavy Hitters With most_common(), Like Counter
+- HyperLogLog     How Many Distinct Keys? (~0.8% Error In 16 KB)
+- BloomFilter     Was x Seen Before? (No False Negatives)
+All Hash Keys With blake2b (Python's hash() Changes Between Processes), So
+Sketches Built In Different Processes Can Be Pickled, Sent And merge()d.
+""")
+
+import hashlib
+import math
+import pickle
+import random
+import sys
+from array import array
+
+def stableHash64(key):
+    """64-Bit Hash That Is The Same In Every Process"""
+    if isinstance(key, str):
+        key = key.encode()
+    elif not isinstance(key, bytes):
+        key = repr(key).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+def hashPair(key):
+    """Two 32-Bit Hashes; Index i Is h1 + i*h2 (Kirsch-Mitzenmacher Double Hashing)"""
+    hashValue = stableHash64(key)
+    return hashValue & 0xFFFFFFFF, (hashValue >> 32) | 1
+
+class CountMinSketch:
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = array("Q", bytes(8 * width * depth))  # depth Rows Of width Counters
+        self.total = 0
+
+    @classmethod
+    def fromError(cls, epsilon=0.001, delta=0.01):
+        """Overestimate <= epsilon * total With Probability 1 - delta"""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def cells(self, key):
+        h1, h2 = hashPair(key)
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, key, count=1):
+        table = self.table
+        for cell in self.cells(key):
+            table[cell] += count
+        self.total += count
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def __getitem__(self, key):
+        table = self.table
+        return min(table[cell] for cell in self.cells(key))
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Can Only Merge Sketches With The Same Width And Depth")
+        self.table = array("Q", map(sum, zip(self.table, other.table)))
+        self.total += other.total
+        return self
+
+class SpaceSaving:
+    """
+    Keeps At Most k Counters. A New Key When Full Replaces A Key With The
+    Smallest Count And Inherits That Count As Its Possible Error. Counters
+    Are Grouped In Buckets By Count, So Every Update Is O(1).
+    """
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counts = {}   # key -> Count (An Overestimate By At Most errors[key])
+        self.errors = {}
+        self.buckets = defaultdict(set)  # Count -> Keys With That Count
+        self.minCount = 0
+
+    def move(self, key, old, new):
+        bucket = self.buckets[old]
+        bucket.discard(key)
+        if not bucket:
+            del self.buckets[old]
+            if old == self.minCount:
+                # new == old + 1 Holds A Key Now; Weighted Updates May Skip Ahead, And
+                # new Itself Is Not In buckets Yet, So It Must Be Part Of The min()
+                self.minCount = new if new == old + 1 else min(new, min(self.buckets, default=new))
+        self.buckets[new].add(key)
+        self.counts[key] = new
+
+    def add(self, key, count=1):
+        if key in self.counts:
+            self.move(key, self.counts[key], self.counts[key] + count)
+        elif len(self.counts) < self.k:
+            self.counts[key] = 0
+            self.errors[key] = 0
+            self.buckets[0].add(key)
+            self.minCount = 0
+            self.move(key, 0, count)
+        else:
+            evicted = next(iter(self.buckets[self.minCount]))
+            floor = self.counts.pop(evicted)
+            del self.errors[evicted]
+            self.counts[key] = floor
+            self.errors[key] = floor
+            self.buckets[floor].add(key)
+            self.buckets[floor].discard(evicted)
+            self.move(key, floor, floor + count)
+
+    def update(self, keys):
+        add = self.add
+        for key in keys:
+            add(key)
+
+    def __getitem__(self, key):
+        return self.counts.get(key, 0)
+
+    def most_common(self, n=None):
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def merge(self, other):
+        """Keys Missing From A Full Summary May Still Have Up To Its minCount"""
+        selfFloor = self.minCount if len(self.counts) >= self.k else 0
+        otherFloor = other.minCount if len(other.counts) >= other.k else 0
+        merged = {}
+        for key in self.counts.keys() | other.counts.keys():
+            count = self.counts.get(key, selfFloor) + other.counts.get(key, otherFloor)
+            error = self.errors.get(key, selfFloor) + other.errors.get(key, otherFloor)
+            merged[key] = (count, error)
+        top = sorted(merged.items(), key=lambda item: item[1][0], reverse=True)[:self.k]
+        self.counts = {key: count for key, (count, _) in top}
+        self.errors = {key: error for key, (_, error) in top}
+        self.buckets = defaultdict(set)
+        for key, count in self.counts.items():
+            self.buckets[count].add(key)
+        self.minCount = min(self.buckets, default=0)
+        return self
+
+class HyperLogLog:
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)  # 2**14 Registers = 16 KB
+
+    def add(self, key):
+        hashValue = stableHash64(key)
+        index = hashValue >> (64 - self.precision)  # First Bits Pick The Register
+        restBits = 64 - self.precision
+        rest = hashValue & ((1 << restBits) - 1)
+        rank = restBits - rest.bit_length() + 1  # Position Of The First 1-Bit
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        registerCount = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / registerCount)
+        estimate = alpha * registerCount ** 2 / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * registerCount and zeros:
+            estimate = registerCount * math.log(registerCount / zeros)  # Linear Counting For Small Sets
+        return round(estimate)
+
+    def merge(self, other):
+        if self.precision != other.precision:
+            raise ValueError("Can Only Merge HyperLogLogs With The Same Precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+class BloomFilter:
+    def __init__(self, capacity=100_000, errorRate=0.01):
+        self.bitCount = math.ceil(-capacity * math.log(errorRate) / math.log(2) ** 2)
+        self.hashCount = max(1, round(self.bitCount / capacity * math.log(2)))
+        self.bits = bytearray((self.bitCount + 7) // 8)
+
+    def positions(self, key):
+        h1, h2 = hashPair(key)
+        return [(h1 + i * h2) % self.bitCount for i in range(self.hashCount)]
+
+    def add(self, key):
+        bits = self.bits
+        for position in self.positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self.positions(key))
+
+    def merge(self, other):
+        if self.bitCount != other.bitCount or self.hashCount != other.hashCount:
+            raise ValueError("Can Only Merge Bloom Filters With The Same Size")
+        combined = int.from_bytes(self.bits, "little") | int.from_bytes(other.bits, "little")
+        self.bits = bytearray(combined.to_bytes(len(self.bits), "little"))
+        return self
+
+# Zipf-Like Stream: A Few Very Common Words, A Long Tail Of Rare Ones
+rng = random.Random(28)
+vocabulary = [f"word{n}" for n in range(50_000)]
+weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+stream = rng.choices(vocabulary, weights, k=300_000)
+
+# Two "Workers" Each Build Sketches For Half Of The Stream...
+def buildSketches(events):
+    sketches = (CountMinSketch.fromError(0.0005, 0.01), SpaceSaving(50),
+                HyperLogLog(), BloomFilter(capacity=60_000))
+    for event in events:
+        for sketch in sketches:
+            sketch.add(event)
+    return pickle.dumps(sketches)  # What A Worker Process Would Send Back
+
+startTime = time.perf_counter()
+partA = pickle.loads(buildSketches(stream[:150_000]))
+partB = pickle.loads(buildSketches(stream[150_000:]))
+sketchTime = time.perf_counter() - startTime
+# ...And The Parent Merges Them
+countMin, topK, distinct, seen = (a.merge(b) for a, b in zip(partA, partB))
+
+exact = Counter(stream)
+print(f"Events: {len(stream):,}, Sketch Updates: {len(stream) * 4 / sketchTime:,.0f}/s")
+print(f"Top 5 (Exact)       : {exact.most_common(5)}")
+print(f"Top 5 (SpaceSaving) : {topK.most_common(5)}")
+print(f"'word10' Exact {exact['word10']}, CountMinSketch {countMin['word10']}")
+print(f"Distinct Exact {len(exact):,}, HyperLogLog {len(distinct):,}")
+falsePositives = sum(f"unseen{n}" in seen for n in range(10_000))
+print(f"'word3' In Bloom: {'word3' in seen}, False Positive Rate: {falsePositives / 10_000:.2%}")
+
+counterBytes = sys.getsizeof(exact) + sum(sys.getsizeof(key) + sys.getsizeof(count) for key, count in exact.items())
+sketchBytes = (countMin.table.itemsize * len(countMin.table) + len(distinct.registers) + len(seen.bits)
+               + sum(sys.getsizeof(key) for key in topK.counts))
+print(f"Memory: Counter ~{counterBytes / 1024:,.0f} KB, Sketches ~{sketchBytes / 1024:,.0f} KB (Fixed, However Long The Stream)")
+
 
 # ========================================
 # 3. ITERTOOLS MODULE
@@ -448,6 +1342,292 @@ point = Point(10, 20)
 print(f"\nFrozen Point: {point}")
 # point.x = 30  # Would Raise FrozenInstanceError
 
+# Columnar Record Table (Struct Of Arrays)
+print("\n--- Columnar Record Table ---")
+print("""
+A List Of Dataclass Instances Pays For One Object (+ Attribute Dict) Per Row
+And One Python Object Per Field Value. RecordTable Stores One Column Per Field:
+- int / float Fields -> array('q') / array('d'), 8 Bytes Per Value
+- str Fields -> Dictionary-Encoded: Each Distinct String Stored Once, Rows Hold
+  A 1-Byte Code In An array('B') (Widened To 4-Byte array('I') Past 256 Strings)
+- bool Fields -> The Same Encoding With The Two Values False And True
+Filters On A str Column Run The Predicate Once Per Distinct Value, Not Per Row,
+And Sorting One Is A Counting Sort. Even So, Filter And Sort Only Roughly Keep
+Pace With A List Comprehension Or sorted() Over Instances: The Win Is Memory.
+Rows Are Built Only When Asked For: table[i] Returns A Small RowView.
+""")
+
+import dataclasses
+import operator
+import sys
+import tracemalloc
+from array import array
+from itertools import chain, compress
+
+class StringColumn:
+    """Dictionary-Encoded Strings: codes[i] Indexes Into values"""
+
+    def __init__(self):
+        self.values = []   # Distinct Strings
+        self.lookup = {}   # String -> Code
+        self.codes = array("B")  # Widened To array('I') When A 257th String Arrives
+        self.shared = False      # values/lookup Also Used By A take() Copy
+
+    def encode(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            if self.shared:  # Copy On Write: A New String Must Not Grow The Other Column's Table
+                self.values, self.lookup, self.shared = list(self.values), dict(self.lookup), False
+            code = self.lookup[value] = len(self.values)
+            self.values.append(sys.intern(value))
+            if code == 256 and self.codes.typecode == "B":
+                self.codes = array("I", self.codes)
+        return code
+
+    def append(self, value):
+        code = self.encode(value)  # May Replace self.codes, So Read It Afterwards
+        self.codes.append(code)
+
+    def extend(self, values):
+        codes = list(map(self.encode, values))
+        self.codes.extend(codes)
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return map(self.values.__getitem__, self.codes)
+
+    def take(self, indices):
+        column = type(self)()
+        column.values = self.values  # Shared Until Either Column Adds A New String
+        column.lookup = self.lookup
+        column.shared = self.shared = True
+        column.codes = array(self.codes.typecode, pick(self.codes, indices))
+        return column
+
+class BoolColumn(StringColumn):
+    """bool Values As 1-Byte Codes Into [False, True], So Rows Read Back As Real bools"""
+
+    def __init__(self):
+        self.values = [False, True]
+        self.lookup = {False: 0, True: 1}
+        self.codes = array("B")
+        self.shared = False
+
+    def encode(self, value):
+        return 1 if value else 0
+
+    def extend(self, values):
+        self.codes.extend(map(bool, values))
+
+def pick(column, indices):
+    """column[i] For Each i, Gathered In C By itemgetter"""
+    if len(indices) > 1:
+        return operator.itemgetter(*indices)(column)
+    return [column[index] for index in indices]
+
+class RowView:
+    """One Row Of A RecordTable, Read Through The Columns"""
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __getattr__(self, name):
+        try:
+            return self.table.columns[name][self.index]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.table.fieldNames)
+        return f"RowView({values})"
+
+class RecordTable:
+    typecodes = {int: "q", float: "d"}
+
+    def __init__(self, schema):
+        """schema Is A Dataclass Or A NamedTuple Class With Type Annotations"""
+        self.schema = schema
+        if dataclasses.is_dataclass(schema):
+            self.fieldTypes = {f.name: f.type for f in dataclasses.fields(schema)}
+        else:
+            hints = getattr(schema, "__annotations__", {})
+            self.fieldTypes = {name: hints.get(name, object) for name in schema._fields}
+        self.fieldNames = list(self.fieldTypes)
+        self.columns = {name: self.newColumn(kind) for name, kind in self.fieldTypes.items()}
+
+    def newColumn(self, kind):
+        kind = {"int": int, "float": float, "bool": bool, "str": str}.get(kind, kind)  # String Annotations
+        if kind is str:
+            return StringColumn()
+        if kind is bool:
+            return BoolColumn()
+        if kind in self.typecodes:
+            return array(self.typecodes[kind])
+        return []  # Anything Else Stays A List Of Objects
+
+    @classmethod
+    def fromRecords(cls, schema, records):
+        table = cls(schema)
+        table.extend(records)
+        return table
+
+    def append(self, record):
+        for name in self.fieldNames:
+            self.columns[name].append(getattr(record, name))
+
+    def extend(self, records):
+        records = list(records)
+        for name in self.fieldNames:  # Column At A Time: One extend() Per Field
+            self.columns[name].extend(map(operator.attrgetter(name), records))
+
+    def __len__(self):
+        return len(self.columns[self.fieldNames[0]])
+
+    def __getitem__(self, index):
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RecordTable Index Out Of Range")
+        return RowView(self, index)
+
+    def __iter__(self):
+        return (RowView(self, index) for index in range(len(self)))
+
+    def record(self, index):
+        """Build A Real schema Instance For One Row"""
+        return self.schema(*(self.columns[name][index] for name in self.fieldNames))
+
+    def take(self, indices):
+        """New Table With The Given Rows, In The Given Order"""
+        result = RecordTable(self.schema)
+        for name, column in self.columns.items():
+            if isinstance(column, StringColumn):
+                result.columns[name] = column.take(indices)
+            elif isinstance(column, array):
+                result.columns[name] = array(column.typecode, pick(column, indices))
+            else:
+                result.columns[name] = list(pick(column, indices))
+        return result
+
+    def whereIndices(self, **predicates):
+        """Row Numbers Where Every predicate(value) Is True"""
+        # str Columns First: Their Predicates Run Once Per Distinct Value, And
+        # The Rows They Reject Are Never Looked At By The Other Predicates
+        order = sorted(predicates, key=lambda name: not isinstance(self.columns[name], StringColumn))
+        indices = range(len(self))
+        for name in order:
+            column = self.columns[name]
+            everyRow = len(indices) == len(self)
+            if isinstance(column, StringColumn):
+                matches = list(map(predicates[name], column.values))
+                if everyRow and len(matches) <= 256 and column.codes.typecode == "B":
+                    # One bytes.translate() Turns Every Row's Code Into Its 0/1 Match Flag
+                    keep = column.codes.tobytes().translate(bytes(map(bool, matches)).ljust(256, b"\0"))
+                else:
+                    codes = column.codes if everyRow else pick(column.codes, indices)
+                    keep = map(matches.__getitem__, codes)
+            else:
+                keep = map(predicates[name], column if everyRow else pick(column, indices))
+            indices = list(compress(indices, keep))  # compress() And map() Loop In C
+        return list(indices)
+
+    def where(self, **predicates):
+        """where(age=lambda a: a > 30, city=lambda c: c == "Paris"): Rows Matching All"""
+        return self.take(self.whereIndices(**predicates))
+
+    def sortBy(self, name, reverse=False):
+        return self.take(self.sortIndices(name, reverse))
+
+    def sortIndices(self, name, reverse=False):
+        """Row Numbers In Sorted Order (Like An argsort)"""
+        column = self.columns[name]
+        if isinstance(column, StringColumn):
+            # Counting Sort: Sort The Distinct Values Once, Bucket Rows By Code In
+            # One Pass, Then Concatenate The Buckets In Value Order (Stable)
+            order = sorted(range(len(column.values)), key=column.values.__getitem__, reverse=reverse)
+            buckets = [[] for _ in column.values]
+            appends = [bucket.append for bucket in buckets]
+            for row, code in enumerate(column.codes):
+                appends[code](row)
+            return list(chain.from_iterable(map(buckets.__getitem__, order)))
+        return sorted(range(len(self)), key=column.__getitem__, reverse=reverse)
+
+    def groupBy(self, keyName, valueName, aggregate="sum"):
+        """{key: aggregate(values)} With aggregate In sum, count, mean, min, max"""
+        keyColumn = self.columns[keyName]
+        keys = keyColumn.codes if isinstance(keyColumn, StringColumn) else keyColumn
+        groups = defaultdict(list)  # Grouped By Code: Small ints Hash Faster Than Strings
+        for key, value in zip(keys, self.columns[valueName]):
+            groups[key].append(value)
+        combine = {"sum": sum, "count": len, "min": min, "max": max,
+                   "mean": lambda values: sum(values) / len(values)}[aggregate]
+        decode = keyColumn.values.__getitem__ if isinstance(keyColumn, StringColumn) else (lambda key: key)
+        return {decode(key): combine(values) for key, values in groups.items()}
+
+people = RecordTable.fromRecords(Person, [Person("Alice", 30, "New York"), Person("Bob", 25),
+                                          Person("Cara", 41, "Paris"), Person("Dan", 35, "Paris")])
+print(f"\nRows: {len(people)}, First Row View: {people[0]}, Last Name: {people[-1].name}")
+print(f"Older Than 28 In Paris: {[row.name for row in people.where(age=lambda a: a > 28, city=lambda c: c == 'Paris')]}")
+print(f"Sorted By Age: {[row.name for row in people.sortBy('age')]}")
+print(f"Mean Age By City: {people.groupBy('city', 'age', 'mean')}")
+print(f"Back To A Dataclass: {people.record(2)}")
+
+# Benchmark: 300,000 Rows As Dataclass Instances vs RecordTable
+rowCount = 300_000
+cities = ["New York", "Paris", "Tokyo", "Lagos", "Lima", "Oslo", "Delhi", "Cairo"]
+
+def makePeople():
+    # Fresh str Objects Per Row, As When Parsing A File, From 5,000 Distinct Names
+    return [Person(f"Person{n % 5000}", 18 + n % 60, f"{cities[n % len(cities)]}") for n in range(rowCount)]
+
+def meanAgeByCity(records):
+    ages = defaultdict(list)
+    for record in records:
+        ages[record.city].append(record.age)
+    return {city: sum(values) / len(values) for city, values in ages.items()}
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, used
+
+instances, instanceBytes = measure(makePeople)
+table, tableBytes = measure(lambda: RecordTable.fromRecords(Person, makePeople()))
+
+def timed(work):
+    startTime = time.perf_counter()
+    work()
+    return time.perf_counter() - startTime
+
+# Selecting And Ordering Rows Is Compared On Row Numbers (whereIndices,
+# sortIndices); where() And sortBy() Also Copy The Chosen Rows Into New Columns
+operations = [
+    ("Filter age>40 & Paris",
+     lambda: [p for p in instances if p.age > 40 and p.city == "Paris"],
+     lambda: table.whereIndices(age=lambda a: a > 40, city=lambda c: c == "Paris")),
+    ("Sort By city",
+     lambda: sorted(instances, key=operator.attrgetter("city")),
+     lambda: table.sortIndices("city")),
+    ("Mean age By city",
+     lambda: meanAgeByCity(instances),
+     lambda: table.groupBy("city", "age", "mean")),
+]
+print(f"\n{rowCount:,} Rows  Memory: Dataclass List {instanceBytes / 2**20:6.1f} MB, "
+      f"RecordTable {tableBytes / 2**20:6.1f} MB")
+for label, onInstances, onTable in operations:
+    print(f"{label:<24}: Dataclass List {timed(onInstances):.3f}s, RecordTable {timed(onTable):.3f}s")
+del instances, table
+
 
 # ========================================
 # 6. ENUM
@@ -795,6 +1975,118 @@ print("c = char (1 byte)")
 size = struct.calcsize('i 4s f')
 print(f"\nSize Of 'i 4s f': {size} bytes")
 
+# Bulk Binary Records With Struct Objects And memoryview
+print("\n--- Zero-Copy Record Codec ---")
+print("""
+struct.pack('i 4s f', ...) Parses The Format String On Every Call And
+data[i:i+12] Copies Bytes Before unpack() Sees Them. RecordCodec Avoids Both:
+- struct.Struct Objects Are Compiled Once Per Schema
+- iter_unpack() / unpack_from() Read Straight From A bytes, bytearray,
+  memoryview Or mmap Without Slicing Out Copies
+- packInto() Writes A Whole Chunk Of Records With One pack_into() Call Using
+  A Struct Whose Format Repeats The Record (e.g. '<i4sfi4sf...'), Directly
+  Into A Preallocated bytearray
+'<' Means Little-Endian With No Padding, So Files Are The Same On Every Machine.
+""")
+
+import itertools
+import mmap
+from collections import namedtuple
+
+class RecordCodec:
+    def __init__(self, name, fields, chunk=1024):
+        """fields: List Of (fieldName, structFormat), e.g. [('id', 'i'), ('tag', '4s')]"""
+        self.recordType = namedtuple(name, [fieldName for fieldName, _ in fields])
+        self.format = "".join(fieldFormat for _, fieldFormat in fields)
+        self.struct = struct.Struct("<" + self.format)
+        self.size = self.struct.size
+        self.chunk = chunk
+        self.chunkStruct = struct.Struct("<" + self.format * chunk)  # chunk Records In One Call
+        self.fieldCount = len(fields)
+
+    def allocate(self, count):
+        return bytearray(count * self.size)
+
+    def packInto(self, buffer, records, offset=0):
+        """Write records Into buffer Starting At Byte offset; Returns The Record Count"""
+        records = records if isinstance(records, list) else list(records)
+        count = len(records)
+        if offset + count * self.size > len(buffer):
+            raise ValueError(f"Buffer Too Small For {count} Records At Offset {offset}")
+        fullChunks = count - count % self.chunk
+        packChunk = self.chunkStruct.pack_into
+        flatten = itertools.chain.from_iterable
+        for start in range(0, fullChunks, self.chunk):
+            packChunk(buffer, offset + start * self.size, *flatten(records[start:start + self.chunk]))
+        packOne = self.struct.pack_into
+        for index in range(fullChunks, count):  # The Last Partial Chunk, One Record At A Time
+            packOne(buffer, offset + index * self.size, *records[index])
+        return count
+
+    def iterRecords(self, buffer, start=0, stop=None):
+        """Tuples For Records start..stop-1; memoryview Slices Share The Buffer, No Copy"""
+        view = memoryview(buffer)
+        stop = len(view) // self.size if stop is None else stop
+        return self.struct.iter_unpack(view[start * self.size:stop * self.size])
+
+    def iterNamed(self, buffer, start=0, stop=None):
+        return map(self.recordType._make, self.iterRecords(buffer, start, stop))
+
+    def recordAt(self, buffer, index):
+        return self.recordType._make(self.struct.unpack_from(buffer, index * self.size))
+
+    def count(self, buffer):
+        return len(buffer) // self.size
+
+scoreCodec = RecordCodec("Score", [("id", "i"), ("tag", "4s"), ("score", "f")])
+records = [(7, b"spam", 3.14), (8, b"eggs", 2.5), (9, b"ham!", 1.0)]
+buffer = scoreCodec.allocate(len(records))
+scoreCodec.packInto(buffer, records)
+print(f"Record Size: {scoreCodec.size} Bytes, Buffer: {bytes(buffer[:12])}...")
+print(f"Record 1: {scoreCodec.recordAt(buffer, 1)}")
+print(f"All: {list(scoreCodec.iterNamed(buffer))}")
+
+# Reading Records From A File Through mmap (The OS Pages Data In On Demand)
+codecDir = tempfile.mkdtemp()
+recordPath = os.path.join(codecDir, "scores.bin")
+with open(recordPath, "wb") as recordFile:
+    recordFile.write(buffer)
+with open(recordPath, "rb") as recordFile, mmap.mmap(recordFile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+    print(f"From mmap: {[record.id for record in scoreCodec.iterNamed(mapped)]}")
+shutil.rmtree(codecDir)
+
+# Benchmark: 500,000 Records
+recordCount = 500_000
+manyRecords = [(n, b"tag%d" % (n % 10), n * 0.5) for n in range(recordCount)]
+
+def recordsPerSecond(work):
+    startTime = time.perf_counter()
+    work()
+    return recordCount / (time.perf_counter() - startTime)
+
+encoded = b"".join(struct.pack("<i4sf", *record) for record in manyRecords)
+target = scoreCodec.allocate(recordCount)
+encodeRates = [
+    ("struct.pack() Per Record + join", lambda: b"".join(struct.pack("<i4sf", *record) for record in manyRecords)),
+    ("Struct.pack_into() Per Record", lambda: [scoreCodec.struct.pack_into(target, index * 12, *record)
+                                              for index, record in enumerate(manyRecords)]),
+    ("RecordCodec.packInto (Chunks)", lambda: scoreCodec.packInto(target, manyRecords)),
+]
+decodeRates = [
+    ("Slice + struct.unpack() Per Record", lambda: [struct.unpack("<i4sf", encoded[offset:offset + 12])
+                                                   for offset in range(0, len(encoded), 12)]),
+    ("Struct.unpack_from() Per Record", lambda: [scoreCodec.struct.unpack_from(encoded, offset)
+                                                for offset in range(0, len(encoded), 12)]),
+    ("RecordCodec.iterRecords", lambda: list(scoreCodec.iterRecords(encoded))),
+]
+print()
+for label, work in encodeRates:
+    print(f"Encode {label:<36}: {recordsPerSecond(work):>12,.0f} Records/s")
+print(f"Same Bytes: {bytes(target) == encoded}")
+for label, work in decodeRates:
+    print(f"Decode {label:<36}: {recordsPerSecond(work):>12,.0f} Records/s")
+del manyRecords, encoded, target
+
 
 # ========================================
 # 13. ARRAY MODULE
@@ -867,6 +2159,255 @@ data = [5, 2, 9, 1, 7]
 heapq.heapify(data)
 print(f"\nHeapified: {data}")
 
+# Indexed Priority Queue (decrease-key By Key)
+print("\n--- Indexed Priority Queue ---")
+print("""
+A heapq List Cannot Find An Entry By Key, So Changing A Priority Usually Means
+Pushing A Duplicate And Skipping Stale Entries When Popped (Lazy Deletion).
+IndexedHeap Keeps A dict key -> Position Next To The Heap, So:
+- update(key, priority) / remove(key) Are O(log n) In Place
+- The Heap Never Holds More Than One Entry Per Key
+- arity=4 (A 4-ary Heap) Is Shallower Than A Binary Heap: Fewer Levels To
+  Move Through, And min() Over The Children Runs In C
+- IndexedHeap(pairs) Heapifies Everything At Once In O(n)
+""")
+
+import threading
+
+class IndexedHeap:
+    def __init__(self, pairs=(), arity=4):
+        """pairs: Iterable Of (key, priority)"""
+        self.arity = arity
+        self.keys = []
+        self.priorities = []
+        self.position = {}
+        for key, priority in pairs:
+            if key in self.position:
+                self.priorities[self.position[key]] = priority  # Last One Wins
+            else:
+                self.position[key] = len(self.keys)
+                self.keys.append(key)
+                self.priorities.append(priority)
+        for index in reversed(range((len(self.keys) - 2) // arity + 1)):  # Bottom-Up Heapify
+            self.siftDown(index)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.position
+
+    def priority(self, key):
+        return self.priorities[self.position[key]]
+
+    def siftUp(self, index):
+        keys, priorities, position, arity = self.keys, self.priorities, self.position, self.arity
+        key, priority = keys[index], priorities[index]
+        while index:
+            parent = (index - 1) // arity
+            if priorities[parent] <= priority:
+                break
+            keys[index] = parentKey = keys[parent]  # Move The Parent Down Into The Hole
+            priorities[index] = priorities[parent]
+            position[parentKey] = index
+            index = parent
+        keys[index], priorities[index] = key, priority
+        position[key] = index
+
+    def siftDown(self, index):
+        keys, priorities, position, arity = self.keys, self.priorities, self.position, self.arity
+        size = len(keys)
+        key, priority = keys[index], priorities[index]
+        while True:
+            first = index * arity + 1
+            if first >= size:
+                break
+            last = min(first + arity, size)
+            best = min(priorities[first:last])           # Smallest Child, Found In C
+            if best >= priority:
+                break
+            child = priorities.index(best, first, last)
+            keys[index] = childKey = keys[child]         # Move The Child Up Into The Hole
+            priorities[index] = best
+            position[childKey] = index
+            index = child
+        keys[index], priorities[index] = key, priority
+        position[key] = index
+
+    def push(self, key, priority):
+        """Add key, Or Change Its Priority If Already Present"""
+        index = self.position.get(key)
+        if index is not None:
+            return self.update(key, priority)
+        self.position[key] = len(self.keys)
+        self.keys.append(key)
+        self.priorities.append(priority)
+        self.siftUp(len(self.keys) - 1)
+
+    def update(self, key, priority):
+        index = self.position[key]
+        old = self.priorities[index]
+        self.priorities[index] = priority
+        if priority < old:
+            self.siftUp(index)
+        elif priority > old:
+            self.siftDown(index)
+
+    def decreaseKey(self, key, priority):
+        """Lower key's Priority Only If priority Is Smaller (The Dijkstra Relaxation Step)"""
+        index = self.position[key]
+        if priority < self.priorities[index]:
+            self.priorities[index] = priority
+            self.siftUp(index)
+
+    def peek(self):
+        return self.keys[0], self.priorities[0]
+
+    def removeAt(self, index):
+        keys, priorities = self.keys, self.priorities
+        key, priority = keys[index], priorities[index]
+        del self.position[key]
+        lastKey, lastPriority = keys.pop(), priorities.pop()
+        if index < len(keys):  # Fill The Gap With The Last Entry, Then Restore Order
+            keys[index], priorities[index] = lastKey, lastPriority
+            self.position[lastKey] = index
+            if lastPriority < priority:
+                self.siftUp(index)
+            else:
+                self.siftDown(index)
+        return key, priority
+
+    def pop(self):
+        """Remove And Return (key, priority) With The Smallest Priority"""
+        if not self.keys:
+            raise IndexError("pop From Empty IndexedHeap")
+        return self.removeAt(0)
+
+    def remove(self, key):
+        return self.removeAt(self.position[key])[1]
+
+class ThreadSafeIndexedHeap(IndexedHeap):
+    """Every Operation Under One Lock; popWait() Blocks Until An Item Is Pushed"""
+
+    def __init__(self, pairs=(), arity=4):
+        self.lock = threading.Condition()
+        super().__init__(pairs, arity)
+
+    def push(self, key, priority):
+        with self.lock:
+            super().push(key, priority)
+            self.lock.notify()
+
+    def update(self, key, priority):
+        with self.lock:
+            super().update(key, priority)
+
+    def decreaseKey(self, key, priority):
+        with self.lock:
+            super().decreaseKey(key, priority)
+
+    def remove(self, key):
+        with self.lock:
+            return super().remove(key)
+
+    def pop(self):
+        with self.lock:
+            return super().pop()
+
+    def peek(self):
+        with self.lock:
+            return super().peek()
+
+    def popWait(self, timeout=None):
+        """Like pop(), But Waits Up To timeout Seconds For An Item (IndexError On Timeout)"""
+        with self.lock:
+            if not self.lock.wait_for(lambda: self.keys, timeout):
+                raise IndexError("No Item Within Timeout")
+            return super().pop()
+
+tasks = IndexedHeap([("backup", 5), ("email", 3), ("report", 8), ("cleanup", 9)])
+tasks.update("report", 1)     # Now Most Urgent
+tasks.remove("cleanup")       # Cancelled
+tasks.push("deploy", 2)
+print(f"\nTasks In Priority Order: {[tasks.pop() for _ in range(len(tasks))]}")
+
+scheduler = ThreadSafeIndexedHeap()
+threading.Timer(0.05, scheduler.push, args=("late-job", 1)).start()
+print(f"popWait Got: {scheduler.popWait(timeout=1.0)}")
+
+# Benchmark: Dijkstra Shortest Paths, IndexedHeap vs heapq With Lazy Deletion
+import random as randomModule
+rng = randomModule.Random(14)
+nodeCount = 50_000
+graph = [[(rng.randrange(nodeCount), rng.randint(1, 100)) for _ in range(6)] for _ in range(nodeCount)]
+
+def dijkstraIndexed(graph, source):
+    distance = {source: 0}
+    heap = IndexedHeap([(source, 0)])
+    push, pop, infinity = heap.push, heap.pop, float("inf")
+    while heap:
+        node, nodeDistance = pop()
+        for neighbor, weight in graph[node]:
+            candidate = nodeDistance + weight
+            # Settled Nodes Never Pass This Test (Weights Are Positive), So They Stay Out
+            if candidate < distance.get(neighbor, infinity):
+                distance[neighbor] = candidate
+                push(neighbor, candidate)  # Already Queued: Becomes A decrease-key
+    return distance
+
+def dijkstraLazy(graph, source):
+    distance = {source: 0}
+    heap = [(0, source)]
+    maxHeapSize = 1
+    while heap:
+        nodeDistance, node = heapq.heappop(heap)
+        if nodeDistance > distance[node]:
+            continue  # Stale Entry Left Behind By An Earlier Improvement
+        for neighbor, weight in graph[node]:
+            candidate = nodeDistance + weight
+            if candidate < distance.get(neighbor, float("inf")):
+                distance[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+        maxHeapSize = max(maxHeapSize, len(heap))
+    return distance, maxHeapSize
+
+startTime = time.perf_counter()
+indexedDistances = dijkstraIndexed(graph, 0)
+indexedTime = time.perf_counter() - startTime
+startTime = time.perf_counter()
+lazyDistances, lazyPeak = dijkstraLazy(graph, 0)
+lazyTime = time.perf_counter() - startTime
+print(f"\nDijkstra On {nodeCount:,} Nodes / {nodeCount * 6:,} Edges (Same Result: {indexedDistances == lazyDistances})")
+print(f"  IndexedHeap (4-ary)     : {indexedTime:.3f}s, At Most One Entry Per Node")
+print(f"  heapq + Lazy Deletion   : {lazyTime:.3f}s, Peak Heap Size {lazyPeak:,} Entries")
+
+# Scheduler Workload: Many Priority Changes Per Item
+jobCount = 20_000
+changes = [(rng.randrange(jobCount), rng.random()) for _ in range(200_000)]
+startTime = time.perf_counter()
+jobs = IndexedHeap((job, rng.random()) for job in range(jobCount))
+for job, priority in changes:
+    jobs.update(job, priority)
+while jobs:
+    jobs.pop()
+indexedTime = time.perf_counter() - startTime
+
+startTime = time.perf_counter()
+lazyHeap = [(rng.random(), job) for job in range(jobCount)]
+heapq.heapify(lazyHeap)
+current = {job: priority for priority, job in lazyHeap}
+for job, priority in changes:
+    current[job] = priority
+    heapq.heappush(lazyHeap, (priority, job))
+peakSize = len(lazyHeap)
+while lazyHeap:
+    priority, job = heapq.heappop(lazyHeap)
+    if current.get(job) == priority:
+        del current[job]
+lazyTime = time.perf_counter() - startTime
+print(f"200,000 Priority Changes On {jobCount:,} Jobs: IndexedHeap {indexedTime:.3f}s (Size {jobCount:,}), "
+      f"Lazy heapq {lazyTime:.3f}s (Size {peakSize:,})")
+
 
 # ========================================
 # 15. __SLOTS__ (MEMORY OPTIMIZATION)
@@ -911,6 +2452,258 @@ print("  - Faster Attribute Access")
 print("  - Less Memory Usage (No __dict__)")
 print("  - Prevents Dynamic Attribute Addition")
 
+# Generating Slotted Classes With A Decorator
+print("\n--- slottedRecord Decorator (Generated Slotted Classes) ---")
+print("""
+Writing __slots__ And __init__ By Hand (SlottedPerson) Repeats Every Field Name.
+@slottedRecord Reads Annotations Like @dataclass And Generates The Class:
+- __slots__ Holding Exactly The Fields (No Per-Instance __dict__)
+- __init__, __repr__, __eq__ Written As Plain Source Per Class And exec()'d,
+  So They Run Without Loops Over Field Lists
+- frozen=True: Assignment Raises FrozenInstanceError; The Hash Is Computed On
+  The First hash() And Kept In A Slot (Fast For Sets And Dict Keys)
+- init=False, kw_only, InitVar, Default Factories And __post_init__ Behave As In @dataclass
+- astuple() / asdict() Methods: Shallow, Built From One Tuple Of The Fields
+dataclasses.fields(), asdict(), replace() Keep Working: The Field Metadata Is
+Copied Over From A Regular @dataclass Pass.
+""")
+
+import dataclasses
+import gc
+import pickle
+import tracemalloc
+from dataclasses import FrozenInstanceError
+
+def slottedRecord(cls=None, *, frozen=False):
+    def wrap(cls):
+        # Reuse Field Parsing From A Regular @dataclass Pass, Run On A Copy So
+        # The Caller's Class Is Left Untouched
+        copyDict = {key: value for key, value in cls.__dict__.items() if key not in ("__dict__", "__weakref__")}
+        parsed = dataclasses.dataclass(type(cls)(cls.__name__, cls.__bases__, copyDict), frozen=frozen)
+        fields = dataclasses.fields(parsed)
+        names = [f.name for f in fields]
+        namespace = {"MISSING": dataclasses.MISSING, "FrozenInstanceError": FrozenInstanceError}
+        # __dataclass_fields__ Also Holds InitVar Pseudo-Fields (Parameters Passed On
+        # To __post_init__, Never Stored) In Declaration Order; ClassVars Are Skipped
+        initVars = [f.name for f in parsed.__dataclass_fields__.values()
+                    if f._field_type is dataclasses._FIELD_INITVAR]
+        declared = [f for f in parsed.__dataclass_fields__.values() if f.name in names or f.name in initVars]
+        positional, keywordOnly, body = [], [], []
+        for f in declared:
+            if f.default is not dataclasses.MISSING:
+                namespace[f"default_{f.name}"] = f.default
+                value = f"default_{f.name}"
+            elif f.default_factory is not dataclasses.MISSING:
+                namespace[f"factory_{f.name}"] = f.default_factory
+                value = f"factory_{f.name}()"
+            else:
+                value = None
+            if not f.init:  # Not A Parameter: Set From Its Default, Or Left Unset Like @dataclass
+                if value is not None:
+                    body.append(f"    set_{f.name}(self, {value})" if frozen else f"    self.{f.name} = {value}")
+                continue
+            parameters = keywordOnly if f.kw_only else positional  # kw_only=True Or After A KW_ONLY Marker
+            if f.default_factory is not dataclasses.MISSING:
+                parameters.append(f"{f.name}=MISSING")
+                body.append(f"    if {f.name} is MISSING: {f.name} = {value}")
+            else:
+                parameters.append(f"{f.name}={value}" if value else f.name)
+            if f.name in initVars:
+                continue
+            # Frozen: Write Through The Slot's Own Descriptor, Skipping The Blocked __setattr__
+            body.append(f"    set_{f.name}(self, {f.name})" if frozen else f"    self.{f.name} = {f.name}")
+        parameters = positional + (["*", *keywordOnly] if keywordOnly else [])
+        if frozen:
+            body.append("    set_hashValue(self, None)")  # Shared None: No Per-Instance Object Until hash()
+        if hasattr(cls, "__post_init__"):
+            body.append(f"    self.__post_init__({', '.join(initVars)})")
+        # Same Field Choices As @dataclass: repr=False / compare=False / hash= Leave A Field Out
+        reprNames = [f.name for f in fields if f.repr]
+        compared = "(" + "".join(f"self.{f.name}, " for f in fields if f.compare) + ")"
+        hashed = "(" + "".join(f"self.{f.name}, " for f in fields if (f.compare if f.hash is None else f.hash)) + ")"
+        fieldTuple = "(" + "".join(f"self.{name}, " for name in names) + ")"
+        lines = [f"def __init__(self, {', '.join(parameters)}):", *(body or ["    pass"]),
+                 "def __repr__(self):",
+                 f"    return f'{cls.__qualname__}(" + ", ".join(f"{name}={{self.{name}!r}}" for name in reprNames) + ")'",
+                 "def __eq__(self, other):",
+                 "    if other.__class__ is self.__class__:",
+                 f"        return {compared} == " + compared.replace("self.", "other."),
+                 "    return NotImplemented",
+                 "def astuple(self):",
+                 f"    return {fieldTuple}",
+                 "def asdict(self):",
+                 "    return {" + ", ".join(f"{name!r}: self.{name}" for name in names) + "}",
+                 "def __reduce__(self):",
+                 "    return (rebuild, (self.__class__, " + fieldTuple + "))"]
+        if frozen:
+            # Hashed On First Use, Then Kept In A Slot: Instances That Are Never
+            # Hashed Pay Nothing, And An Unhashable Field Only Fails At hash() Time
+            lines += ["def __hash__(self):",
+                      "    value = self.hashValue",
+                      "    if value is None:",
+                      f"        value = hash({hashed})",
+                      "        set_hashValue(self, value)",
+                      "    return value",
+                      "def __setattr__(self, name, value):",
+                      "    raise FrozenInstanceError(f'Cannot Assign To Field {name!r}')",
+                      "def __delattr__(self, name):",
+                      "    raise FrozenInstanceError(f'Cannot Delete Field {name!r}')"]
+        source = "\n".join(lines)
+
+        classDict = {key: value for key, value in parsed.__dict__.items()
+                     if key not in names and key not in ("__dict__", "__weakref__")}
+        classDict["__slots__"] = tuple(names) + (("hashValue",) if frozen else ())
+        classDict["__match_args__"] = tuple(f.name for f in fields if f.init and not f.kw_only)
+        classDict["generatedSource"] = source
+        newClass = type(cls)(cls.__name__, cls.__bases__, classDict)
+        for slot in newClass.__slots__:
+            namespace[f"set_{slot}"] = newClass.__dict__[slot].__set__
+        namespace["rebuild"] = rebuildRecord
+        exec(source, namespace)
+        methods = ["__init__", "__repr__", "__eq__", "astuple", "asdict", "__reduce__"]
+        if frozen:
+            methods += ["__hash__", "__setattr__", "__delattr__"]
+        else:
+            newClass.__hash__ = None  # Mutable And Comparable: Unhashable, Like @dataclass
+        for method in methods:
+            function = namespace[method]
+            function.__qualname__ = f"{cls.__qualname__}.{method}"
+            setattr(newClass, method, function)
+        return newClass
+    return wrap if cls is None else wrap(cls)
+
+def rebuildRecord(cls, values):
+    """Unpickle A slottedRecord Without Calling __init__ Or __post_init__ Again (Like @dataclass)"""
+    record = cls.__new__(cls)
+    for name, value in zip(cls.__slots__, values):  # __slots__ Starts With The Fields, In Order
+        object.__setattr__(record, name, value)
+    if "hashValue" in cls.__slots__:
+        object.__setattr__(record, "hashValue", None)
+    return record
+
+@slottedRecord
+class GeneratedPerson:
+    name: str
+    age: int
+    tags: list = dataclasses.field(default_factory=list)
+
+@slottedRecord(frozen=True)
+class FrozenPerson:
+    name: str
+    age: int
+
+    def greeting(self):  # Methods Are Kept
+        return f"Hi, I'm {self.name}"
+
+generated = GeneratedPerson("Carol", 41)
+frozenPerson = FrozenPerson("Dave", 52)
+print(f"{generated} | {frozenPerson} | {frozenPerson.greeting()}")
+print(f"astuple: {frozenPerson.astuple()}, asdict: {generated.asdict()}")
+print(f"dataclasses.replace: {dataclasses.replace(frozenPerson, age=53)}")
+print(f"Equal: {FrozenPerson('Dave', 52) == frozenPerson}, In A Set: {frozenPerson in {FrozenPerson('Dave', 52)}}")
+print(f"Pickle Round Trip: {pickle.loads(pickle.dumps(frozenPerson))}")
+try:
+    frozenPerson.age = 60
+except FrozenInstanceError as error:
+    print(f"FrozenInstanceError: {error}")
+print("Generated Source For FrozenPerson.__init__:")
+print(FrozenPerson.generatedSource.split("\ndef __repr__")[0])
+
+@dataclass
+class DataclassPerson:
+    name: str
+    age: int
+
+@dataclass(frozen=True)
+class FrozenDataclassPerson:
+    name: str
+    age: int
+
+@slottedRecord
+class RecordPerson:
+    name: str
+    age: int
+
+# Memory Of 1,000,000 Instances (Shared Name String, Small Cached ints)
+instanceCount = 1_000_000
+print()
+for cls in (RegularPerson, SlottedPerson, DataclassPerson, RecordPerson, FrozenPerson):
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls("Alice", 30) for _ in range(instanceCount)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    print(f"{cls.__name__:<22}: {used / instanceCount:6.1f} Bytes/Instance, {used / 2**20:6.1f} MB")
+print("(FrozenPerson Has One Extra Slot For Its Hash, Filled Only When The Instance Is First Hashed)")
+
+# Creation Speed (Without tracemalloc, Which Slows Every Allocation)
+for cls in (DataclassPerson, RecordPerson, FrozenDataclassPerson, FrozenPerson):
+    startTime = time.perf_counter()
+    instances = [cls("Alice", 30) for _ in range(200_000)]
+    print(f"Create 200,000 {cls.__name__:<22}: {time.perf_counter() - startTime:.3f}s")
+    del instances
+
+# Hashing: Cached In A Slot vs Recomputed By A Frozen @dataclass
+keys = [FrozenDataclassPerson(f"P{n}", n) for n in range(100_000)]
+startTime = time.perf_counter()
+lookupTable = {key: True for key in keys}
+all(key in lookupTable for key in keys)
+dataclassTime = time.perf_counter() - startTime
+keys = [FrozenPerson(f"P{n}", n) for n in range(100_000)]
+startTime = time.perf_counter()
+lookupTable = {key: True for key in keys}
+all(key in lookupTable for key in keys)
+print(f"Build + Look Up 100,000 Dict Keys: Frozen @dataclass {dataclassTime:.3f}s, "
+      f"FrozenPerson {time.perf_counter() - startTime:.3f}s")
+del keys, lookupTable
+
+# Measuring Memory: Deep Sizes And Allocation Profiles
+print("\n--- Memory Profiler (Deep Size, tracemalloc Diffs) ---")
+print("""
+sys.getsizeof() Counts Only The Object Itself, Not What It Points To.
+- deepSizeOf(obj)      Walks gc.get_referents() With A 'seen' Set (Shared And
+                       Cyclic Objects Count Once); Classes, Modules And
+                       Functions Are Skipped Because Every Instance Shares Them
+- MemoryProfile()      Context Manager: tracemalloc Snapshots Before And After
+                       The Block, Net Growth, Peak And The Top Allocation Lines
+- Command Line         python Chapter28.py --profile-memory [--top 10] [--fail-above-mb 50] Script.py [Args]
+                       (Exits 1 When Net Growth Passes The Limit: Usable As A CI Check.
+                        The Tools Are Defined At The Top Of This File, So The
+                        Script Is Profiled Before Any Of The Chapter's Demos Run)
+""")
+
+# __slots__ Savings, Measured
+regularPeople = [RegularPerson(f"Person{n}", n) for n in range(10_000)]
+slottedPeople = [SlottedPerson(f"Person{n}", n) for n in range(10_000)]
+breakdown = {}
+print(f"\nDeep Size, 10,000 RegularPerson: {deepSizeOf(regularPeople, breakdown) / 1024:,.0f} KB {breakdown}")
+breakdown = {}
+print(f"Deep Size, 10,000 SlottedPerson: {deepSizeOf(slottedPeople, breakdown) / 1024:,.0f} KB {breakdown}")
+print(f"sys.getsizeof Of The Same List : {sys.getsizeof(slottedPeople) / 1024:,.0f} KB (List Only)")
+
+# A Cycle Is Counted Once
+cyclic = {"name": "node"}
+cyclic["self"] = cyclic
+print(f"Self-Referencing dict: {deepSizeOf(cyclic)} Bytes")
+
+with MemoryProfile("Build Lookup Tables", top=3) as profile:
+    byName = {person.name: person for person in regularPeople}
+    nameLengths = [len(name) for name in byName]
+print(profile.report())
+
+# The CLI, Called In-Process On A Small Script
+scriptDir = tempfile.mkdtemp()
+scriptPath = os.path.join(scriptDir, "leaky.py")
+with open(scriptPath, "w") as scriptFile:
+    scriptFile.write("cache = []\n"
+                     "for n in range(50_000):\n"
+                     "    cache.append(str(n) * 3)\n")
+print(f"\n$ python Chapter28.py --profile-memory --top 2 --fail-above-mb 1 leaky.py")
+print(f"Exit Code: {memoryProfilerCli(['--top', '2', '--fail-above-mb', '1', scriptPath])}")
+shutil.rmtree(scriptDir)
+del regularPeople, slottedPeople, byName, nameLengths
+
 
 # ========================================
 # 16. WEAK REFERENCES
@@ -945,6 +2738,104 @@ print("Strong Reference Deleted")
 # Weak Reference Now Returns None
 print(f"Weak Ref After Delete: {weakRef()}")
 
+# Identity-Map Cache Built On Weak References
+print("\n--- Weak Identity-Map Cache ---")
+print("""
+IdentityCache Hands Out One Shared Instance Per Key For As Long As Anyone Uses It:
+- Weak Tier: WeakValueDictionary, An Entry Disappears When The Last User Drops The Object
+- Strong Tier: The strongSize Most Recently Used Objects Are Also Held Normally
+  (An LRU In An OrderedDict), So Hot Objects Survive Between Requests
+- onEvict(key) Runs Via weakref.finalize When A Cached Object Is Really Collected
+Note: int, str, bytes And tuple Cannot Be Weakly Referenced; Cache Instances Of
+Your Own Classes (Or frozenset) Instead.
+""")
+
+import threading
+from collections import OrderedDict
+
+class IdentityCache:
+    def __init__(self, strongSize=128, onEvict=None):
+        self.strongSize = strongSize
+        self.onEvict = onEvict
+        self.weak = weakref.WeakValueDictionary()
+        self.strong = OrderedDict()
+        # Re-Entrant: A Collection Triggered Inside A Method Can Run collected() On This Thread
+        self.lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "demoted": 0, "collected": 0}
+
+    def touch(self, key, obj):
+        """Mark As Most Recently Used In The Strong Tier"""
+        self.strong[key] = obj
+        self.strong.move_to_end(key)
+        if len(self.strong) > self.strongSize:
+            self.strong.popitem(last=False)  # Now Only Weakly Held
+            self.stats["demoted"] += 1
+
+    def get(self, key, default=None):
+        with self.lock:
+            obj = self.weak.get(key)
+            if obj is None:
+                self.stats["misses"] += 1
+                return default
+            self.stats["hits"] += 1
+            self.touch(key, obj)
+            return obj
+
+    def put(self, key, obj):
+        """Store obj Unless key Is Already Live; Returns The Shared Instance"""
+        with self.lock:
+            existing = self.weak.get(key)
+            if existing is not None:
+                self.touch(key, existing)
+                return existing
+            self.weak[key] = obj
+            weakref.finalize(obj, self.collected, key)
+            self.touch(key, obj)
+            return obj
+
+    def getOrCreate(self, key, factory):
+        obj = self.get(key)
+        if obj is None:
+            # Build Outside The Lock; If Two Threads Race, put() Keeps The First
+            obj = self.put(key, factory())
+        return obj
+
+    def collected(self, key):
+        with self.lock:
+            self.stats["collected"] += 1
+        if self.onEvict is not None:
+            self.onEvict(key)
+
+    def __len__(self):
+        return len(self.weak)
+
+    def __contains__(self, key):
+        return key in self.weak
+
+class ParsedConfig:
+    """Stands In For A Large Immutable Object Built Per Request"""
+    def __init__(self, name):
+        self.name = name
+        self.settings = {f"option{n}": n for n in range(1000)}
+
+configCache = IdentityCache(strongSize=2, onEvict=lambda key: print(f"  Collected: {key}"))
+
+def handleRequest(configName):
+    return configCache.getOrCreate(configName, lambda: ParsedConfig(configName))
+
+first = handleRequest("billing")
+second = handleRequest("billing")
+print(f"Two Requests, One Object: {first is second}")
+del first, second
+
+for name in ["search", "reports", "admin"]:  # Pushes "billing" Out Of The Strong Tier
+    handleRequest(name)
+gc.collect()
+print(f"Live Entries: {sorted(configCache.weak.keys())}, Stats: {configCache.stats}")
+
+held = handleRequest("admin")   # Hot: Still In The Strong Tier
+print(f"'admin' Still Cached: {'admin' in configCache}, 'billing' Cached: {'billing' in configCache}")
+
 
 # ========================================
 # 17. ASYNCIO (ASYNCHRONOUS PROGRAMMING)